@@ -5,77 +5,55 @@ Converts plain text like 'AB-001' to '[AB-001](relative/path/to/AB-001/AB-001-Na
 """
 
 import os
-import re
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import OrderedDict
 
+from doc_tools.corpus import Corpus
+from doc_tools.link_index import LinkIndex, relative_path
+from doc_tools.spans import sub_prose
+
 # Paths
 REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
 ABB_ROOT = REPO_ROOT / "03-building-blocks" / "architecture-building-blocks" / "abbs"
 
-def build_abb_lookup():
-    """Build a lookup of ABB ID to file info."""
-    lookup = {}
-
-    for abb_folder in ABB_ROOT.iterdir():
-        if not abb_folder.is_dir() or not abb_folder.name.startswith('AB-'):
-            continue
+# File patterns to process
+FILE_PATTERNS = [
+    '03-building-blocks/**/*.md',
+    '01-motivation/**/*.md',
+    '05-governance/**/*.md',
+    '02-capabilities/**/*.md',
+]
 
-        abb_id = abb_folder.name
-        md_files = list(abb_folder.glob('AB-*.md'))
-
-        if md_files:
-            md_file = md_files[0]
-            # Extract name from filename: AB-NNN-Name-vX.X.X.md
-            match = re.match(r'AB-\d+-(.+)-v\d+\.\d+\.\d+\.md', md_file.name)
-            name = match.group(1).replace('-', ' ') if match else abb_id
-
-            lookup[abb_id] = {
-                'folder': abb_folder.name,
-                'filename': md_file.name,
-                'name': name,
-                'full_path': md_file
-            }
+def build_abb_lookup():
+    """
+    Build a lookup of ABB ID to file info.
 
-    return lookup
+    Served from the persistent link index, which only re-reads ABB folders
+    that changed since the last run.
+    """
+    return LinkIndex(REPO_ROOT).refresh().lookup('AB')
 
 def get_relative_path(from_file, to_abb_id, abb_lookup):
     """Calculate the relative path from a file to an ABB document."""
     if to_abb_id not in abb_lookup:
         return None
 
-    abb_info = abb_lookup[to_abb_id]
-    to_path = abb_info['full_path']
-
-    try:
-        # Get the relative path from the source file's directory to the ABB file
-        from_dir = from_file.parent
-        rel_path = os.path.relpath(to_path, from_dir)
-        # Convert Windows backslashes to forward slashes for markdown
-        rel_path = rel_path.replace('\\', '/')
-        return rel_path
-    except ValueError:
-        # Different drives on Windows
-        return None
+    # Memoised per (source dir, target) pair; None across Windows drives
+    return relative_path(str(from_file.parent), str(abb_lookup[to_abb_id]['full_path']))
 
-def process_file(file_path, abb_lookup, dry_run=False):
-    """Process a single file to add ABB hyperlinks."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        return False, 0, "Unicode decode error"
+def link_abb_ids(file_path, content, abb_lookup):
+    """
+    Convert plain ABB IDs in prose to relative links.
 
-    original_content = content
+    Returns:
+        Tuple of (new content, number of links added)
+    """
     replacements = 0
 
-    # Pattern to match ABB IDs that are NOT already in a markdown link
-    # We need to be careful not to match IDs that are already links
-    # Pattern: AB-NNN where NNN is 3 digits
-    # Avoid matching if preceded by [ or followed by ]( or if inside a link
-
-    # First, let's find all AB-NNN patterns and their contexts
+    # Pattern: AB-NNN where NNN is 3 digits, not part of a longer path or ID
+    # Existing links, inline code and code blocks are never searched (see sub_prose)
     pattern = r'(?<!\[)(?<!/)(AB-\d{3})(?!\]\()(?!\d)'
 
     def replace_with_link(match):
@@ -92,50 +70,74 @@ def process_file(file_path, abb_lookup, dry_run=False):
         replacements += 1
         return f'[{abb_id}]({rel_path})'
 
-    # Apply the replacement
-    content = re.sub(pattern, replace_with_link, content)
-
-    if content != original_content and not dry_run:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True, replacements, None
-
-    return content != original_content, replacements, None
-
-def process_all_files(abb_lookup, dry_run=False):
+    # Apply the replacement to prose only
+    content = sub_prose(pattern, replace_with_link, content)
+    return content, replacements
+
+# Per-process lookup used by pool workers (set by _init_worker)
+_worker_lookup = None
+
+def _init_worker(abb_lookup):
+    """Pool initializer: keep one copy of the lookup per worker."""
+    global _worker_lookup
+    _worker_lookup = abb_lookup
+
+def _link_in_worker(item):
+    """Link one (path, content) pair in a worker process."""
+    file_path, content = item
+    return link_abb_ids(file_path, content, _worker_lookup)
+
+def link_documents(docs, abb_lookup, jobs=1):
+    """
+    Run link_abb_ids over documents, fanning out to a process pool when jobs > 1.
+
+    Documents that could not be read are left alone. Results are applied
+    in document order, so the outcome is the same for any number of jobs.
+
+    Returns:
+        Dict of document rel_path -> number of links added
+    """
+    readable = [doc for doc in docs if doc.text is not None]
+    if jobs > 1 and len(readable) > 1:
+        chunksize = max(1, len(readable) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(abb_lookup,)) as pool:
+            linked = list(pool.map(_link_in_worker,
+                                   [(doc.path, doc.text) for doc in readable],
+                                   chunksize=chunksize))
+    else:
+        linked = [link_abb_ids(doc.path, doc.text, abb_lookup) for doc in readable]
+
+    counts = {}
+    for doc, (content, count) in zip(readable, linked):
+        doc.text = content
+        counts[doc.rel_path] = count
+    return counts
+
+def process_all_files(abb_lookup, dry_run=False, corpus=None, jobs=1):
     """Process all markdown files in the repository."""
     results = {
         'updated': [],
         'skipped': [],
         'errors': []
     }
-
-    # File patterns to process
-    patterns = [
-        '03-building-blocks/**/*.md',
-        '01-motivation/**/*.md',
-        '05-governance/**/*.md',
-        '02-capabilities/**/*.md',
-    ]
-
-    for pattern in patterns:
-        print(f"\nProcessing: {pattern}")
-        for file_path in REPO_ROOT.glob(pattern):
-            if not file_path.is_file():
-                continue
-
-            # Skip the file itself if it's an ABB file (to avoid self-references becoming links)
-            # Actually, we DO want to process ABB files for cross-references
-
-            updated, count, error = process_file(file_path, abb_lookup, dry_run)
-
-            if error:
-                results['errors'].append((str(file_path.relative_to(REPO_ROOT)), error))
-            elif updated:
-                results['updated'].append((str(file_path.relative_to(REPO_ROOT)), count))
-                print(f"  {'[DRY RUN] Would update' if dry_run else 'Updated'}: {file_path.name} ({count} links)")
-            else:
-                results['skipped'].append(str(file_path.relative_to(REPO_ROOT)))
+    corpus = corpus or Corpus(REPO_ROOT)
+
+    print(f"\nProcessing: {', '.join(FILE_PATTERNS)}")
+    # ABB files are processed too, for their cross-references
+    docs = corpus.select(*FILE_PATTERNS)
+    counts = link_documents(docs, abb_lookup, jobs)
+
+    # Report in walk order so output matches a serial run
+    for doc in docs:
+        if doc.error:
+            results['errors'].append((doc.rel_path, doc.error))
+        elif doc.save(dry_run):
+            count = counts[doc.rel_path]
+            results['updated'].append((doc.rel_path, count))
+            print(f"  {'[DRY RUN] Would update' if dry_run else 'Updated'}: {doc.path.name} ({count} links)")
+        else:
+            results['skipped'].append(doc.rel_path)
 
     return results
 
@@ -143,7 +145,10 @@ def main():
     import argparse
     parser = argparse.ArgumentParser(description='Add hyperlinks to ABB ID references')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be changed without making changes')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Worker processes for linking (0 = one per CPU, default: 1)')
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
     print("=" * 60)
     print("ABB Hyperlink Addition Script")
@@ -165,7 +170,7 @@ def main():
 
     # Process files
     print("\n2. Processing files...")
-    results = process_all_files(abb_lookup, args.dry_run)
+    results = process_all_files(abb_lookup, args.dry_run, jobs=jobs)
 
     # Summary
     print("\n" + "=" * 60)
@@ -5,10 +5,11 @@ Uses BIAN domain mapping to populate the Data Products section.
 """
 
 import os
-import re
 import csv
 from pathlib import Path
 
+from doc_tools.sections import parse
+
 # Configuration
 BASE_DIR = Path(r"d:\Work\BNZ\ai-platform-architecture")
 USE_CASES_DIR = BASE_DIR / "01-motivation" / "03-use-cases" / "use-cases"
@@ -165,8 +166,10 @@ def process_use_case_file(file_path, uc_id, bian_mapping):
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
+    tree = parse(content)
+
     # Check if Data Architecture section already exists
-    if '### 4. Data Architecture' in content or '### 4.2 Data Architecture' in content:
+    if tree.find('Data Architecture'):
         print(f"  Skipping {uc_id} - Data Architecture section already exists")
         return False
 
@@ -180,45 +183,20 @@ def process_use_case_file(file_path, uc_id, bian_mapping):
     # Generate the Data Architecture section
     data_arch_section = generate_data_architecture_section(uc_id, bian_data)
 
-    # Find where to insert (before "## 4. Architecture Patterns" or similar)
+    # Insert before "## N. Architecture Patterns"
     # Different documents have different section numbering
+    arch_section = tree.find('Architecture Patterns', level=2)
+    if not arch_section or not arch_section.number:
+        print(f"  Warning: Could not find insertion point for {uc_id}")
+        return False
 
-    # Pattern 1: ## 4. Architecture Patterns
-    pattern1 = r'(---\n\n)(## 4\. Architecture Patterns)'
-    # Pattern 2: ## 5. Architecture Patterns (if 4 exists)
-    pattern2 = r'(---\n\n)(## 5\. Architecture Patterns)'
-
-    if re.search(pattern1, content):
-        # Insert before ## 4. Architecture Patterns and renumber it to ## 5
-        new_content = re.sub(
-            pattern1,
-            r'\1' + data_arch_section + r'## 5. Architecture Patterns',
-            content
-        )
-        # Also renumber subsequent sections
-        new_content = renumber_sections(new_content, start_from=5)
-    elif re.search(pattern2, content):
-        # Insert before ## 5. Architecture Patterns
-        new_content = re.sub(
-            pattern2,
-            r'\1' + data_arch_section + r'\2',
-            content
-        )
-    else:
-        # Try to find any Architecture Patterns section
-        arch_pattern = r'(---\n\n)(## \d+\. Architecture Patterns)'
-        match = re.search(arch_pattern, content)
-        if match:
-            section_num = int(re.search(r'## (\d+)\.', match.group(2)).group(1))
-            new_content = re.sub(
-                arch_pattern,
-                r'\1' + data_arch_section + f'## {section_num + 1}. Architecture Patterns',
-                content
-            )
-            new_content = renumber_sections(new_content, start_from=section_num + 1)
-        else:
-            print(f"  Warning: Could not find insertion point for {uc_id}")
-            return False
+    edit = tree.edit()
+    edit.insert_before(arch_section, data_arch_section)
+    section_num = int(arch_section.number)
+    if section_num != 5:
+        # Architecture Patterns and the sections after it move down one
+        renumber_sections(tree, edit, start_from=section_num + 1)
+    new_content = edit.apply()
 
     # Write back
     with open(file_path, 'w', encoding='utf-8') as f:
@@ -228,8 +206,8 @@ def process_use_case_file(file_path, uc_id, bian_mapping):
     return True
 
 
-def renumber_sections(content, start_from):
-    """Renumber sections starting from a given number."""
+def renumber_sections(tree, edit, start_from):
+    """Renumber the top-level sections from Architecture Patterns onwards."""
     # This is a simplified renumbering - adjust as needed
     # For sections after Architecture Patterns
     section_map = {
@@ -241,13 +219,11 @@ def renumber_sections(content, start_from):
         'References': start_from + 5,
     }
 
-    for section_name, new_num in section_map.items():
-        # Match ## N. Section Name where N is any number
-        pattern = rf'## \d+\. {section_name}'
-        replacement = f'## {new_num}. {section_name}'
-        content = re.sub(pattern, replacement, content)
-
-    return content
+    for section in tree.select(lambda s: s.level == 2 and s.number):
+        for section_name, new_num in section_map.items():
+            if section.name.startswith(section_name):
+                edit.replace_heading(section, title=f"{new_num}. {section.name}")
+                break
 
 
 def main():
@@ -0,0 +1,34 @@
+"""
+Shared helpers for the adhoc documentation maintenance scripts.
+
+The scripts in this folder run standalone (python <script>.py), so the
+folder is on sys.path and they can import this package directly.
+
+Usage:
+    from doc_tools.corpus import Corpus
+    from doc_tools.link_index import LinkIndex
+    from doc_tools.replace import MultiReplacer
+
+    corpus = Corpus(REPO_ROOT)
+    for doc in corpus.select('01-motivation/**/*.md', '03-building-blocks/**/*.md'):
+        doc.text = doc.text.replace(...)
+    corpus.save()
+
+    index = LinkIndex(REPO_ROOT).refresh()
+    target = index.link(doc.path, 'AB-001')
+
+    replacer = MultiReplacer({'ABB-AGT-001': 'AB-001', ...})
+    content, counts = replacer.replace(content)
+"""
+
+__version__ = "1.0.0"
+__all__ = [
+    "consistency",
+    "corpus",
+    "drawio",
+    "link_index",
+    "replace",
+    "sections",
+    "spans",
+    "writer",
+]
@@ -0,0 +1,507 @@
+"""
+Consistency Engine
+Reference graph of use cases, ABBs, patterns and capabilities, kept up to date incrementally.
+
+Each consistency script used to scan the repository its own way: one read
+24 hardcoded use case paths, one listed every use case folder, one
+regex-scanned the heatmap diagram and re-read ABB documents per check.
+ConsistencyEngine walks the use case, ABB and pattern folders once, pulls
+the facts the checks need out of every markdown, CSV and drawio file, and
+builds one graph of references between IDs. Extraction results are cached
+on disk per file and keyed by a hash of the file's content (an mtime/size
+stamp saves re-hashing untouched files), so a run only re-reads the files
+that changed. The checks are queries against the graph.
+"""
+
+import csv
+import hashlib
+import html
+import io
+import json
+import os
+import re
+import zlib
+from collections import defaultdict
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Union
+from xml.etree.ElementTree import ParseError
+
+from .drawio import iter_cells
+from .link_index import ID_FOLDERS, ID_PATTERN, VERSIONED_NAME
+
+# Catalogs outside the ID folders (or alongside them) -> extractor name
+CATALOGS = {
+    f"{ID_FOLDERS['AB']}/abbs.csv": 'abb_catalog',
+    f"{ID_FOLDERS['PT']}/patterns.csv": 'pattern_catalog',
+    '03-building-blocks/architecture-building-blocks/abb-descriptions-enhanced.csv': 'abb_descriptions',
+    '03-building-blocks/architecture-building-blocks/abb-usage-heatmap.drawio': 'drawio',
+    '01-motivation/03-use-cases/model/master/capability-mapping.csv': 'capability_mapping',
+}
+
+# Files inside ID folders are extracted by suffix; others are only listed
+DOCUMENT_EXTRACTORS = {'.md': 'markdown', '.drawio': 'drawio'}
+
+HEATMAP_PATH = '03-building-blocks/architecture-building-blocks/abb-usage-heatmap.drawio'
+ENHANCED_DESCRIPTIONS_PATH = '03-building-blocks/architecture-building-blocks/abb-descriptions-enhanced.csv'
+
+REF_PATTERN = re.compile(r'(?<![A-Za-z])(?:AB|UC|PT)-\d{3}(?!\d)')
+TITLE = re.compile(r'^# (.+)$', re.MULTILINE)
+HEATMAP_LABEL = re.compile(r'<b>(AB-\d+)\s+(.+?)\s+\(\d+/\d+\)</b>')
+LABEL_DESCRIPTION = re.compile(r'<span[^>]*>([^<]+)</span>')
+
+# Bump when an extractor's output changes so old cache entries are discarded
+CACHE_VERSION = 2
+
+
+class Edge(NamedTuple):
+    source: str
+    target: str
+    relation: str  # 'mentions' (document text), 'diagram' (drawio label) or 'catalog' (CSV row)
+    origin: str    # Root-relative file the edge was read from
+
+
+# =============================================================================
+# Extractors: bytes -> JSON-serialisable facts
+# =============================================================================
+
+def _text(data: bytes, newline: Optional[str] = None) -> str:
+    """Decode as open(..., encoding='utf-8') would (universal newlines by default)."""
+    return io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', newline=newline).read()
+
+
+def _split_ids(value: str) -> List[str]:
+    value = value.strip('"')
+    return value.split(';') if value else []
+
+
+def extract_markdown(data: bytes) -> dict:
+    text = _text(data)
+    title = TITLE.search(text)
+    return {
+        'refs': sorted(set(REF_PATTERN.findall(text))),
+        'title': title.group(1).strip() if title else None,
+        'headings': [line.rstrip() for line in text.splitlines() if line.startswith('#')],
+        'length': len(text),
+    }
+
+
+def extract_drawio(data: bytes) -> dict:
+    """IDs mentioned in cell labels (any page, compressed or plain), plus heatmap-style ABB labels."""
+    refs = set()
+    labels = {}
+    for cell in iter_cells(io.BytesIO(data)):
+        if not cell.value:
+            continue
+        refs.update(REF_PATTERN.findall(html.unescape(cell.value)))
+        # <b>AB-050 Large Language Model Service (24/24)</b><br><span ...>Description</span>
+        header = HEATMAP_LABEL.search(cell.value)
+        if header:
+            description = LABEL_DESCRIPTION.search(cell.value)
+            labels[header.group(1)] = {
+                'cell': cell.id,
+                'name': header.group(2),
+                'description': description.group(1) if description else '',
+            }
+    return {'refs': sorted(refs), 'labels': labels}
+
+
+def extract_abb_catalog(data: bytes) -> dict:
+    rows = {}
+    for row in csv.DictReader(io.StringIO(_text(data, newline=''))):
+        abb_id = row['ABB ID'].strip('"')
+        rows[abb_id] = {
+            'name': row['ABB Name'],
+            'use_case_count': int(row['Use Case Count']),
+            'use_cases': _split_ids(row['Use Cases']),
+            'patterns': _split_ids(row.get('Patterns', '')),
+            'l0_capabilities': _split_ids(row.get('L0 Capabilities', '')),
+            'l1_capabilities': _split_ids(row.get('L1 Capabilities', '')),
+        }
+    return {'rows': rows}
+
+
+def extract_pattern_catalog(data: bytes) -> dict:
+    rows = {}
+    for row in csv.DictReader(io.StringIO(_text(data, newline=''))):
+        rows[row['ID']] = {'name': row['Pattern_Name'], 'use_cases': _split_ids(row['Use_Cases'])}
+    return {'rows': rows}
+
+
+def extract_abb_descriptions(data: bytes) -> dict:
+    rows = {}
+    for row in csv.DictReader(io.StringIO(_text(data, newline=''))):
+        rows[row['abb_id']] = {'name': row['name'], 'description': row['description']}
+    return {'rows': rows}
+
+
+def extract_capability_mapping(data: bytes) -> dict:
+    rows = defaultdict(list)
+    for row in csv.DictReader(io.StringIO(_text(data, newline=''))):
+        rows[row['use_case_id']].append({
+            'id': row['capability_id'],
+            'name': row['l2_capability'],
+            'l0': row['l0_capability'],
+            'l1': row['l1_capability'],
+        })
+    return {'rows': dict(rows)}
+
+
+EXTRACTORS: Dict[str, Callable[[bytes], dict]] = {
+    'markdown': extract_markdown,
+    'drawio': extract_drawio,
+    'abb_catalog': extract_abb_catalog,
+    'pattern_catalog': extract_pattern_catalog,
+    'abb_descriptions': extract_abb_descriptions,
+    'capability_mapping': extract_capability_mapping,
+}
+
+
+def _stamp(stat: os.stat_result) -> List[int]:
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _owner(rel_path: str) -> Optional[str]:
+    """ID whose folder holds a file ('UC-001' for '.../use-cases/UC-001/x.md')."""
+    folder, _, _ = rel_path.rpartition('/')
+    parent, _, ref_id = folder.rpartition('/')
+    if ID_PATTERN.match(ref_id) and ID_FOLDERS.get(ref_id[:2]) == parent:
+        return ref_id
+    return None
+
+
+# =============================================================================
+# Engine
+# =============================================================================
+
+class ConsistencyEngine:
+    """
+    Reference graph over the use case, ABB and pattern folders and their catalogs.
+
+    Nodes are IDs (UC-NNN, AB-NNN, PT-NNN and capability IDs); edges say
+    where one ID references another: in a document's text, in a diagram
+    label or in a catalog row. Every edge records the file it came from, so
+    checks can compare what the catalogs declare with what the documents say.
+
+    Usage:
+        engine = ConsistencyEngine(REPO_ROOT).refresh()
+        declared = engine.references('AB', 'UC', relation='catalog')
+        mentioned = engine.references('UC', 'AB', relation='mentions')
+        for issue in engine.catalog_discrepancies():
+            ...
+    """
+
+    def __init__(self, repo_root: Union[str, Path], cache_path: Optional[Path] = None):
+        self.repo_root = Path(repo_root)
+        if cache_path is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+            root_key = hashlib.sha256(str(self.repo_root.resolve()).encode('utf-8')).hexdigest()[:16]
+            cache_path = Path(cache_home) / "bnz-doc-tools" / f"consistency-{root_key}.json"
+        self.cache_path = cache_path
+        self.files: Dict[str, dict] = {}        # rel path -> cache entry (stamp, sha256, extractor, facts)
+        self.folders: Dict[str, Dict[str, List[int]]] = {}  # ID -> {file name: stamp} of its folder
+        self.nodes: Dict[str, dict] = {}
+        self.edges: List[Edge] = []
+        self.stats = {'reused': 0, 'extracted': 0, 'removed': 0}
+
+    # -------------------------------------------------------------------------
+    # Cache
+    # -------------------------------------------------------------------------
+
+    def _load_cache(self) -> dict:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != CACHE_VERSION or data.get('root') != str(self.repo_root):
+            return {}
+        return data.get('files', {})
+
+    def _save_cache(self):
+        """Write the cache; failures to write it are ignored."""
+        data = {'version': CACHE_VERSION, 'root': str(self.repo_root), 'files': self.files}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, sort_keys=True)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    def _listing(self) -> Dict[str, str]:
+        """
+        Files to extract (rel path -> extractor name). Each ID folder is
+        listed exactly once; self.folders keeps the full listings.
+        """
+        listing = {}
+        self.folders = {}
+        for kind, folder_path in ID_FOLDERS.items():
+            root = self.repo_root / folder_path
+            if not root.is_dir():
+                continue
+            for folder in sorted(os.scandir(root), key=lambda e: e.name):
+                ref_id = folder.name
+                if not ID_PATTERN.match(ref_id) or not ref_id.startswith(kind) or not folder.is_dir():
+                    continue
+                entries = sorted((e for e in os.scandir(folder.path) if e.is_file()), key=lambda e: e.name)
+                self.folders[ref_id] = {e.name: _stamp(e.stat()) for e in entries}
+                for name in self.folders[ref_id]:
+                    extractor = DOCUMENT_EXTRACTORS.get(os.path.splitext(name)[1])
+                    if extractor:
+                        listing[f"{folder_path}/{ref_id}/{name}"] = extractor
+        for rel, extractor in CATALOGS.items():
+            if (self.repo_root / rel).is_file():
+                listing[rel] = extractor
+        return listing
+
+    def _extract(self, rel: str, extractor: str, cached: dict) -> dict:
+        path = self.repo_root / rel
+        stat = path.stat()
+        entry = cached.get(rel)
+        if entry and entry['extractor'] == extractor and entry['stamp'] == _stamp(stat):
+            self.stats['reused'] += 1
+            return entry
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if entry and entry['extractor'] == extractor and entry['sha256'] == digest:
+            # Touched but not changed
+            self.stats['reused'] += 1
+            return dict(entry, stamp=_stamp(stat))
+
+        try:
+            facts = EXTRACTORS[extractor](data)
+        except (UnicodeDecodeError, csv.Error, KeyError, ValueError, ParseError, zlib.error) as e:
+            facts = {'error': f"{type(e).__name__}: {e}"}
+        self.stats['extracted'] += 1
+        return {'stamp': _stamp(stat), 'sha256': digest, 'extractor': extractor, 'facts': facts}
+
+    def refresh(self, save: bool = True) -> 'ConsistencyEngine':
+        """
+        Bring the graph up to date with the repository.
+
+        Args:
+            save: Write the extraction cache back if anything changed
+
+        Returns:
+            self, for chaining
+        """
+        cached = self._load_cache()
+        self.stats = {'reused': 0, 'extracted': 0, 'removed': 0}
+        files = {}
+        for rel, extractor in self._listing().items():
+            try:
+                files[rel] = self._extract(rel, extractor, cached)
+            except OSError:
+                continue
+        self.stats['removed'] = len(set(cached) - set(files))
+        changed = files != cached
+        self.files = files
+        self._build_graph()
+        if save and changed:
+            self._save_cache()
+        return self
+
+    def _node(self, node_id: str) -> dict:
+        node = self.nodes.get(node_id)
+        if node is None:
+            kind = node_id.split('-', 1)[0] if ID_PATTERN.match(node_id) else 'CAP'
+            node = {'kind': kind, 'name': None, 'title': None, 'document': None, 'folder': None}
+            self.nodes[node_id] = node
+        return node
+
+    def _build_graph(self):
+        self.nodes = {}
+        self.edges = []
+
+        for ref_id in self.folders:
+            node = self._node(ref_id)
+            node['folder'] = f"{ID_FOLDERS[node['kind']]}/{ref_id}"
+            node['document'] = self.canonical_document(ref_id)
+            if node['document']:
+                match = VERSIONED_NAME.match(node['document'].rsplit('/', 1)[1])
+                title = self.facts(node['document']).get('title')
+                node['name'] = match.group(1).replace('-', ' ') if match else title
+                node['title'] = title
+
+        for rel, entry in self.files.items():
+            facts = entry['facts']
+            extractor = entry['extractor']
+            if extractor in ('markdown', 'drawio'):
+                owner = _owner(rel)
+                relation = 'mentions' if extractor == 'markdown' else 'diagram'
+                for ref in facts.get('refs', []):
+                    if owner and ref != owner:
+                        self.edges.append(Edge(owner, ref, relation, rel))
+            elif extractor == 'abb_catalog':
+                for abb_id, row in facts.get('rows', {}).items():
+                    self._node(abb_id).setdefault('catalog', row)
+                    for target in row['use_cases'] + row['patterns']:
+                        self.edges.append(Edge(abb_id, target, 'catalog', rel))
+            elif extractor == 'pattern_catalog':
+                for pattern_id, row in facts.get('rows', {}).items():
+                    self._node(pattern_id).setdefault('catalog', row)
+                    for target in row['use_cases']:
+                        self.edges.append(Edge(pattern_id, target, 'catalog', rel))
+            elif extractor == 'capability_mapping':
+                for uc_id, capabilities in facts.get('rows', {}).items():
+                    for capability in capabilities:
+                        node = self._node(capability['id'])
+                        node['name'] = capability['name']
+                        self.edges.append(Edge(uc_id, capability['id'], 'catalog', rel))
+
+        for edge in self.edges:
+            self._node(edge.source)
+            self._node(edge.target)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def facts(self, rel_path: str) -> dict:
+        """Extracted facts of one file ({} if unknown or not extracted)."""
+        entry = self.files.get(rel_path)
+        return entry['facts'] if entry else {}
+
+    def errors(self) -> Dict[str, str]:
+        """Files that could not be extracted (rel path -> reason), e.g. malformed drawio XML."""
+        return {rel: entry['facts']['error'] for rel, entry in sorted(self.files.items())
+                if 'error' in entry['facts']}
+
+    def folder_files(self, ref_id: str, pattern: str = '*') -> List[str]:
+        """Names of the files directly in an ID folder matching a glob, sorted."""
+        return [name for name in self.folders.get(ref_id, []) if fnmatchcase(name, pattern)]
+
+    def folder_fingerprint(self, ref_id: str) -> Optional[str]:
+        """
+        Hash of an ID folder's contents: content hashes of extracted files,
+        mtime/size of the rest. None if the folder does not exist.
+        """
+        stamps = self.folders.get(ref_id)
+        if stamps is None:
+            return None
+        folder = f"{ID_FOLDERS[ref_id[:2]]}/{ref_id}"
+        parts = []
+        for name, stamp in stamps.items():
+            entry = self.files.get(f"{folder}/{name}")
+            parts.append([name, entry['sha256'] if entry else stamp])
+        return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()
+
+    def canonical_document(self, ref_id: str) -> Optional[str]:
+        """Root-relative path of an ID's main document (as link_index.canonical_document)."""
+        kind = ref_id.split('-', 1)[0]
+        folder = f"{ID_FOLDERS[kind]}/{ref_id}"
+        names = self.folder_files(ref_id, f'{ref_id}-*.md') or self.folder_files(ref_id, 'index.md')
+        return f"{folder}/{names[0]}" if names else None
+
+    def ids(self, kind: str) -> List[str]:
+        """IDs of one kind that have a folder, sorted."""
+        return sorted(ref_id for ref_id in self.folders if ref_id.startswith(kind + '-'))
+
+    def references(self, source_kind: str, target_kind: str, relation: Optional[str] = None,
+                   origin: Optional[Callable[[str], bool]] = None) -> Dict[str, Set[str]]:
+        """
+        Source ID -> IDs it references.
+
+        Args:
+            source_kind, target_kind: ID prefixes ('UC', 'AB', 'PT', 'CAP')
+            relation: Only edges of this relation ('mentions', 'diagram', 'catalog')
+            origin: Only edges read from files for which origin(rel_path) is true
+        """
+        result = defaultdict(set)
+        for edge in self.edges:
+            if relation is not None and edge.relation != relation:
+                continue
+            if self.nodes[edge.source]['kind'] != source_kind or self.nodes[edge.target]['kind'] != target_kind:
+                continue
+            if origin is not None and not origin(edge.origin):
+                continue
+            result[edge.source].add(edge.target)
+        return dict(result)
+
+    def referenced_by(self, source_kind: str, target_kind: str, **filters) -> Dict[str, Set[str]]:
+        """Target ID -> source IDs referencing it (references() reversed)."""
+        result = defaultdict(set)
+        for source, targets in self.references(source_kind, target_kind, **filters).items():
+            for target in targets:
+                result[target].add(source)
+        return dict(result)
+
+    def is_canonical(self, rel_path: str) -> bool:
+        """True if a file is the main document of its ID folder."""
+        owner = _owner(rel_path)
+        return owner is not None and self.canonical_document(owner) == rel_path
+
+    # -------------------------------------------------------------------------
+    # Checks
+    # -------------------------------------------------------------------------
+
+    def catalog_abb_use_cases(self) -> Dict[str, dict]:
+        """ABB ID -> {'count', 'use_cases'} as declared in abbs.csv."""
+        return {abb_id: {'count': node['catalog']['use_case_count'],
+                         'use_cases': sorted(node['catalog']['use_cases'])}
+                for abb_id, node in sorted(self.nodes.items()) if 'catalog' in node and node['kind'] == 'AB'}
+
+    def catalog_discrepancies(self) -> List[dict]:
+        """
+        ABBs whose use cases in abbs.csv differ from the use case documents
+        that mention them (main use case documents only).
+
+        Returns:
+            Dicts with abb_id, csv_count, doc_count, csv_ucs, doc_ucs
+        """
+        csv_data = self.catalog_abb_use_cases()
+        documented = self.referenced_by('UC', 'AB', relation='mentions', origin=self.is_canonical)
+        discrepancies = []
+        for abb_id in sorted(set(csv_data) | set(documented)):
+            csv_info = csv_data.get(abb_id, {'count': 0, 'use_cases': []})
+            doc_ucs = sorted(documented.get(abb_id, []))
+            if csv_info['count'] != len(doc_ucs) or set(csv_info['use_cases']) != set(doc_ucs):
+                discrepancies.append({
+                    'abb_id': abb_id,
+                    'csv_count': csv_info['count'],
+                    'doc_count': len(doc_ucs),
+                    'csv_ucs': csv_info['use_cases'],
+                    'doc_ucs': doc_ucs,
+                })
+        return discrepancies
+
+    def name_mismatches(self, names: Dict[str, str]) -> List[tuple]:
+        """
+        Compare names from another source with each ABB's document title.
+
+        Args:
+            names: ABB ID -> name claimed elsewhere (diagram label, CSV row)
+
+        Returns:
+            (abb_id, 'ERROR', message, None) or (abb_id, 'MISMATCH', claimed, title)
+        """
+        issues = []
+        for abb_id in sorted(names):
+            node = self.nodes.get(abb_id)
+            if node is None or abb_id not in self.folders:
+                issues.append((abb_id, "ERROR", f"Directory not found: {ID_FOLDERS['AB']}/{abb_id}", None))
+            elif not node['document']:
+                issues.append((abb_id, "ERROR", f"No markdown file in {node['folder']}", None))
+            elif names[abb_id] != node['title']:
+                issues.append((abb_id, "MISMATCH", names[abb_id], node['title']))
+        return issues
+
+    def diagram_labels(self, rel_path: str = HEATMAP_PATH) -> Dict[str, dict]:
+        """ABB ID -> {'cell', 'name', 'description'} from a heatmap-style diagram."""
+        return self.facts(rel_path).get('labels', {})
+
+    def enhanced_descriptions(self) -> Dict[str, dict]:
+        """ABB ID -> {'name', 'description'} from abb-descriptions-enhanced.csv."""
+        return self.facts(ENHANCED_DESCRIPTIONS_PATH).get('rows', {})
+
+    def missing_sections(self, rel_path: str, sections: List[str]) -> List[str]:
+        """Heading lines (e.g. '## 1. Executive Summary') not found in a markdown document."""
+        headings = self.facts(rel_path).get('headings', [])
+        return [section for section in sections if not any(section in line for line in headings)]
@@ -0,0 +1,256 @@
+"""
+File Corpus
+Enumerate the repository once, read each file once and write it at most once.
+
+The maintenance scripts each used to walk the tree with their own globs and
+re-read every file. A Corpus walks the repository a single time, matches
+any number of (possibly overlapping) glob patterns against that listing,
+and hands out one Document per file. Transforms update Document.text in
+memory; Corpus.save() then writes only the files whose text changed.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# A transform takes (file path, text) and returns (new text, report).
+# The report is whatever the script wants to print (a count, a list of changes).
+Transform = Callable[[Path, str], Tuple[str, Any]]
+
+SKIP_DIRS = {'.git', '__pycache__', 'node_modules', '.venv', 'venv'}
+
+
+def glob_to_regex(pattern: str) -> 're.Pattern':
+    """
+    Compile a repository-relative glob into a regex over POSIX paths.
+
+    Supports the same syntax the scripts use with Path.glob:
+    '**/' (zero or more folders), '*' (within one folder), '?' and [...].
+    """
+    i, n = 0, len(pattern)
+    parts = []
+    while i < n:
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            parts.append('[^/]')
+            i += 1
+        elif pattern[i] == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                parts.append(re.escape(pattern[i]))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile(''.join(parts) + r'\Z')
+
+
+class Document:
+    """
+    One file of the corpus, read lazily and at most once.
+
+    text is None when the file could not be decoded; error then says why.
+    """
+
+    def __init__(self, path: Path, rel_path: str, encoding: str = 'utf-8'):
+        self.path = path
+        self.rel_path = rel_path
+        self.encoding = encoding
+        self.error = None
+        self._original = None
+        self._text = None
+        self._loaded = False
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, 'r', encoding=self.encoding) as f:
+                self._original = f.read()
+        except UnicodeDecodeError:
+            self.error = "Unicode decode error"
+        except OSError as e:
+            self.error = str(e)
+        self._text = self._original
+
+    @property
+    def original(self) -> Optional[str]:
+        """Text as it was on disk."""
+        self._load()
+        return self._original
+
+    @property
+    def text(self) -> Optional[str]:
+        """Current (possibly transformed) text."""
+        self._load()
+        return self._text
+
+    @text.setter
+    def text(self, value: str):
+        self._load()
+        self._text = value
+
+    @property
+    def changed(self) -> bool:
+        return self.text is not None and self._text != self._original
+
+    def apply(self, transform: Transform) -> Any:
+        """
+        Run a transform on the current text.
+
+        Args:
+            transform: Callable (path, text) -> (new text, report)
+
+        Returns:
+            The transform's report, or None if the file could not be read
+        """
+        if self.text is None:
+            return None
+        self._text, report = transform(self.path, self._text)
+        return report
+
+    def save(self, dry_run: bool = False, writer=None) -> bool:
+        """
+        Write the text back if it changed.
+
+        Args:
+            dry_run: Report the change without writing
+            writer: Optional doc_tools.writer.ChangeWriter to stage the write
+                through (atomic, recorded in its change manifest)
+
+        Returns:
+            True if the file changed (and was written unless dry_run)
+        """
+        if not self.changed:
+            return False
+        if not dry_run:
+            if writer is not None:
+                writer.write(self.path, self._text, encoding=self.encoding)
+            else:
+                with open(self.path, 'w', encoding=self.encoding) as f:
+                    f.write(self._text)
+            self._original = self._text
+        return True
+
+
+class Corpus:
+    """
+    The set of files under a root folder, listed once and shared by scripts.
+
+    Usage:
+        corpus = Corpus(REPO_ROOT)
+        for doc in corpus.select('01-motivation/**/*.md', '**/*.md'):
+            content, count = link_abb_ids(doc.path, doc.text, lookup)
+            doc.text = content
+        corpus.save()
+    """
+
+    def __init__(self, root: Union[str, Path], skip_dirs: Iterable[str] = SKIP_DIRS):
+        self.root = Path(root)
+        self.skip_dirs = set(skip_dirs)
+        self._files = None
+        self._documents: Dict[str, Document] = {}
+
+    @property
+    def files(self) -> List[str]:
+        """All file paths under root, relative and POSIX-style, walked once."""
+        if self._files is None:
+            files = []
+            for folder, dirs, names in os.walk(self.root):
+                dirs[:] = sorted(d for d in dirs if d not in self.skip_dirs)
+                rel_folder = os.path.relpath(folder, self.root).replace(os.sep, '/')
+                prefix = '' if rel_folder == '.' else rel_folder + '/'
+                files.extend(prefix + name for name in sorted(names))
+            self._files = files
+        return self._files
+
+    def document(self, rel_path: str) -> Document:
+        """Return the shared Document for a root-relative path."""
+        doc = self._documents.get(rel_path)
+        if doc is None:
+            doc = Document(self.root / rel_path, rel_path)
+            self._documents[rel_path] = doc
+        return doc
+
+    def select(self, *patterns: str) -> List[Document]:
+        """
+        Documents matching any of the glob patterns, each listed once.
+
+        Args:
+            patterns: Root-relative globs, e.g. '03-building-blocks/**/*.md'
+
+        Returns:
+            Documents in walk order; files matched by several patterns
+            appear only once
+        """
+        regexes = [glob_to_regex(p) for p in patterns]
+        return [self.document(rel) for rel in self.files
+                if any(r.match(rel) for r in regexes)]
+
+    def run(self, steps: Sequence[Tuple[str, Sequence[str], Transform]]
+            ) -> List[Tuple[Document, Dict[str, Any]]]:
+        """
+        Chain several transforms over the corpus in one sweep.
+
+        Each file is read once; every step whose patterns match it is applied
+        in order to the in-memory text. Nothing is written; call save().
+
+        Args:
+            steps: (name, glob patterns, transform) tuples
+
+        Returns:
+            (document, {step name: report}) for every file touched by a step,
+            in walk order. Reports are only included when truthy.
+        """
+        compiled = [(name, [glob_to_regex(p) for p in patterns], transform)
+                    for name, patterns, transform in steps]
+        results = []
+        for rel in self.files:
+            matching = [(name, transform) for name, regexes, transform in compiled
+                        if any(r.match(rel) for r in regexes)]
+            if not matching:
+                continue
+            doc = self.document(rel)
+            reports = {}
+            for name, transform in matching:
+                report = doc.apply(transform)
+                if report:
+                    reports[name] = report
+            results.append((doc, reports))
+        return results
+
+    def changed(self) -> List[Document]:
+        """Documents whose in-memory text differs from disk."""
+        return [doc for doc in self._documents.values() if doc.changed]
+
+    def save(self, dry_run: bool = False, writer=None) -> List[Document]:
+        """
+        Write every changed document once.
+
+        Args:
+            dry_run: Report the changes without writing
+            writer: Optional ChangeWriter to stage the writes through
+
+        Returns:
+            The documents that changed
+        """
+        changed = self.changed()
+        for doc in changed:
+            doc.save(dry_run, writer)
+        return changed
@@ -0,0 +1,296 @@
+"""
+Link Index
+Persistent map of ABB, UC and PT IDs to their canonical documents and anchors.
+
+Building the map means listing every building block, use case and pattern
+folder and reading each document for its headings. The result is cached on
+disk with a stamp per ID folder, so later runs only re-read folders that
+changed, and a run where nothing changed only stats the folders.
+"""
+
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+# ID prefix -> folder (relative to the repository root) holding one folder per ID
+ID_FOLDERS = {
+    'AB': '03-building-blocks/architecture-building-blocks/abbs',
+    'UC': '01-motivation/03-use-cases/use-cases',
+    'PT': '03-building-blocks/patterns',
+}
+
+ID_PATTERN = re.compile(r'^(AB|UC|PT)-\d{3}$')
+VERSIONED_NAME = re.compile(r'^[A-Z]{2}-\d+-(.+)-v\d+\.\d+\.\d+\.md$')
+HEADING = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+FENCE = re.compile(r'^\s*(```|~~~)')
+
+# Bump when the entry layout changes so old caches are discarded
+INDEX_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def relative_path(from_dir: str, to_path: str) -> Optional[str]:
+    """
+    Markdown-style relative path from a folder to a file, memoised per pair.
+
+    Returns:
+        Path with forward slashes, or None if there is no relative path
+        (different drives on Windows)
+    """
+    try:
+        return os.path.relpath(to_path, from_dir).replace('\\', '/')
+    except ValueError:
+        return None
+
+
+def heading_anchor(text: str) -> str:
+    """GitHub-style anchor slug for a heading."""
+    text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)  # Links -> link text
+    text = re.sub(r'[`*_~]', '', text.strip().lower())
+    text = re.sub(r'[^\w\- ]', '', text)
+    return text.replace(' ', '-')
+
+
+def extract_headings(content: str) -> List[tuple]:
+    """
+    Return (level, title, anchor) for each heading outside code fences.
+
+    Repeated anchors get -1, -2... suffixes as on GitHub.
+    """
+    headings = []
+    seen = {}
+    in_fence = False
+    for line in content.splitlines():
+        if FENCE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        match = HEADING.match(line)
+        if not match:
+            continue
+        title = match.group(2)
+        anchor = heading_anchor(title)
+        count = seen.get(anchor, 0)
+        seen[anchor] = count + 1
+        if count:
+            anchor = f"{anchor}-{count}"
+        headings.append((len(match.group(1)), title, anchor))
+    return headings
+
+
+def canonical_document(folder: Path, ref_id: str) -> Optional[Path]:
+    """
+    The main document of an ID folder.
+
+    Versioned '<ID>-<Name>-vX.Y.Z.md' files win over index.md; README.md is
+    never canonical.
+    """
+    candidates = sorted(p for p in folder.glob(f'{ref_id}-*.md') if p.is_file())
+    if candidates:
+        return candidates[0]
+    index = folder / 'index.md'
+    return index if index.is_file() else None
+
+
+def _stamp(path: Path) -> List[int]:
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class LinkIndex:
+    """
+    Cross-reference index of ABB (AB-NNN), use case (UC-NNN) and pattern
+    (PT-NNN) IDs.
+
+    Each entry records the canonical document, a display name and the
+    anchors of its headings. Entries are stamped with their folder and
+    document mtimes; refresh() re-reads only entries whose stamps changed
+    and drops IDs whose folders are gone.
+
+    Usage:
+        index = LinkIndex(REPO_ROOT).refresh()
+        link = index.link(source_file, 'AB-001')                # '../../AB-001/index.md'
+        link = index.link(source_file, 'UC-004', 'overview')    # '...#overview'
+    """
+
+    def __init__(self, repo_root: Union[str, Path], cache_path: Optional[Path] = None):
+        self.repo_root = Path(repo_root)
+        if cache_path is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+            root_key = hashlib.sha256(str(self.repo_root.resolve()).encode('utf-8')).hexdigest()[:16]
+            cache_path = Path(cache_home) / "bnz-doc-tools" / f"link-index-{root_key}.json"
+        self.cache_path = cache_path
+        self.entries: Dict[str, dict] = {}
+        self.stats = {'reused': 0, 'rebuilt': 0, 'removed': 0}
+
+    # -------------------------------------------------------------------------
+    # Cache
+    # -------------------------------------------------------------------------
+
+    def _load_cache(self) -> dict:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != INDEX_VERSION or data.get('root') != str(self.repo_root):
+            return {}
+        return data.get('entries', {})
+
+    def _save_cache(self):
+        """Write the index; failures to write the cache are ignored."""
+        data = {'version': INDEX_VERSION, 'root': str(self.repo_root), 'entries': self.entries}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    def _build_entry(self, ref_id: str, folder: Path, folder_stamp: List[int]) -> Optional[dict]:
+        document = canonical_document(folder, ref_id)
+        if document is None:
+            return None
+
+        try:
+            content = document.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            content = ''
+        headings = extract_headings(content)
+
+        match = VERSIONED_NAME.match(document.name)
+        if match:
+            name = match.group(1).replace('-', ' ')
+        else:
+            titles = [title for level, title, _ in headings if level == 1]
+            name = titles[0] if titles else ref_id
+
+        return {
+            'id': ref_id,
+            'folder': folder.relative_to(self.repo_root).as_posix(),
+            'file': document.relative_to(self.repo_root).as_posix(),
+            'name': name,
+            'anchors': [anchor for _, _, anchor in headings],
+            'stamp': folder_stamp + _stamp(document),
+        }
+
+    def refresh(self, save: bool = True) -> 'LinkIndex':
+        """
+        Bring the index up to date with the repository.
+
+        Args:
+            save: Write the index back to the cache if anything changed
+
+        Returns:
+            self, for chaining
+        """
+        cached = self._load_cache()
+        entries = {}
+        self.stats = {'reused': 0, 'rebuilt': 0, 'removed': 0}
+
+        for kind, folder_path in ID_FOLDERS.items():
+            root = self.repo_root / folder_path
+            if not root.is_dir():
+                continue
+            for folder in sorted(root.iterdir()):
+                ref_id = folder.name
+                if not ID_PATTERN.match(ref_id) or not ref_id.startswith(kind) or not folder.is_dir():
+                    continue
+
+                folder_stamp = _stamp(folder)
+                entry = cached.get(ref_id)
+                if entry and entry['stamp'][:2] == folder_stamp:
+                    # Folder listing unchanged; check the document itself
+                    document = self.repo_root / entry['file']
+                    try:
+                        current = folder_stamp + _stamp(document)
+                    except OSError:
+                        current = None
+                    if current == entry['stamp']:
+                        entries[ref_id] = entry
+                        self.stats['reused'] += 1
+                        continue
+
+                entry = self._build_entry(ref_id, folder, folder_stamp)
+                if entry:
+                    entries[ref_id] = entry
+                    self.stats['rebuilt'] += 1
+
+        self.stats['removed'] = len(set(cached) - set(entries))
+        self.entries = entries
+        if save and (self.stats['rebuilt'] or self.stats['removed'] or not cached):
+            self._save_cache()
+        return self
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def __contains__(self, ref_id: str) -> bool:
+        return ref_id in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, ref_id: str) -> Optional[dict]:
+        """Index entry for an ID, or None."""
+        return self.entries.get(ref_id)
+
+    def ids(self, kind: str) -> List[str]:
+        """All indexed IDs with the given prefix ('AB', 'UC' or 'PT'), sorted."""
+        return sorted(ref_id for ref_id in self.entries if ref_id.startswith(kind + '-'))
+
+    def path(self, ref_id: str) -> Optional[Path]:
+        """Absolute path of the canonical document for an ID."""
+        entry = self.entries.get(ref_id)
+        return self.repo_root / entry['file'] if entry else None
+
+    def link(self, from_file: Union[str, Path], ref_id: str, anchor: Optional[str] = None) -> Optional[str]:
+        """
+        Relative markdown link target from a file to an ID's document.
+
+        Args:
+            from_file: File the link will be written in
+            ref_id: Target ID, e.g. 'AB-001'
+            anchor: Optional heading anchor; ignored if the document has no such heading
+
+        Returns:
+            Link target, or None if the ID is unknown
+        """
+        entry = self.entries.get(ref_id)
+        if entry is None:
+            return None
+        target = relative_path(str(Path(from_file).parent), str(self.repo_root / entry['file']))
+        if target and anchor and anchor in entry['anchors']:
+            target = f"{target}#{anchor}"
+        return target
+
+    def lookup(self, kind: str) -> Dict[str, dict]:
+        """
+        Entries for one prefix in the dict layout the hyperlink scripts use.
+
+        Returns:
+            Dict of ID -> {'folder', 'filename', 'name', 'full_path'}
+        """
+        lookup = {}
+        for ref_id in self.ids(kind):
+            entry = self.entries[ref_id]
+            full_path = self.repo_root / entry['file']
+            lookup[ref_id] = {
+                'folder': ref_id,
+                'filename': full_path.name,
+                'name': entry['name'],
+                'full_path': full_path,
+            }
+        return lookup
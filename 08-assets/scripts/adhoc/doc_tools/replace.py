@@ -0,0 +1,59 @@
+"""
+Multi-pattern Replacement
+Apply a whole old -> new mapping table to a text in a single pass.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, Tuple, Union
+
+
+class MultiReplacer:
+    """
+    Replaces every key of a mapping with its value in one scan of the text.
+    
+    All terms are compiled into one alternation regex, longest term first,
+    so at any position the longest matching term wins (e.g. "Azure Monitor
+    Alerts" before "Azure Monitor"). Replaced text is never rescanned, so
+    one replacement cannot feed into another.
+    """
+    
+    def __init__(self, mapping: Union[Dict[str, str], Iterable[Tuple[str, str]]]):
+        """
+        Args:
+            mapping: Dict or (old, new) pairs. If a term appears more than
+                once, the first pair wins.
+        """
+        pairs = mapping.items() if isinstance(mapping, dict) else mapping
+        self.mapping = {}
+        for old, new in pairs:
+            if old and old not in self.mapping:
+                self.mapping[old] = new
+        
+        terms = sorted(self.mapping, key=len, reverse=True)
+        self.pattern = re.compile("|".join(map(re.escape, terms))) if terms else None
+    
+    def replace(self, text: str) -> Tuple[str, Counter]:
+        """
+        Replace all terms in text.
+        
+        Args:
+            text: Text to update
+            
+        Returns:
+            Tuple of (new text, Counter of replacements per old term)
+        """
+        counts = Counter()
+        if self.pattern is None:
+            return text, counts
+        
+        def substitute(match):
+            term = match.group(0)
+            counts[term] += 1
+            return self.mapping[term]
+        
+        return self.pattern.sub(substitute, text), counts
+    
+    def sub(self, text: str) -> str:
+        """Replace all terms in text, discarding the counts."""
+        return self.replace(text)[0]
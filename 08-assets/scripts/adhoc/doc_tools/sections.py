@@ -0,0 +1,358 @@
+"""
+Markdown Sections
+Parse a markdown document into a tree of heading sections, cached by content hash.
+
+The section-editing scripts each found their sections with multiline regexes
+over the whole file. parse() scans the text once, line by line, and returns
+a SectionTree with every heading's level, number, path and offsets, plus
+the tables inside each section. Trees are cached by a hash of the text, so
+several scripts (or several edits in one script) that look at the same
+content share one parse.
+
+Offsets are character offsets into the text the tree was parsed from.
+Edits never modify a tree; they return new text, which can be parsed again.
+"""
+
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+HEADING_LINE = re.compile(r'^(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$')
+FENCE_LINE = re.compile(r'^[ \t]{0,3}(```|~~~)')
+RULE_LINE = re.compile(r'^[ \t]{0,3}(?:-{3,}|\*{3,}|_{3,})[ \t]*$')
+NUMBERED_TITLE = re.compile(r'^(\d+(?:\.\d+)*)\.?[ \t]+(.*)$')
+TABLE_DIVIDER = re.compile(r'^[ \t]*\|?[ \t]*:?-{3,}:?[ \t]*(?:\|[ \t]*:?-{3,}:?[ \t]*)*\|?[ \t]*$')
+
+CACHE_SIZE = 256
+
+
+class Section:
+    """
+    One heading and everything under it, up to the next heading of the same
+    or a higher level.
+
+    Attributes:
+        level: Heading level (1-6); 0 for the document root
+        title: Heading text, e.g. '2.1 Core Capabilities'
+        number: Section number if the title starts with one ('2.1'), else None
+        name: Title without its number ('Core Capabilities')
+        start: Offset of the heading line
+        body_start: Offset just after the heading line
+        end: Offset where the section (including subsections) ends
+    """
+
+    __slots__ = ('level', 'title', 'number', 'name', 'start', 'body_start', 'end',
+                 'parent', 'children')
+
+    def __init__(self, level: int, title: str, start: int, body_start: int):
+        self.level = level
+        self.title = title
+        match = NUMBERED_TITLE.match(title)
+        self.number = match.group(1) if match else None
+        self.name = match.group(2) if match else title
+        self.start = start
+        self.body_start = body_start
+        self.end = None
+        self.parent = None
+        self.children: List['Section'] = []
+
+    @property
+    def path(self) -> Tuple[str, ...]:
+        """Titles from the top-level heading down to this one."""
+        titles = []
+        section = self
+        while section is not None and section.level > 0:
+            titles.append(section.title)
+            section = section.parent
+        return tuple(reversed(titles))
+
+    def __repr__(self) -> str:
+        return f"Section({'#' * self.level} {self.title!r}, {self.start}:{self.end})"
+
+
+class Table:
+    """
+    A pipe table inside a section.
+
+    Attributes:
+        start, end: Offsets of the first and just past the last table line
+        header: Header cells
+        rows: Data rows as lists of cells (stripped)
+        section: Innermost section containing the table
+    """
+
+    __slots__ = ('start', 'end', 'header', 'rows', 'section')
+
+    def __init__(self, start: int, end: int, header: List[str], rows: List[List[str]], section: Section):
+        self.start = start
+        self.end = end
+        self.header = header
+        self.rows = rows
+        self.section = section
+
+    def records(self) -> List[dict]:
+        """Rows as dicts keyed by header cell."""
+        return [dict(zip(self.header, row)) for row in self.rows]
+
+
+def split_row(line: str) -> List[str]:
+    """Cells of a pipe-table row, honouring escaped pipes."""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in re.split(r'(?<!\\)\|', line)]
+
+
+class SectionTree:
+    """
+    Heading structure of one markdown text.
+
+    Headings inside fenced code blocks are ignored. The root section
+    (level 0) spans the whole document; its children are the top-level
+    headings.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.root = Section(0, '', 0, 0)
+        self.root.end = len(text)
+        self.sections: List[Section] = []
+        self._table_lines: List[Tuple[int, int, str]] = []  # (start, end, line) outside fences
+        self._tables = None
+        self._parse()
+
+    def _parse(self):
+        stack = [self.root]
+        in_fence = False
+        offset = 0
+        for line in self.text.splitlines(keepends=True):
+            start = offset
+            offset += len(line)
+            stripped = line.rstrip('\r\n')
+
+            if FENCE_LINE.match(stripped):
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+
+            match = HEADING_LINE.match(stripped)
+            if match:
+                level = len(match.group(1))
+                while stack[-1].level >= level:
+                    stack.pop().end = start
+                section = Section(level, match.group(2), start, offset)
+                section.parent = stack[-1]
+                stack[-1].children.append(section)
+                stack.append(section)
+                self.sections.append(section)
+            elif stripped.lstrip().startswith('|'):
+                self._table_lines.append((start, offset, stripped))
+
+        for section in stack[1:]:
+            section.end = len(self.text)
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def find(self, key: str, level: Optional[int] = None, prefix: bool = False) -> Optional[Section]:
+        """
+        First section matching key.
+
+        Args:
+            key: Section number ('2.1'), full title ('2.1 Core Capabilities')
+                or title without number ('Core Capabilities')
+            level: Only match headings of this level
+            prefix: Also match names that start with key ('Success Metrics'
+                matches 'Success Metrics & KPIs')
+        """
+        for section in self.find_all(key, level, prefix):
+            return section
+        return None
+
+    def find_all(self, key: str, level: Optional[int] = None, prefix: bool = False) -> List[Section]:
+        """All sections matching key, in document order (see find)."""
+        matches = []
+        for section in self.sections:
+            if level is not None and section.level != level:
+                continue
+            if (key == section.number or key == section.title or key == section.name
+                    or (prefix and section.name.startswith(key))):
+                matches.append(section)
+        return matches
+
+    def select(self, predicate: Callable[[Section], bool]) -> List[Section]:
+        """Sections for which predicate(section) is true."""
+        return [section for section in self.sections if predicate(section)]
+
+    def heading_paths(self) -> List[Tuple[str, ...]]:
+        """Path of every heading, in document order."""
+        return [section.path for section in self.sections]
+
+    # -------------------------------------------------------------------------
+    # Content
+    # -------------------------------------------------------------------------
+
+    def content_end(self, section: Section) -> int:
+        """
+        End of a section's own content: before trailing blank lines and a
+        trailing '---' rule that separates it from the next section.
+        """
+        end = section.end
+        text = self.text
+        while end > section.body_start and text[end - 1] in ' \t\r\n':
+            end -= 1
+        line_start = text.rfind('\n', section.body_start, end) + 1
+        line_start = max(line_start, section.body_start)
+        if RULE_LINE.match(text[line_start:end]):
+            end = line_start
+            while end > section.body_start and text[end - 1] in ' \t\r\n':
+                end -= 1
+        return end
+
+    def body(self, section: Section) -> str:
+        """Text under a heading (including subsections), without the separator."""
+        return self.text[section.body_start:self.content_end(section)].strip('\r\n')
+
+    def tables(self, section: Optional[Section] = None) -> List[Table]:
+        """Pipe tables in the document, or only those within a section."""
+        if self._tables is None:
+            self._tables = self._parse_tables()
+        if section is None:
+            return list(self._tables)
+        return [t for t in self._tables if section.start <= t.start < section.end]
+
+    def _parse_tables(self) -> List[Table]:
+        tables = []
+        lines = self._table_lines
+        i = 0
+        while i < len(lines):
+            block = [lines[i]]
+            while i + len(block) < len(lines) and lines[i + len(block)][0] == block[-1][1]:
+                block.append(lines[i + len(block)])
+            i += len(block)
+            if len(block) < 2 or not TABLE_DIVIDER.match(block[1][2]):
+                continue
+            start, end = block[0][0], block[-1][1]
+            tables.append(Table(start, end, split_row(block[0][2]),
+                                [split_row(line) for _, _, line in block[2:]],
+                                self.section_at(start)))
+        return tables
+
+    def section_at(self, offset: int) -> Section:
+        """Innermost section containing an offset."""
+        current = self.root
+        for section in self.sections:
+            if section.start > offset:
+                break
+            if offset < section.end:
+                current = section
+        return current
+
+    # -------------------------------------------------------------------------
+    # Editing
+    # -------------------------------------------------------------------------
+
+    def edit(self) -> 'SectionEdit':
+        """Start a batch of edits against this tree."""
+        return SectionEdit(self)
+
+    def replace_body(self, section: Section, body: str) -> str:
+        """New text with one section's body replaced (see SectionEdit.replace_body)."""
+        return self.edit().replace_body(section, body).apply()
+
+
+class SectionEdit:
+    """
+    A batch of non-overlapping edits, all addressed by offsets in the
+    original tree and applied together.
+
+    Usage:
+        tree = parse(content)
+        edit = tree.edit()
+        edit.replace_body(tree.find('2.1'), new_table)
+        edit.replace_heading(tree.find('4', level=3), level=2)
+        content = edit.apply()
+    """
+
+    def __init__(self, tree: SectionTree):
+        self.tree = tree
+        self.changes: List[Tuple[int, int, str]] = []
+
+    def replace(self, start: int, end: int, text: str) -> 'SectionEdit':
+        """Replace text[start:end]."""
+        self.changes.append((start, end, text))
+        return self
+
+    def replace_body(self, section: Section, body: str) -> 'SectionEdit':
+        """
+        Replace everything under a heading, keeping the heading and any
+        '---' separator before the next section.
+
+        The body is written with one blank line after the heading and one
+        before whatever follows.
+        """
+        text = self.tree.text
+        content_end = self.tree.content_end(section)
+        tail = text[content_end:section.end]
+        if tail.strip():
+            new_tail = '\n\n' + tail.lstrip('\r\n')
+        elif section.end >= len(text):
+            new_tail = '\n'
+        else:
+            new_tail = '\n\n'
+        return self.replace(section.body_start, section.end, '\n' + body.strip('\n') + new_tail)
+
+    def replace_heading(self, section: Section, title: Optional[str] = None,
+                        level: Optional[int] = None) -> 'SectionEdit':
+        """Change a heading's title and/or level, keeping its line ending."""
+        line = self.tree.text[section.start:section.body_start]
+        ending = line[len(line.rstrip('\r\n')):]
+        new_line = f"{'#' * (level or section.level)} {title if title is not None else section.title}{ending}"
+        if new_line != line:
+            self.replace(section.start, section.body_start, new_line)
+        return self
+
+    def insert_before(self, section: Section, text: str) -> 'SectionEdit':
+        """Insert text immediately before a heading line."""
+        return self.replace(section.start, section.start, text)
+
+    def apply(self) -> str:
+        """Return the text with every edit applied."""
+        text = self.tree.text
+        pieces = []
+        position = len(text)
+        for start, end, replacement in sorted(self.changes, key=lambda c: (c[0], c[1]), reverse=True):
+            if end > position:
+                raise ValueError(f"Overlapping section edits at offset {start}")
+            pieces.append(text[end:position])
+            pieces.append(replacement)
+            position = start
+        pieces.append(text[:position])
+        return ''.join(reversed(pieces))
+
+
+_cache: 'OrderedDict[str, SectionTree]' = OrderedDict()
+
+
+def parse(text: str) -> SectionTree:
+    """
+    Section tree for a markdown text, cached by content hash.
+
+    Returns:
+        The cached tree if this exact text was parsed recently
+    """
+    key = hashlib.sha1(text.encode('utf-8')).hexdigest()
+    tree = _cache.get(key)
+    if tree is not None:
+        _cache.move_to_end(key)
+        return tree
+    tree = SectionTree(text)
+    _cache[key] = tree
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return tree
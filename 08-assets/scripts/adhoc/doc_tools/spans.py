@@ -0,0 +1,116 @@
+"""
+Markdown Spans
+Split markdown into prose, inline code, fenced code and existing links in one pass.
+
+Link injection must only touch prose: an ID inside a code fence, an inline
+code span, or an existing link (its text or its target) has to be left
+alone. Splitting on ``` with a regex got fences wrong (unclosed fences,
+~~~ fences, ``` inside inline code) and did nothing about existing links,
+so re-running a link script nested links inside link targets. tokenize()
+walks the text once, tracking fences line by line and scanning the lines
+between fences for inline code and links.
+"""
+
+import re
+from typing import Callable, List, NamedTuple, Union
+
+PROSE = 'prose'
+INLINE_CODE = 'inline_code'
+FENCED_CODE = 'fenced_code'
+LINK = 'link'
+
+FENCE_OPEN = re.compile(r'^[ ]{0,3}(`{3,}|~{3,})')
+
+# Inline constructs that are not prose. Inline code may span lines but not a
+# blank line; link targets may contain one level of parentheses.
+INLINE_TOKEN = re.compile(r'''
+    (?P<code>(?P<ticks>`+)(?:(?!\n[ \t]*\n).)+?(?<!`)(?P=ticks)(?!`))
+  | (?P<link>!?\[(?:[^\[\]\n]|\[[^\[\]\n]*\])*\]\((?:[^()\n]|\([^()\n]*\))*\))
+  | (?P<reflink>!?\[(?:[^\[\]\n]|\[[^\[\]\n]*\])*\]\[[^\[\]\n]*\])
+  | (?P<autolink><(?:https?|ftp|mailto):[^<>\s]*>)
+  | (?P<url>\bhttps?://[^\s<>()\[\]]+)
+  | (?P<refdef>^[ ]{0,3}\[[^\[\]\n]+\]:[^\n]*)
+''', re.VERBOSE | re.DOTALL | re.MULTILINE)
+
+
+class Span(NamedTuple):
+    kind: str
+    start: int
+    end: int
+
+
+def _fence_spans(text: str) -> List[Span]:
+    """Fenced code blocks (fence lines included), per CommonMark fence rules."""
+    spans = []
+    offset = 0
+    fence = None  # (char, length, start) of the open fence
+    for line in text.splitlines(keepends=True):
+        start = offset
+        offset += len(line)
+        if fence is None:
+            match = FENCE_OPEN.match(line)
+            if match:
+                marker = match.group(1)
+                # Backtick fences cannot have backticks in their info string
+                if marker[0] == '`' and '`' in line[match.end():]:
+                    continue
+                fence = (marker[0], len(marker), start)
+        else:
+            char, length, fence_start = fence
+            stripped = line.strip()
+            if (stripped and len(line) - len(line.lstrip(' ')) <= 3
+                    and set(stripped) == {char} and len(stripped) >= length):
+                spans.append(Span(FENCED_CODE, fence_start, offset))
+                fence = None
+    if fence is not None:
+        # An unclosed fence runs to the end of the document
+        spans.append(Span(FENCED_CODE, fence[2], len(text)))
+    return spans
+
+
+def tokenize(text: str) -> List[Span]:
+    """
+    Cover the text with contiguous spans of prose, inline code, fenced code
+    and links (inline, reference, autolinks, bare URLs, reference definitions).
+
+    Returns:
+        Spans in order; adjacent prose is merged
+    """
+    spans = []
+
+    def add(kind, start, end):
+        if start >= end:
+            return
+        if spans and spans[-1].kind == kind == PROSE and spans[-1].end == start:
+            spans[-1] = Span(PROSE, spans[-1].start, end)
+        else:
+            spans.append(Span(kind, start, end))
+
+    position = 0
+    for fence in _fence_spans(text) + [Span(FENCED_CODE, len(text), len(text))]:
+        for match in INLINE_TOKEN.finditer(text, position, fence.start):
+            add(PROSE, position, match.start())
+            add(INLINE_CODE if match.group('code') is not None else LINK,
+                match.start(), match.end())
+            position = match.end()
+        add(PROSE, position, fence.start)
+        add(FENCED_CODE, fence.start, fence.end)
+        position = fence.end
+    return spans
+
+
+def map_spans(text: str, func: Callable[[str], str], kind: str = PROSE) -> str:
+    """Apply func to the text of every span of one kind, leaving the rest as is."""
+    return ''.join(func(text[s.start:s.end]) if s.kind == kind else text[s.start:s.end]
+                   for s in tokenize(text))
+
+
+def sub_prose(pattern: Union[str, 're.Pattern'], repl, text: str, flags: int = 0) -> str:
+    """
+    re.sub restricted to prose.
+
+    Each prose span is substituted separately, so lookarounds do not see
+    across code or link boundaries.
+    """
+    regex = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+    return map_spans(text, lambda prose: regex.sub(repl, prose))
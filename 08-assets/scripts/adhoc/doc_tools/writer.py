@@ -0,0 +1,244 @@
+"""
+Change Writer
+Write files only when their content changes, atomically, and record what changed.
+
+Bulk rewrite scripts used to open(..., 'w') every file they visited, which
+touched mtimes even when the output was identical and set off re-exports and
+MkDocs rebuilds downstream. ChangeWriter compares a hash of the new content
+with what is on disk and skips identical files. Changed files are staged to
+temp files next to their targets and renamed into place on commit(), with
+one batch of fsyncs for the whole run. Every change is recorded in a JSON
+manifest that later steps can read instead of rescanning the tree.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+PathLike = Union[str, Path]
+
+# Default manifest file name, kept at the repository root (git-ignored)
+MANIFEST_NAME = '.doc-changes.json'
+
+# Entries kept in a manifest; the least recently changed paths are dropped first
+MANIFEST_MAX_ENTRIES = 5000
+
+# Process umask (only readable by setting it), applied to newly created files
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path: PathLike) -> Optional[str]:
+    """SHA-256 of a file's bytes, or None if it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return content_hash(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def read_manifest(path: PathLike) -> Dict[str, dict]:
+    """
+    Read a change manifest.
+
+    Returns:
+        Dict of root-relative path -> {'status', 'sha256', 'time', 'source'};
+        empty if the manifest does not exist
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('changes', {})
+    except (OSError, ValueError):
+        return {}
+
+
+class ChangeWriter:
+    """
+    Stages file writes, skipping identical content, and commits them atomically.
+
+    Writes are not visible on disk until commit(); use the writer as a
+    context manager so staged files are committed on success and discarded
+    if the script fails part-way.
+
+    Usage:
+        with ChangeWriter(REPO_ROOT, manifest=REPO_ROOT / MANIFEST_NAME) as writer:
+            for abb_file in abb_files:
+                if writer.write(abb_file, new_content):
+                    print(f"Updated {abb_file.name}")
+        print(writer.summary())
+    """
+
+    def __init__(self, root: Optional[PathLike] = None, manifest: Optional[PathLike] = None,
+                 source: Optional[str] = None, fsync: bool = True, dry_run: bool = False):
+        """
+        Args:
+            root: Paths in the manifest are recorded relative to this folder
+            manifest: JSON manifest to merge this run's changes into (optional)
+            source: Name recorded against each change (default: the script name)
+            fsync: Flush staged files and their folders to disk on commit
+            dry_run: Compare and record, but never touch the files
+        """
+        self.root = Path(root) if root else None
+        self.manifest = Path(manifest) if manifest else None
+        self.source = source or Path(sys.argv[0]).name
+        self.fsync = fsync
+        self.dry_run = dry_run
+        self.staged: Dict[Path, tuple] = {}  # target -> (temp path, status, sha256)
+        self.changes: List[dict] = []
+        self.unchanged = 0
+
+    def __enter__(self) -> 'ChangeWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+    def _relative(self, path: Path) -> str:
+        if self.root:
+            try:
+                return path.resolve().relative_to(self.root.resolve()).as_posix()
+            except ValueError:
+                pass
+        return path.as_posix()
+
+    def write(self, path: PathLike, content: Union[str, bytes], encoding: str = 'utf-8',
+              newline: Optional[str] = None) -> bool:
+        """
+        Stage content for path unless the file already holds exactly that.
+
+        Args:
+            path: Target file
+            content: New text (or bytes, written as-is)
+            encoding: Text encoding
+            newline: As for open(): None translates '\\n' to os.linesep,
+                '' or '\\n' writes newlines unchanged
+
+        Returns:
+            True if the file will change
+        """
+        path = Path(path)
+        if isinstance(content, str):
+            if newline is None and os.linesep != '\n':
+                content = content.replace('\n', os.linesep)
+            elif newline not in (None, '', '\n'):
+                content = content.replace('\n', newline)
+            data = content.encode(encoding)
+        else:
+            data = content
+
+        digest = content_hash(data)
+        previous = self.staged.pop(path, None)
+        if previous:
+            os.unlink(previous[0])
+
+        existing = file_hash(path)
+        if existing == digest:
+            self.unchanged += 1
+            return False
+
+        status = 'created' if existing is None else 'updated'
+        if self.dry_run:
+            self.changes.append({'path': self._relative(path), 'status': status, 'sha256': digest})
+            return True
+
+        fd, temp = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        self.staged[path] = (temp, status, digest)
+        return True
+
+    def commit(self) -> List[dict]:
+        """
+        Move every staged file into place and update the manifest.
+
+        Staged files are fsynced as one batch, renamed over their targets,
+        and each touched folder is fsynced once so the renames are durable.
+
+        Returns:
+            This run's changes
+        """
+        if self.fsync:
+            for temp, _, _ in self.staged.values():
+                fd = os.open(temp, os.O_RDWR)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+        folders = set()
+        for path, (temp, status, digest) in self.staged.items():
+            if path.exists():
+                # Keep the permissions of the file being replaced
+                os.chmod(temp, path.stat().st_mode & 0o7777)
+            else:
+                # mkstemp creates 0600; use what open() would have given
+                os.chmod(temp, 0o666 & ~_UMASK)
+            os.replace(temp, path)
+            folders.add(path.parent)
+            self.changes.append({'path': self._relative(path), 'status': status, 'sha256': digest})
+        self.staged.clear()
+
+        if self.fsync and hasattr(os, 'O_DIRECTORY'):
+            for folder in folders:
+                fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+        if self.manifest and self.changes and not self.dry_run:
+            self.save_manifest()
+        return self.changes
+
+    def discard(self):
+        """Drop all staged writes without touching their targets."""
+        for temp, _, _ in self.staged.values():
+            try:
+                os.unlink(temp)
+            except OSError:
+                pass
+        self.staged.clear()
+
+    def save_manifest(self):
+        """
+        Merge this run's changes into the manifest (latest change per path
+        wins), keeping the MANIFEST_MAX_ENTRIES most recent paths.
+        """
+        changes = read_manifest(self.manifest)
+        now = datetime.now().isoformat(timespec='seconds')
+        for change in self.changes:
+            changes[change['path']] = {
+                'status': change['status'],
+                'sha256': change['sha256'],
+                'time': now,
+                'source': self.source,
+            }
+        if len(changes) > MANIFEST_MAX_ENTRIES:
+            recent = sorted(changes, key=lambda path: changes[path].get('time', ''), reverse=True)
+            changes = {path: changes[path] for path in recent[:MANIFEST_MAX_ENTRIES]}
+        data = {'root': str(self.root) if self.root else None, 'changes': changes}
+
+        self.manifest.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.manifest.with_name(self.manifest.name + '.tmp')
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(temp, self.manifest)
+
+    def summary(self) -> str:
+        """One-line count of written and skipped files."""
+        verb = 'Would write' if self.dry_run else 'Wrote'
+        return f"{verb} {len(self.changes) + len(self.staged)} changed file(s), skipped {self.unchanged} unchanged"
@@ -5,13 +5,24 @@ Change ### 4. Data Architecture to ## 4. Data Architecture
 """
 
 import os
-import re
 from pathlib import Path
 
+from doc_tools.sections import parse
+
 # Configuration
 BASE_DIR = Path(r"d:\Work\BNZ\ai-platform-architecture")
 USE_CASES_DIR = BASE_DIR / "01-motivation" / "03-use-cases" / "use-cases"
 
+# Data Architecture subsections that belong at ### level
+DATA_ARCH_SUBSECTIONS = {
+    '4.1 BIAN Service Domain Alignment',
+    '4.2 Data Inputs',
+    '4.3 Data Transformations',
+    '4.4 Data Outputs',
+    '4.5 Data Quality Requirements',
+    '4.6 Data Governance',
+}
+
 
 def fix_data_arch_heading(file_path):
     """Fix Data Architecture heading level in a use case file."""
@@ -21,16 +32,18 @@ def fix_data_arch_heading(file_path):
 
     original = content
 
+    tree = parse(content)
+    edit = tree.edit()
+
     # Fix the main Data Architecture heading
-    content = re.sub(r'### 4\. Data Architecture', '## 4. Data Architecture', content)
+    for section in tree.find_all('4. Data Architecture', level=3):
+        edit.replace_heading(section, level=2)
 
     # Also fix the subheadings to be ### level (not ####)
-    content = re.sub(r'#### 4\.1 BIAN Service Domain Alignment', '### 4.1 BIAN Service Domain Alignment', content)
-    content = re.sub(r'#### 4\.2 Data Inputs', '### 4.2 Data Inputs', content)
-    content = re.sub(r'#### 4\.3 Data Transformations', '### 4.3 Data Transformations', content)
-    content = re.sub(r'#### 4\.4 Data Outputs', '### 4.4 Data Outputs', content)
-    content = re.sub(r'#### 4\.5 Data Quality Requirements', '### 4.5 Data Quality Requirements', content)
-    content = re.sub(r'#### 4\.6 Data Governance', '### 4.6 Data Governance', content)
+    for section in tree.select(lambda s: s.level == 4 and s.title in DATA_ARCH_SUBSECTIONS):
+        edit.replace_heading(section, level=3)
+
+    content = edit.apply()
 
     if content != original:
         with open(file_path, 'w', encoding='utf-8') as f:
@@ -2,49 +2,60 @@
 """
 Script to remove ABB hyperlinks from inside code blocks (text diagrams).
 Converts [AB-NNN](path) back to AB-NNN within code blocks only.
+
+The hyperlink scripts no longer link inside code blocks (see doc_tools.spans);
+this repairs documents linked by older versions of them.
 """
 
 import re
 from pathlib import Path
 
+from doc_tools.corpus import Corpus
+from doc_tools.spans import FENCED_CODE, map_spans
+
 # Paths
 REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
 PATTERNS_ROOT = REPO_ROOT / "03-building-blocks" / "patterns"
 
-def fix_links_in_code_blocks(file_path):
-    """Remove hyperlinks from code blocks in a file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        return False, 0, "Unicode decode error"
+# File patterns to process
+FILE_PATTERNS = [
+    '03-building-blocks/patterns/PT-*/PT-*.md',
+    '03-building-blocks/architecture-building-blocks/abbs/AB-*/AB-*.md',
+]
+
+def unlink_code_blocks(file_path, content):
+    """
+    Replace [AB-NNN](path) with AB-NNN inside code blocks.
 
-    original_content = content
+    Returns:
+        Tuple of (new content, number of links removed)
+    """
     fixes = 0
 
-    # Pattern to find code blocks
-    code_block_pattern = r'```[\s\S]*?```'
+    # Pattern to match ABB hyperlinks: [AB-NNN](path)
+    link_pattern = re.compile(r'\[AB-(\d{3})\]\([^)]+\)')
 
-    def fix_code_block(match):
+    def fix_code_block(block):
         nonlocal fixes
-        block = match.group(0)
-
-        # Pattern to match ABB hyperlinks: [AB-NNN](path)
-        link_pattern = r'\[AB-(\d{3})\]\([^)]+\)'
 
         def replace_link(link_match):
             nonlocal fixes
             fixes += 1
             return f'AB-{link_match.group(1)}'
 
-        fixed_block = re.sub(link_pattern, replace_link, block)
-        return fixed_block
+        return link_pattern.sub(replace_link, block)
+
+    # Only fenced code blocks are touched
+    content = map_spans(content, fix_code_block, kind=FENCED_CODE)
+    return content, fixes
 
-    content = re.sub(code_block_pattern, fix_code_block, content)
+def fix_links_in_code_blocks(doc):
+    """Remove hyperlinks from code blocks in a corpus document."""
+    fixes = doc.apply(unlink_code_blocks)
+    if doc.error:
+        return False, 0, doc.error
 
-    if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+    if doc.save():
         return True, fixes, None
 
     return False, 0, None
@@ -57,41 +68,16 @@ def main():
     fixed_files = []
     total_fixes = 0
 
-    # Process all pattern files
-    for pattern_folder in PATTERNS_ROOT.iterdir():
-        if not pattern_folder.is_dir() or not pattern_folder.name.startswith('PT-'):
-            continue
-
-        md_files = list(pattern_folder.glob('PT-*.md'))
-        if not md_files:
-            continue
-
-        for md_file in md_files:
-            fixed, count, error = fix_links_in_code_blocks(md_file)
-
-            if error:
-                print(f"  Error: {md_file.name}: {error}")
-            elif fixed:
-                fixed_files.append((md_file.name, count))
-                total_fixes += count
-                print(f"  Fixed: {md_file.name} ({count} links removed from code blocks)")
-
-    # Also check ABB files in case they have code block diagrams
-    ABB_ROOT = REPO_ROOT / "03-building-blocks" / "architecture-building-blocks" / "abbs"
-    for abb_folder in ABB_ROOT.iterdir():
-        if not abb_folder.is_dir() or not abb_folder.name.startswith('AB-'):
-            continue
-
-        md_files = list(abb_folder.glob('AB-*.md'))
-        for md_file in md_files:
-            fixed, count, error = fix_links_in_code_blocks(md_file)
-
-            if error:
-                print(f"  Error: {md_file.name}: {error}")
-            elif fixed:
-                fixed_files.append((md_file.name, count))
-                total_fixes += count
-                print(f"  Fixed: {md_file.name} ({count} links removed from code blocks)")
+    # Pattern files, and ABB files in case they have code block diagrams
+    for doc in Corpus(REPO_ROOT).select(*FILE_PATTERNS):
+        fixed, count, error = fix_links_in_code_blocks(doc)
+
+        if error:
+            print(f"  Error: {doc.path.name}: {error}")
+        elif fixed:
+            fixed_files.append((doc.path.name, count))
+            total_fixes += count
+            print(f"  Fixed: {doc.path.name} ({count} links removed from code blocks)")
 
     print("\n" + "=" * 60)
     print("SUMMARY")
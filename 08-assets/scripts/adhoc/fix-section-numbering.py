@@ -4,9 +4,10 @@ Fix section numbering in use case markdown documents after Data Architecture sec
 """
 
 import os
-import re
 from pathlib import Path
 
+from doc_tools.sections import parse
+
 # Configuration
 BASE_DIR = Path(r"d:\Work\BNZ\ai-platform-architecture")
 USE_CASES_DIR = BASE_DIR / "01-motivation" / "03-use-cases" / "use-cases"
@@ -44,26 +45,26 @@ def fix_section_numbering(file_path):
         ('References', 10),
     ]
 
-    changes_made = False
-
-    for section_name, expected_num in section_order:
-        # Match "## N. Section Name" where N is any number
-        pattern = rf'## \d+\. {re.escape(section_name)}'
-        replacement = f'## {expected_num}. {section_name}'
+    original = content
+    tree = parse(content)
+    edit = tree.edit()
 
-        if re.search(pattern, content):
-            new_content = re.sub(pattern, replacement, content)
-            if new_content != content:
-                content = new_content
-                changes_made = True
-
-    # Also fix "### 4. Data Architecture" to be consistent
-    content = re.sub(r'### 4\. Data Architecture', '## 4. Data Architecture', content)
+    # Match top-level "N. Section Name" headings by name, whatever N is now.
+    # "### 4. Data Architecture" is promoted to ## to be consistent.
+    for section in tree.sections:
+        if section.number is None or '.' in section.number:
+            continue
+        for section_name, expected_num in section_order:
+            if not section.name.startswith(section_name):
+                continue
+            if section.level == 2 or (section.level == 3 and section_name == 'Data Architecture'):
+                edit.replace_heading(section, title=f"{expected_num}. {section.name}", level=2)
+            break
 
-    # Fix any "### 3.6" that should be under section 3 (not renumbered)
-    # These are subsections of Target State Solution
+    # Subsections such as "### 3.6" stay under Target State Solution (not renumbered)
+    content = edit.apply()
 
-    if changes_made or '### 4. Data Architecture' in content:
+    if content != original:
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(content)
         return True
@@ -2,84 +2,26 @@
 """
 Integrity check: Compare ABB heatmap diagram against source ABB markdown files
 """
-import os
-import re
-import csv
-import html
+from pathlib import Path
 
-ABB_BASE_PATH = r"D:\Work\BNZ\ai-platform-architecture\03-building-blocks\architecture-building-blocks\abbs"
-HEATMAP_PATH = r"D:\Work\BNZ\ai-platform-architecture\03-building-blocks\architecture-building-blocks\abb-usage-heatmap.drawio"
-ENHANCED_DESC_PATH = r"D:\Work\BNZ\ai-platform-architecture\03-building-blocks\architecture-building-blocks\abb-descriptions-enhanced.csv"
+from doc_tools.consistency import HEATMAP_PATH, ConsistencyEngine
 
-def extract_from_markdown(abb_id):
-    """Extract name and description from ABB markdown file."""
-    abb_dir = os.path.join(ABB_BASE_PATH, abb_id)
+REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
 
-    if not os.path.exists(abb_dir):
-        return None, None, f"Directory not found: {abb_dir}"
+def extract_from_markdown(engine, abb_id):
+    """Extract ABB name (document title) from the ABB markdown file."""
+    node = engine.nodes.get(abb_id)
+    return node['title'] if node else None
 
-    md_files = [f for f in os.listdir(abb_dir) if f.endswith('.md')]
-    if not md_files:
-        return None, None, f"No markdown file in {abb_dir}"
+def extract_from_diagram(engine):
+    """Extract ABB info from the heatmap diagram (read with doc_tools.drawio)."""
+    # <b>AB-050 Large Language Model Service (24/24)</b><br><span style="font-size:9px">Description</span>
+    return {abb_id: {'name': label['name'], 'description': label['description']}
+            for abb_id, label in engine.diagram_labels().items()}
 
-    md_file = os.path.join(abb_dir, md_files[0])
-
-    with open(md_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Extract ABB Name from title
-    name_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-    name = name_match.group(1).strip() if name_match else None
-
-    # Extract Description
-    desc_match = re.search(r'\*\*Description\*\*:\s*\n(.+?)(?:\n\n|\n###|\n\*\*)', content, re.DOTALL)
-    if desc_match:
-        description = desc_match.group(1).strip()
-    else:
-        desc_match = re.search(r'\*\*Description\*\*:\s*(.+?)(?:\n\n|\n###)', content, re.DOTALL)
-        description = desc_match.group(1).strip() if desc_match else None
-
-    return name, description, None
-
-def extract_from_diagram():
-    """Extract ABB info from the heatmap diagram."""
-    with open(HEATMAP_PATH, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Pattern to extract: id="ab050" value="..."
-    pattern = r'id="(ab\d+)" value="([^"]+)"'
-
-    results = {}
-    for match in re.finditer(pattern, content):
-        cell_id = match.group(1)  # ab050
-        raw_value = match.group(2)
-
-        # Decode HTML entities: &lt; -> <, &gt; -> >, &amp; -> &, &quot; -> "
-        decoded = raw_value.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&').replace('&quot;', '"')
-
-        # Parse: <b>AB-050 Large Language Model Service (24/24)</b><br><span style="font-size:9px">Description</span>
-        header_match = re.search(r'<b>(AB-\d+)\s+(.+?)\s+\(\d+/24\)</b>', decoded)
-        desc_match = re.search(r'<span[^>]*>([^<]+)</span>', decoded)
-
-        if header_match:
-            abb_id = header_match.group(1)
-            name = header_match.group(2)
-            desc = desc_match.group(1) if desc_match else ""
-            results[abb_id] = {'name': name, 'description': desc}
-
-    return results
-
-def load_enhanced_descriptions():
+def load_enhanced_descriptions(engine):
     """Load the enhanced descriptions CSV."""
-    descriptions = {}
-    with open(ENHANCED_DESC_PATH, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            descriptions[row['abb_id']] = {
-                'name': row['name'],
-                'description': row['description']
-            }
-    return descriptions
+    return engine.enhanced_descriptions()
 
 # Run integrity check
 print("=" * 80)
@@ -87,43 +29,29 @@ print("ABB HEATMAP INTEGRITY CHECK")
 print("=" * 80)
 print()
 
+# Build (or incrementally refresh) the reference graph
+engine = ConsistencyEngine(REPO_ROOT).refresh()
+
 # Extract from diagram
-diagram_abbs = extract_from_diagram()
+diagram_abbs = extract_from_diagram(engine)
 print(f"Found {len(diagram_abbs)} ABBs in diagram")
+if HEATMAP_PATH in engine.errors():
+    print(f"  [ERROR] Could not read diagram: {engine.errors()[HEATMAP_PATH]}")
 
 # Load enhanced descriptions
-enhanced_descs = load_enhanced_descriptions()
+enhanced_descs = load_enhanced_descriptions(engine)
 print(f"Found {len(enhanced_descs)} ABBs in enhanced descriptions CSV")
 
 # Count source ABBs
-source_abbs = [d for d in os.listdir(ABB_BASE_PATH) if d.startswith('AB-')]
+source_abbs = engine.ids('AB')
 print(f"Found {len(source_abbs)} ABBs in source folder")
 print()
 
-name_issues = []
-enhanced_name_issues = []
-matches = []
-
 print("-" * 80)
 print("CHECKING: Diagram names vs Source Markdown names")
 print("-" * 80)
 
-for abb_id in sorted(diagram_abbs.keys()):
-    diagram_name = diagram_abbs[abb_id]['name']
-    diagram_desc = diagram_abbs[abb_id]['description']
-
-    # Get from source markdown
-    source_name, source_desc, error = extract_from_markdown(abb_id)
-
-    if error:
-        name_issues.append((abb_id, "ERROR", error, None))
-        continue
-
-    # Check name match
-    if diagram_name != source_name:
-        name_issues.append((abb_id, "MISMATCH", diagram_name, source_name))
-    else:
-        matches.append(abb_id)
+name_issues = engine.name_mismatches({abb_id: abb['name'] for abb_id, abb in diagram_abbs.items()})
 
 if name_issues:
     print(f"\n{len(name_issues)} ISSUES FOUND:\n")
@@ -142,16 +70,7 @@ print("-" * 80)
 print("CHECKING: Enhanced CSV names vs Source Markdown names")
 print("-" * 80)
 
-for abb_id in sorted(enhanced_descs.keys()):
-    enhanced_name = enhanced_descs[abb_id]['name']
-    source_name, source_desc, error = extract_from_markdown(abb_id)
-
-    if error:
-        enhanced_name_issues.append((abb_id, "ERROR", error, None))
-        continue
-
-    if enhanced_name != source_name:
-        enhanced_name_issues.append((abb_id, "MISMATCH", enhanced_name, source_name))
+enhanced_name_issues = engine.name_mismatches({abb_id: row['name'] for abb_id, row in enhanced_descs.items()})
 
 if enhanced_name_issues:
     print(f"\n{len(enhanced_name_issues)} ISSUES FOUND:\n")
@@ -175,8 +94,7 @@ print()
 all_match = True
 for abb_id in sorted(diagram_abbs.keys()):
     diagram_name = diagram_abbs[abb_id]['name']
-    diagram_desc = diagram_abbs[abb_id]['description']
-    source_name, source_desc, _ = extract_from_markdown(abb_id)
+    source_name = extract_from_markdown(engine, abb_id)
     enhanced = enhanced_descs.get(abb_id, {})
 
     name_ok = diagram_name == source_name
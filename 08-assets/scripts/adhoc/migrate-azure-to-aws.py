@@ -6,13 +6,26 @@ Author: BNZ Enterprise Architecture
 Date: 2025-12-06
 """
 
-import os
 import re
 from pathlib import Path
 
+from doc_tools.corpus import Corpus
+from doc_tools.replace import MultiReplacer
+
 # Configuration
-USE_CASES_DIR = Path(r"D:\Work\BNZ\ai-platform-architecture\01-motivation\03-use-cases\use-cases")
-PATTERNS_DIR = Path(r"D:\Work\BNZ\ai-platform-architecture\03-building-blocks\patterns")
+REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
+USE_CASES_DIR = REPO_ROOT / "01-motivation" / "03-use-cases" / "use-cases"
+PATTERNS_DIR = REPO_ROOT / "03-building-blocks" / "patterns"
+
+# Files to migrate, relative to REPO_ROOT (markdown and drawio)
+USE_CASE_PATTERNS = [
+    '01-motivation/03-use-cases/use-cases/**/*.md',
+    '01-motivation/03-use-cases/use-cases/**/*.drawio',
+]
+PATTERN_PATTERNS = [
+    '03-building-blocks/patterns/**/*.md',
+    '03-building-blocks/patterns/**/*.drawio',
+]
 
 # Component mappings: Azure -> AWS/Snowflake
 REPLACEMENTS = [
@@ -154,30 +167,36 @@ REPLACEMENTS = [
     ("[AWS, Azure, GCP", "[AWS, GCP"),
 ]
 
-def update_file(filepath):
-    """Update Azure references in a single file."""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        # Skip binary files or files with encoding issues
-        return []
-
-    original_content = content
-    changes = []
-
-    for azure_term, aws_term in REPLACEMENTS:
-        if azure_term in content:
-            count = content.count(azure_term)
-            content = content.replace(azure_term, aws_term)
-            changes.append(f"  {azure_term} -> {aws_term} ({count}x)")
-
-    if content != original_content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+# All replacements applied in one pass per file, longest term first
+REPLACER = MultiReplacer(REPLACEMENTS)
+
+def migrate_content(filepath, content):
+    """
+    Replace Azure terms in content.
+
+    Returns:
+        Tuple of (new content, list of change descriptions)
+    """
+    content, counts = REPLACER.replace(content)
+    changes = [f"  {azure_term} -> {REPLACER.mapping[azure_term]} ({count}x)"
+               for azure_term, count in counts.items()]
+    return content, changes
+
+def update_file(doc):
+    """Update Azure references in a single corpus document."""
+    # Binary files or files with encoding issues are skipped (doc.text is None)
+    changes = doc.apply(migrate_content)
+    if doc.save():
         return changes
     return []
 
+def report(doc, changes):
+    """Print the changes made to one file."""
+    print(f"{doc.path.name}:")
+    for change in changes:
+        print(change)
+    print()
+
 def main():
     print("=" * 70)
     print("Azure to AWS Migration Script")
@@ -194,34 +213,24 @@ def main():
     total_files = 0
     total_changes = 0
 
+    corpus = Corpus(REPO_ROOT)
+
     # Process all files in use-cases directory (markdown and drawio)
-    for root, dirs, files in os.walk(USE_CASES_DIR):
-        for filename in files:
-            if filename.endswith(('.md', '.drawio')):
-                filepath = Path(root) / filename
-                changes = update_file(filepath)
-                if changes:
-                    total_files += 1
-                    total_changes += len(changes)
-                    print(f"{filepath.name}:")
-                    for change in changes:
-                        print(change)
-                    print()
+    for doc in corpus.select(*USE_CASE_PATTERNS):
+        changes = update_file(doc)
+        if changes:
+            total_files += 1
+            total_changes += len(changes)
+            report(doc, changes)
 
     # Process all files in patterns directory (markdown and drawio)
     print("\n--- Processing Patterns ---\n")
-    for root, dirs, files in os.walk(PATTERNS_DIR):
-        for filename in files:
-            if filename.endswith(('.md', '.drawio')):
-                filepath = Path(root) / filename
-                changes = update_file(filepath)
-                if changes:
-                    total_files += 1
-                    total_changes += len(changes)
-                    print(f"{filepath.name}:")
-                    for change in changes:
-                        print(change)
-                    print()
+    for doc in corpus.select(*PATTERN_PATTERNS):
+        changes = update_file(doc)
+        if changes:
+            total_files += 1
+            total_changes += len(changes)
+            report(doc, changes)
 
     print("=" * 70)
     print(f"Summary: Made {total_changes} replacements in {total_files} files")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Script: normalise-docs.py
+Purpose: Run the documentation normalisation scripts in one sweep of the repository.
+         Each file is read once, every applicable transform is applied in memory,
+         and changed files are written once.
+
+Transforms, in order:
+  1. migrate-azure-to-aws       Azure terms -> AWS/Snowflake equivalents
+  2. update-pattern-links       Pattern references in use case docs -> relative links
+  3. add-abb-hyperlinks         AB-NNN -> relative links
+  4. add-uc-hyperlinks          UC-NNN -> relative links
+
+Links are only injected into prose, never into code or existing links, so
+fix-links-in-code-blocks is not part of the sweep.
+
+Usage:
+    python normalise-docs.py              # Apply all transforms
+    python normalise-docs.py --dry-run    # Report without writing
+"""
+
+import argparse
+import importlib
+from pathlib import Path
+
+from doc_tools.corpus import Corpus
+from doc_tools.writer import ChangeWriter, MANIFEST_NAME
+
+REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
+
+
+def load_script(name):
+    """Import one of the hyphen-named scripts in this folder as a module."""
+    return importlib.import_module(name)
+
+
+def build_steps():
+    """Return the (name, patterns, transform) steps for Corpus.run."""
+    migrate = load_script('migrate-azure-to-aws')
+    pattern_links = load_script('update-pattern-links')
+    abb_links = load_script('add-abb-hyperlinks')
+    uc_links = load_script('add-uc-hyperlinks')
+
+    abb_lookup = abb_links.build_abb_lookup()
+    uc_lookup = uc_links.build_uc_lookup()
+    print(f"   Found {len(abb_lookup)} ABBs and {len(uc_lookup)} Use Cases")
+
+    return [
+        ('azure-to-aws', migrate.USE_CASE_PATTERNS + migrate.PATTERN_PATTERNS,
+         migrate.migrate_content),
+        ('pattern-links', pattern_links.FILE_PATTERNS,
+         pattern_links.link_patterns),
+        ('abb-links', abb_links.FILE_PATTERNS,
+         lambda path, text: abb_links.link_abb_ids(path, text, abb_lookup)),
+        ('uc-links', uc_links.FILE_PATTERNS,
+         lambda path, text: uc_links.link_uc_ids(path, text, uc_lookup)),
+    ]
+
+
+def describe(report):
+    """Short summary of one transform's report (a count or a list of changes)."""
+    return str(len(report)) if isinstance(report, list) else str(report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run all documentation normalisation transforms in one sweep')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would be changed without making changes')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Documentation Normalisation")
+    print("=" * 60)
+
+    if args.dry_run:
+        print("\n*** DRY RUN MODE - No changes will be made ***\n")
+
+    print("\n1. Loading transforms...")
+    steps = build_steps()
+
+    print("\n2. Sweeping repository...")
+    corpus = Corpus(REPO_ROOT)
+    results = corpus.run(steps)
+    # Changed files are written atomically and listed in the change manifest
+    with ChangeWriter(REPO_ROOT, manifest=REPO_ROOT / MANIFEST_NAME) as writer:
+        changed = corpus.save(args.dry_run, writer)
+    changed_paths = {doc.rel_path for doc in changed}
+
+    for doc, reports in results:
+        if doc.error:
+            print(f"  Error: {doc.rel_path}: {doc.error}")
+        elif doc.rel_path in changed_paths:
+            summary = ", ".join(f"{name} {describe(report)}" for name, report in reports.items())
+            print(f"  {'[DRY RUN] Would update' if args.dry_run else 'Updated'}: {doc.rel_path} ({summary})")
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    print(f"Files scanned: {len(results)}")
+    print(f"Files updated: {len(changed)}")
+    print(f"Errors: {sum(1 for doc, _ in results if doc.error)}")
+
+    if args.dry_run:
+        print("\n*** This was a dry run. Run without --dry-run to apply changes. ***")
+
+    print("\nDone!")
+
+
+if __name__ == "__main__":
+    main()
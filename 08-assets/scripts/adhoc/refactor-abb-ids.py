@@ -14,6 +14,9 @@ import shutil
 from pathlib import Path
 from collections import OrderedDict
 
+from doc_tools.corpus import Corpus
+from doc_tools.replace import MultiReplacer
+
 # Paths
 REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
 ABB_ROOT = REPO_ROOT / "03-building-blocks" / "architecture-building-blocks" / "abbs"
@@ -108,36 +111,24 @@ def rename_folders_and_files(mapping):
 
     return renamed, errors
 
-def update_file_content(file_path, mapping):
-    """Update all ABB ID references in a file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        return False, "Unicode decode error"
-
-    original_content = content
-
-    # Replace all old IDs with new IDs
-    # Sort by length (longest first) to avoid partial replacements
-    for old_id, new_id in sorted(mapping.items(), key=lambda x: len(x[0]), reverse=True):
-        # Replace the full ID pattern (ABB-XXX-NNN)
-        content = content.replace(old_id, new_id)
+def update_file_content(doc, replacer):
+    """Update all ABB ID references in a corpus document."""
+    # Replace all old IDs with new IDs in one pass (longest match first)
+    doc.apply(lambda path, text: replacer.replace(text))
+    if doc.error:
+        return False, doc.error
 
     # Also update patterns like "ABB ID" -> keep as "ABB ID" but value should be new format
     # And update any "Short Name" references
 
-    if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True, None
-
-    return False, None
+    return doc.save(), None
 
 def update_all_references(mapping):
     """Update all references across the repository."""
     updated_files = []
     errors = []
+    replacer = MultiReplacer(mapping)
+    corpus = Corpus(REPO_ROOT)
 
     # Patterns to search for files that might contain ABB references
     file_patterns = [
@@ -151,14 +142,13 @@ def update_all_references(mapping):
 
     for pattern, description in file_patterns:
         print(f"\nProcessing {description}...")
-        for file_path in REPO_ROOT.glob(pattern):
-            if file_path.is_file():
-                updated, error = update_file_content(file_path, mapping)
-                if updated:
-                    updated_files.append((str(file_path.relative_to(REPO_ROOT)), description))
-                    print(f"  Updated: {file_path.name}")
-                if error:
-                    errors.append((str(file_path), error))
+        for doc in corpus.select(pattern):
+            updated, error = update_file_content(doc, replacer)
+            if updated:
+                updated_files.append((doc.rel_path, description))
+                print(f"  Updated: {doc.path.name}")
+            if error:
+                errors.append((str(doc.path), error))
 
     return updated_files, errors
 
@@ -10,6 +10,8 @@ import re
 from pathlib import Path
 from collections import defaultdict
 
+from doc_tools.writer import ChangeWriter, MANIFEST_NAME
+
 # Paths
 REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
 CSV_PATH = REPO_ROOT / "02-capabilities" / "capabilities-consolidated.csv"
@@ -199,8 +201,13 @@ def generate_capability_table(abb_id, abb_name, capabilities, all_caps):
 
     return "\n".join(lines)
 
-def update_abb_file(abb_file, abb_id, capabilities, all_caps):
-    """Update the capability mapping section in an ABB file."""
+def update_abb_file(abb_file, abb_id, capabilities, all_caps, writer):
+    """
+    Update the capability mapping section in an ABB file.
+
+    Returns:
+        Tuple of (changed, error)
+    """
     with open(abb_file, 'r', encoding='utf-8') as f:
         content = f.read()
 
@@ -210,8 +217,7 @@ def update_abb_file(abb_file, abb_id, capabilities, all_caps):
 
     match = re.search(pattern, content, re.DOTALL)
     if not match:
-        print(f"  WARNING: Could not find section 7.1 in {abb_file.name}")
-        return False
+        return False, f"Could not find section 7.1 in {abb_file.name}"
 
     # Get ABB name from file
     _, abb_name = get_abb_info(abb_file)
@@ -222,10 +228,11 @@ def update_abb_file(abb_file, abb_id, capabilities, all_caps):
     # Replace the section
     new_content = content[:match.start(2)] + "\n" + new_table + "\n" + content[match.end(2):]
 
-    with open(abb_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    changed = writer.write(abb_file, new_content)
+    if not changed:
+        print("  Unchanged")
 
-    return True
+    return changed, None
 
 def main():
     print("Parsing capabilities CSV...")
@@ -239,32 +246,40 @@ def main():
     print(f"Found {len(abb_files)} ABB files")
 
     updated = 0
+    unchanged = 0
     skipped = 0
     errors = 0
 
-    for abb_file in sorted(abb_files):
-        abb_id, abb_name = get_abb_info(abb_file)
-        if not abb_id:
-            print(f"  SKIP: Could not parse ABB ID from {abb_file.name}")
-            skipped += 1
-            continue
-
-        capabilities = abb_to_caps.get(abb_id, [])
-        print(f"Processing {abb_id}: {len(capabilities)} capabilities mapped")
-
-        try:
-            if update_abb_file(abb_file, abb_id, capabilities, all_caps):
-                updated += 1
-            else:
+    with ChangeWriter(REPO_ROOT, manifest=REPO_ROOT / MANIFEST_NAME) as writer:
+        for abb_file in sorted(abb_files):
+            abb_id, abb_name = get_abb_info(abb_file)
+            if not abb_id:
+                print(f"  SKIP: Could not parse ABB ID from {abb_file.name}")
+                skipped += 1
+                continue
+
+            capabilities = abb_to_caps.get(abb_id, [])
+            print(f"Processing {abb_id}: {len(capabilities)} capabilities mapped")
+
+            try:
+                changed, error = update_abb_file(abb_file, abb_id, capabilities, all_caps, writer)
+                if error:
+                    print(f"  WARNING: {error}")
+                    errors += 1
+                elif changed:
+                    updated += 1
+                else:
+                    unchanged += 1
+            except Exception as e:
+                print(f"  ERROR: {e}")
                 errors += 1
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            errors += 1
 
     print(f"\nSummary:")
     print(f"  Updated: {updated}")
+    print(f"  Unchanged: {unchanged}")
     print(f"  Skipped: {skipped}")
     print(f"  Errors: {errors}")
+    print(f"  {writer.summary()}")
 
     # Print ABBs without mappings for manual review
     print("\nABBs without capability mappings (need manual review):")
@@ -9,6 +9,8 @@ import re
 from pathlib import Path
 from collections import defaultdict
 
+from doc_tools.writer import ChangeWriter, MANIFEST_NAME
+
 # Paths
 REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
 CSV_PATH = REPO_ROOT / "02-capabilities" / "capabilities-consolidated.csv"
@@ -235,8 +237,13 @@ def generate_nfr_table(abb_id, abb_name):
     return "\n".join(lines)
 
 
-def update_abb_file(abb_file, abb_id, abb_name):
-    """Update sections 2.2 and 2.3 in an ABB file."""
+def update_abb_file(abb_file, abb_id, abb_name, writer):
+    """
+    Update sections 2.2 and 2.3 in an ABB file.
+
+    Returns:
+        Tuple of (changed, error)
+    """
     with open(abb_file, 'r', encoding='utf-8') as f:
         content = f.read()
 
@@ -245,8 +252,7 @@ def update_abb_file(abb_file, abb_id, abb_name):
     match_22 = re.search(pattern_22, content, re.DOTALL)
 
     if not match_22:
-        print(f"  WARNING: Could not find section 2.2 in {abb_file.name}")
-        return False
+        return False, f"Could not find section 2.2 in {abb_file.name}"
 
     new_fr = generate_functional_requirements(abb_id, abb_name)
     content = content[:match_22.start(2)] + "\n" + new_fr + "\n" + content[match_22.end(2):]
@@ -256,16 +262,16 @@ def update_abb_file(abb_file, abb_id, abb_name):
     match_23 = re.search(pattern_23, content, re.DOTALL)
 
     if not match_23:
-        print(f"  WARNING: Could not find section 2.3 in {abb_file.name}")
-        return False
+        return False, f"Could not find section 2.3 in {abb_file.name}"
 
     new_nfr = generate_nfr_table(abb_id, abb_name)
     content = content[:match_23.start(2)] + "\n" + new_nfr + "\n" + content[match_23.end(2):]
 
-    with open(abb_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    changed = writer.write(abb_file, content)
+    if not changed:
+        print("  Unchanged")
 
-    return True
+    return changed, None
 
 
 def main():
@@ -276,32 +282,40 @@ def main():
     print(f"Found {len(abb_files)} ABB files")
 
     updated = 0
+    unchanged = 0
     skipped = 0
     errors = 0
 
-    for abb_file in sorted(abb_files):
-        abb_id, abb_name = get_abb_info(abb_file)
-        if not abb_id:
-            print(f"  SKIP: Could not parse ABB ID from {abb_file.name}")
-            skipped += 1
-            continue
-
-        category = get_abb_category(abb_id)
-        print(f"Processing {abb_id} ({category}): {abb_name}")
-
-        try:
-            if update_abb_file(abb_file, abb_id, abb_name):
-                updated += 1
-            else:
+    with ChangeWriter(REPO_ROOT, manifest=REPO_ROOT / MANIFEST_NAME) as writer:
+        for abb_file in sorted(abb_files):
+            abb_id, abb_name = get_abb_info(abb_file)
+            if not abb_id:
+                print(f"  SKIP: Could not parse ABB ID from {abb_file.name}")
+                skipped += 1
+                continue
+
+            category = get_abb_category(abb_id)
+            print(f"Processing {abb_id} ({category}): {abb_name}")
+
+            try:
+                changed, error = update_abb_file(abb_file, abb_id, abb_name, writer)
+                if error:
+                    print(f"  WARNING: {error}")
+                    errors += 1
+                elif changed:
+                    updated += 1
+                else:
+                    unchanged += 1
+            except Exception as e:
+                print(f"  ERROR: {e}")
                 errors += 1
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            errors += 1
 
     print(f"\nSummary:")
     print(f"  Updated: {updated}")
+    print(f"  Unchanged: {unchanged}")
     print(f"  Skipped: {skipped}")
     print(f"  Errors: {errors}")
+    print(f"  {writer.summary()}")
 
 
 if __name__ == "__main__":
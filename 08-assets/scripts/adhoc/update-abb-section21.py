@@ -9,6 +9,8 @@ import re
 from pathlib import Path
 from collections import defaultdict
 
+from doc_tools.sections import parse
+
 # Paths
 REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
 CSV_PATH = REPO_ROOT / "02-capabilities" / "capabilities-consolidated.csv"
@@ -101,12 +103,10 @@ def update_abb_file(abb_file, abb_id, capabilities):
     with open(abb_file, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # Find and replace section 2.1
-    # Pattern: ### 2.1 Core Capabilities ... (until ### 2.2 or next section)
-    pattern = r'(### 2\.1 Core Capabilities\s*\n)(.*?)(\n### 2\.2|\n---)'
-
-    match = re.search(pattern, content, re.DOTALL)
-    if not match:
+    # Find section 2.1 (runs until ### 2.2 or the next section)
+    tree = parse(content)
+    section = tree.find('2.1 Core Capabilities', level=3)
+    if not section:
         print(f"  WARNING: Could not find section 2.1 in {abb_file.name}")
         return False
 
@@ -116,8 +116,8 @@ def update_abb_file(abb_file, abb_id, capabilities):
     # Generate new table
     new_table = generate_capabilities_table(abb_id, abb_name, capabilities)
 
-    # Replace the section
-    new_content = content[:match.start(2)] + "\n" + new_table + "\n" + content[match.end(2):]
+    # Replace the section body, keeping the heading and separator
+    new_content = tree.replace_body(section, new_table)
 
     with open(abb_file, 'w', encoding='utf-8') as f:
         f.write(new_content)
@@ -9,6 +9,8 @@ import re
 from pathlib import Path
 from collections import defaultdict
 
+from doc_tools.writer import ChangeWriter, MANIFEST_NAME
+
 # Paths
 REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
 CAPS_CSV_PATH = REPO_ROOT / "02-capabilities" / "capabilities-consolidated.csv"
@@ -1196,8 +1198,13 @@ def update_section_3(content, abb_id, category, abb_name):
     return content
 
 
-def update_abb_file(abb_file):
-    """Update sections 1 and 3 in an ABB file."""
+def update_abb_file(abb_file, writer):
+    """
+    Update sections 1 and 3 in an ABB file.
+
+    Returns:
+        Tuple of (changed, error)
+    """
     abb_id, category, abb_name = get_abb_info(abb_file)
     if not abb_id:
         return False, "Could not parse ABB info"
@@ -1211,10 +1218,7 @@ def update_abb_file(abb_file):
     content = update_section_1(content, abb_id, category, abb_name, description)
     content = update_section_3(content, abb_id, category, abb_name)
 
-    with open(abb_file, 'w', encoding='utf-8') as f:
-        f.write(content)
-
-    return True, None
+    return writer.write(abb_file, content), None
 
 
 def main():
@@ -1226,34 +1230,39 @@ def main():
     print(f"Found {len(abb_files)} ABB files\n")
 
     updated = 0
+    unchanged = 0
     skipped = 0
     errors = 0
 
     category_counts = defaultdict(int)
 
-    for abb_file in sorted(abb_files):
-        abb_id, category, abb_name = get_abb_info(abb_file)
-        if not abb_id:
-            print(f"  SKIP: Could not parse ABB info from {abb_file.name}")
-            skipped += 1
-            continue
-
-        category_counts[category] += 1
-        print(f"Processing {abb_id} ({category}): {abb_name}")
-
-        try:
-            success, error = update_abb_file(abb_file)
-            if success:
-                updated += 1
-            else:
-                print(f"  ERROR: {error}")
+    with ChangeWriter(REPO_ROOT, manifest=REPO_ROOT / MANIFEST_NAME) as writer:
+        for abb_file in sorted(abb_files):
+            abb_id, category, abb_name = get_abb_info(abb_file)
+            if not abb_id:
+                print(f"  SKIP: Could not parse ABB info from {abb_file.name}")
+                skipped += 1
+                continue
+
+            category_counts[category] += 1
+            print(f"Processing {abb_id} ({category}): {abb_name}")
+
+            try:
+                changed, error = update_abb_file(abb_file, writer)
+                if error:
+                    print(f"  ERROR: {error}")
+                    errors += 1
+                elif changed:
+                    updated += 1
+                else:
+                    unchanged += 1
+            except Exception as e:
+                print(f"  ERROR: {e}")
                 errors += 1
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            errors += 1
 
     print(f"\nSummary:")
     print(f"  Updated: {updated}")
+    print(f"  Unchanged: {unchanged}")
     print(f"  Skipped: {skipped}")
     print(f"  Errors: {errors}")
 
@@ -6,6 +6,8 @@ Script to update ABB IDs in draw.io files from old ABB-XXX-NNN format to new AB-
 import re
 from pathlib import Path
 
+from doc_tools.replace import MultiReplacer
+
 # Paths
 REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
 PATTERNS_ROOT = REPO_ROOT / "03-building-blocks" / "patterns"
@@ -147,6 +149,8 @@ OLD_TO_NEW_MAPPING = {
     'ABB-WFL-001': 'AB-129',
 }
 
+REPLACER = MultiReplacer(OLD_TO_NEW_MAPPING)
+
 def update_drawio_file(file_path):
     """Update ABB IDs in a draw.io file."""
     try:
@@ -156,14 +160,10 @@ def update_drawio_file(file_path):
         return False, 0, "Unicode decode error"
 
     original_content = content
-    replacements = 0
-
-    # Sort by length (longest first) to avoid partial replacements
-    for old_id, new_id in sorted(OLD_TO_NEW_MAPPING.items(), key=lambda x: len(x[0]), reverse=True):
-        if old_id in content:
-            count = content.count(old_id)
-            content = content.replace(old_id, new_id)
-            replacements += count
+
+    # One pass over the file for the whole mapping (longest match first)
+    content, counts = REPLACER.replace(content)
+    replacements = sum(counts.values())
 
     if content != original_content:
         with open(file_path, 'w', encoding='utf-8') as f:
@@ -11,9 +11,18 @@ import os
 import re
 from pathlib import Path
 
+from doc_tools.corpus import Corpus
+
 # Configuration
-USE_CASES_DIR = Path(r"D:\Work\BNZ\ai-platform-architecture\01-motivation\03-use-cases\use-cases")
-PATTERNS_DIR = Path(r"D:\Work\BNZ\ai-platform-architecture\03-building-blocks\patterns")
+REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
+USE_CASES_DIR = REPO_ROOT / "01-motivation" / "03-use-cases" / "use-cases"
+PATTERNS_DIR = REPO_ROOT / "03-building-blocks" / "patterns"
+
+# Files to update, relative to REPO_ROOT
+FILE_PATTERNS = [
+    '01-motivation/03-use-cases/use-cases/UC-*/*.md',
+    '01-motivation/03-use-cases/use-cases/README.md',
+]
 
 # Pattern mapping: PT-XXX -> markdown filename
 PATTERN_FILES = {
@@ -68,12 +77,13 @@ def get_pattern_link(pattern_id):
         return f"{RELATIVE_PATH}/{PATTERN_FILES[pattern_id]}"
     return None
 
-def update_file(filepath):
-    """Update pattern references in a single file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+def link_patterns(filepath, content):
+    """
+    Update pattern references in content.
 
-    original_content = content
+    Returns:
+        Tuple of (new content, list of change descriptions)
+    """
     changes = []
 
     # Pattern 1: Update old-style links like [PT-005-...md](../patterns/PT-005-...md)
@@ -160,10 +170,12 @@ def update_file(filepath):
         return match.group(0)
 
     content = re.sub(list_pattern, replace_list_pattern, content, flags=re.MULTILINE)
+    return content, changes
 
-    if content != original_content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+def update_file(doc):
+    """Update pattern references in a single corpus document."""
+    changes = doc.apply(link_patterns)
+    if doc.save():
         return changes
     return []
 
@@ -176,28 +188,13 @@ def main():
     total_files = 0
     total_changes = 0
 
-    # Process each use case folder
-    for uc_folder in sorted(USE_CASES_DIR.iterdir()):
-        if uc_folder.is_dir() and uc_folder.name.startswith("UC-"):
-            # Find markdown files in the use case folder
-            for md_file in uc_folder.glob("*.md"):
-                changes = update_file(md_file)
-                if changes:
-                    total_files += 1
-                    total_changes += len(changes)
-                    print(f"{md_file.name}:")
-                    for change in changes:
-                        print(change)
-                    print()
-
-    # Also update README.md in use-cases folder
-    readme_path = USE_CASES_DIR / "README.md"
-    if readme_path.exists():
-        changes = update_file(readme_path)
+    # Markdown files in each use case folder, plus the use-cases README.md
+    for doc in Corpus(REPO_ROOT).select(*FILE_PATTERNS):
+        changes = update_file(doc)
         if changes:
             total_files += 1
             total_changes += len(changes)
-            print(f"README.md:")
+            print(f"{doc.path.name}:")
             for change in changes:
                 print(change)
             print()
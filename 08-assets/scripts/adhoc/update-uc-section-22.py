@@ -3,23 +3,21 @@
 Script to update Use Case section 2.2 Cost Estimate with detailed TBD placeholders.
 """
 
-import re
 from pathlib import Path
 
+from doc_tools.sections import parse
+
 # Paths
 REPO_ROOT = Path(r"D:\Work\BNZ\ai-platform-architecture")
 UC_ROOT = REPO_ROOT / "01-motivation" / "03-use-cases" / "use-cases"
 
-SECTION_22_REPLACEMENT = """### 2.2 Cost Estimate
-
-**Development Costs**: TBD
+SECTION_22_BODY = """**Development Costs**: TBD
 
 **Ongoing Costs (Annual)**: TBD
 
 **Investment Payback Period**: TBD
 
 **3-Year ROI**: TBD
-
 """
 
 def update_section_22(file_path):
@@ -32,10 +30,11 @@ def update_section_22(file_path):
 
     original_content = content
 
-    # Find section 2.2 and replace content until next section (### 2.3, ---, or ## 3.)
-    pattern = r'### 2\.2 Cost Estimate\n[\s\S]*?(?=### 2\.3 |---\n\n## 3\.|## 3\.)'
-
-    content = re.sub(pattern, SECTION_22_REPLACEMENT, content)
+    # Replace section 2.2 up to the next section (### 2.3 or ## 3.)
+    tree = parse(content)
+    section = tree.find('2.2 Cost Estimate', level=3)
+    if section:
+        content = tree.replace_body(section, SECTION_22_BODY)
 
     if content != original_content:
         with open(file_path, 'w', encoding='utf-8') as f:
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Generator Benchmark Harness
+Measure how the diagram generators scale with the size of the catalog.
+
+For each scale factor the operational CSVs are copied into a temporary
+fixture folder with every use case grown N times: N copies of its ABBs,
+interfaces and sequence steps, with suffixed IDs and names, so each
+diagram draws N times as much. The ABB reference catalog and the use case
+list are replicated N times too. Each generator then builds diagrams for
+the 24 use cases, and the harness records wall time, peak Python memory
+(tracemalloc) and total output size. Wall
+time and memory are measured cold (CSV files parsed, as in a fresh checkout);
+warm time is with the catalog snapshots already written.
+
+Results are written as JSON so runs from different commits can be compared.
+
+Usage:
+    python benchmark_generators.py                          # Scales 1, 10, 100
+    python benchmark_generators.py --scales 1,10            # Custom scales
+    python benchmark_generators.py --only blueprint         # One generator
+    python benchmark_generators.py --compare old.json       # Show change vs a previous run
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from unittest import mock
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[2]
+MODEL_DIR = REPO_ROOT / "01-motivation" / "03-use-cases" / "model"
+OPERATIONAL_DIR = MODEL_DIR / "operational"
+USE_CASE_LIST = "BNZ List of AI use cases Dec 25.csv"
+RESULTS_DIR = SCRIPT_DIR / "benchmark-results"
+
+BASE_USE_CASES = 24
+SAMPLE_USE_CASES = range(1, BASE_USE_CASES + 1)
+EMITTER_PASSES = 50  # The emitter alone is too quick to time in one pass
+
+sys.path.insert(0, str(SCRIPT_DIR))
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+def read_rows(path: Path):
+    """Return (header, rows) for a CSV file, rows as raw lists."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        return header, list(reader)
+
+
+def write_rows(path: Path, header: List[str], rows: List[List[str]]):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+# Per use case tables grown at each scale: {file: (ID columns, name columns, step column)}.
+# IDs get a "-N" suffix and names " (N)", the same in every table, so interfaces
+# still join their ABBs and the ABB copies match the reference catalog copies.
+GROWN_TABLES = {
+    "solution-abb-catalog.csv": (["abb_id"], ["abb_name", "component_name"], None),
+    "solution-interfaces-catalog.csv": (
+        ["interface_id", "solution_interface_id", "source_abb_id", "target_abb_id"],
+        ["interface_name", "source_abb_name", "target_abb_name"], None),
+    "scenario-sequence-steps.csv": (
+        ["step_id", "interface_id", "solution_interface_id"],
+        ["from_component", "to_component"], "sequence_step"),
+}
+
+
+def replicate(rows: List[List[str]], scale: int, column: int) -> List[List[str]]:
+    """Copy rows `scale` times, offsetting the use case ID of each copy."""
+    result = list(rows)
+    for copy in range(1, scale):
+        for row in rows:
+            if column >= len(row) or not row[column].strip().isdigit():
+                continue
+            row = list(row)
+            row[column] = str(int(row[column]) + copy * BASE_USE_CASES)
+            result.append(row)
+    return result
+
+
+def rename(rows: List[List[str]], scale: int, columns: List[int]) -> List[List[str]]:
+    """Copy rows `scale` times, suffixing name columns so copies never match."""
+    result = list(rows)
+    for copy in range(1, scale):
+        for row in rows:
+            row = list(row)
+            for column in columns:
+                if column < len(row):
+                    row[column] = f"{row[column]} ({copy})"
+            result.append(row)
+    return result
+
+
+def grow(header: List[str], rows: List[List[str]], scale: int,
+         ids: List[str], names: List[str], step: Optional[str] = None) -> List[List[str]]:
+    """
+    Give every use case `scale` times its rows: the originals, then each copy
+    with suffixed IDs and names. Step numbers of a copy continue after the
+    use case's previous copy.
+    """
+    uc_column = header.index('use_case_id')
+    id_columns = [header.index(c) for c in ids]
+    name_columns = [header.index(c) for c in names]
+    step_column = header.index(step) if step else None
+    
+    groups: Dict[str, List[List[str]]] = {}
+    for row in rows:
+        key = row[uc_column] if uc_column < len(row) else ""
+        groups.setdefault(key, []).append(row)
+    
+    result = []
+    for group in groups.values():
+        result.extend(group)
+        for copy in range(1, scale):
+            for row in group:
+                row = list(row) + [""] * (len(header) - len(row))
+                for column in id_columns:
+                    if row[column]:
+                        row[column] = f"{row[column]}-{copy}"
+                for column in name_columns:
+                    if row[column]:
+                        row[column] = f"{row[column]} ({copy})"
+                if step_column is not None and row[step_column].strip().isdigit():
+                    row[step_column] = str(int(row[step_column]) + copy * len(group))
+                result.append(row)
+    return result
+
+
+def build_fixture(scale: int, root: Path) -> Path:
+    """
+    Create a fixture folder for one scale factor.
+
+    Returns:
+        The working folder (generators read CSVs from the current directory
+        and write diagrams to its parent)
+    """
+    work = root / f"scale-{scale}" / "work"
+    work.mkdir(parents=True)
+
+    for source in sorted(OPERATIONAL_DIR.glob("*.csv")):
+        header, rows = read_rows(source)
+        if source.name in GROWN_TABLES:
+            rows = grow(header, rows, scale, *GROWN_TABLES[source.name])
+        elif source.name == "ai-architecture-building-blocks.csv":
+            # Reference catalog: grow it with renamed copies
+            rows = rename(rows, scale, [header.index('name'), header.index('component name')])
+        write_rows(work / source.name, header, rows)
+
+    header, rows = read_rows(MODEL_DIR / USE_CASE_LIST)
+    write_rows(work / USE_CASE_LIST, header, replicate(rows, scale, header.index('ID')))
+
+    return work
+
+
+# =============================================================================
+# Generators under test
+# =============================================================================
+
+def run_blueprint():
+    from blueprint_panels.assembler import BlueprintAssembler
+    assembler = BlueprintAssembler()
+    for uc_id in SAMPLE_USE_CASES:
+        assembler.save_blueprint(uc_id, "standard")
+
+
+def run_uc_diagram():
+    import generate_uc_diagram
+    for uc_id in SAMPLE_USE_CASES:
+        generate_uc_diagram.generate_use_case_diagram(uc_id)
+
+
+def run_sequence_diagram():
+    import generate_sequence_diagram
+    for uc_id in SAMPLE_USE_CASES:
+        generate_sequence_diagram.generate_sequence_diagram(uc_id)
+
+
+def run_emitter():
+    """Cell emission alone: a box, a label and an arrow per catalog use case."""
+    from blueprint_panels.base import XMLCellBuilder
+    from blueprint_panels.catalog import load_table
+    from generate_uc_diagram import DrawIOBuilder
+    use_cases = load_table(USE_CASE_LIST)
+    for _ in range(EMITTER_PASSES):
+        for builder in (XMLCellBuilder(), DrawIOBuilder("benchmark")):
+            for row in use_cases:
+                label = row.get('Description (DO NOT CHANGE THIS)') or ""
+                builder.add_cell(builder.rectangle(10, 20, 300, 80, "#FFFFFF", "#003087", 2))
+                builder.add_cell(builder.text(10, 20, 300, 80, label,
+                                              font_size=10, font_color="#333333"))
+                builder.add_cell(builder.arrow(10, 60, 310, 60, "#FF6B35", label=row.get('ID') or ""))
+            "".join(builder.cells)
+
+
+GENERATORS: Dict[str, Callable] = {
+    "blueprint": run_blueprint,
+    "uc_diagram": run_uc_diagram,
+    "sequence_diagram": run_sequence_diagram,
+    "emitter": run_emitter,
+}
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+def output_size(folder: Path) -> int:
+    return sum(p.stat().st_size for p in folder.glob("*.drawio"))
+
+
+def clear_outputs(folder: Path):
+    for p in folder.glob("*.drawio"):
+        p.unlink()
+
+
+def reset_catalog(cache_dir: Path, keep_snapshots: bool = False):
+    """
+    Forget the catalog tables loaded in this process.
+
+    Without keep_snapshots the snapshot folder is emptied too, so the next
+    run parses every CSV again (a cold start).
+    """
+    from blueprint_panels import catalog
+    catalog._tables.clear()
+    if not keep_snapshots:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def timed_run(func: Callable, out_dir: Path) -> float:
+    clear_outputs(out_dir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+
+def measure(func: Callable, work: Path, repeat: int, cache_dir: Path) -> Dict:
+    """
+    Time `func` cold and warm (best of `repeat` each), then run it once
+    more, cold, under tracemalloc.
+
+    Cold runs start with no tables loaded and no catalog snapshots, so they
+    include CSV parsing and compare with commits before the catalog cache.
+    Warm runs start with no tables loaded but the snapshots in place, as a
+    second generator process would.
+    """
+    out_dir = work.parent
+    cwd = os.getcwd()
+    os.chdir(work)
+    try:
+        cold_times = []
+        for _ in range(repeat):
+            reset_catalog(cache_dir)
+            cold_times.append(timed_run(func, out_dir))
+
+        warm_times = []
+        for _ in range(repeat):
+            reset_catalog(cache_dir, keep_snapshots=True)
+            warm_times.append(timed_run(func, out_dir))
+
+        clear_outputs(out_dir)
+        reset_catalog(cache_dir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            tracemalloc.start()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        return {
+            "wall_time_s": round(min(cold_times), 4),
+            "warm_time_s": round(min(warm_times), 4),
+            "peak_memory_kb": round(peak / 1024, 1),
+            "output_bytes": output_size(out_dir),
+            "output_files": len(list(out_dir.glob("*.drawio"))),
+        }
+    finally:
+        os.chdir(cwd)
+
+
+def git_commit() -> str:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                cwd=SCRIPT_DIR, capture_output=True, text=True)
+        return result.stdout.strip() or "unknown"
+    except OSError:
+        return "unknown"
+
+
+def run_benchmarks(scales: List[int], names: List[str], repeat: int) -> Dict:
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sample_use_cases": len(SAMPLE_USE_CASES),
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory(prefix="generator-bench-") as tmp, \
+            mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(Path(tmp) / "cache")}):
+        # Catalog snapshots of the fixtures go to the temporary folder too
+        cache_dir = Path(tmp) / "cache"
+        for scale in scales:
+            work = build_fixture(scale, Path(tmp))
+            for name in names:
+                print(f"  {name:<18} x{scale:<5}", end=" ", flush=True)
+                entry = {"generator": name, "scale": scale}
+                entry.update(measure(GENERATORS[name], work, repeat, cache_dir))
+                results["results"].append(entry)
+                print(f"{entry['wall_time_s']:>9.3f} s  "
+                      f"(warm {entry['warm_time_s']:.3f} s)  "
+                      f"{entry['peak_memory_kb']:>10.1f} KB  "
+                      f"{entry['output_bytes']:>10} B")
+            shutil.rmtree(work.parent)
+
+    return results
+
+
+def compare(current: Dict, previous: Dict):
+    """Print time and memory change per generator/scale against a previous run."""
+    old = {(r["generator"], r["scale"]): r for r in previous.get("results", [])}
+    print()
+    print(f"Compared with {previous.get('commit', '?')} ({previous.get('timestamp', '?')}):")
+    for entry in current["results"]:
+        before = old.get((entry["generator"], entry["scale"]))
+        if not before:
+            continue
+        time_change = (entry["wall_time_s"] / before["wall_time_s"] - 1) * 100 if before["wall_time_s"] else 0
+        mem_change = (entry["peak_memory_kb"] / before["peak_memory_kb"] - 1) * 100 if before["peak_memory_kb"] else 0
+        print(f"  {entry['generator']:<18} x{entry['scale']:<5} "
+              f"time {time_change:+7.1f}%  memory {mem_change:+7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the blueprint and diagram generators",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--scales", default="1,10,100",
+                        help="Comma-separated catalog scale factors (default: 1,10,100)")
+    parser.add_argument("--only", choices=sorted(GENERATORS), action="append",
+                        help="Benchmark only this generator (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timing runs per case; the best is reported (default: 3)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Results file (default: benchmark-results/<commit>.json)")
+    parser.add_argument("--compare", type=Path, default=None,
+                        help="Previous results file to compare against")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    names = args.only or list(GENERATORS)
+
+    print("=" * 60)
+    print("Generator Benchmarks")
+    print(f"Scales: {', '.join(f'x{s}' for s in scales)} | Sample: {len(SAMPLE_USE_CASES)} use cases")
+    print("=" * 60)
+
+    results = run_benchmarks(scales, names, max(1, args.repeat))
+
+    output = args.output or RESULTS_DIR / f"{results['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(results, json.load(f))
+
+    print("=" * 60)
+    print(f"Results saved: {output}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -30,6 +30,8 @@ __all__ = [
     "resources_panel",
     "costing_panel",
     "info_boxes_panel",
+    "catalog",
+    "batch",
     "assembler",
 ]
 
@@ -3,48 +3,97 @@ Blueprint Assembler
 Combines modular panels into complete blueprints with configurable layouts.
 """
 
-import csv
-from typing import Dict, List
-from .base import XMLCellBuilder, Position, StandardLayout, build_diagram
+import os
+import tempfile
+from typing import Dict
+from .base import XMLCellBuilder, Position, StandardLayout, DiagramWriter, build_diagram
+from .catalog import load_table
 
+# Temporary files are created private; blueprints get the usual permissions
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
-def load_csv_file(filename: str) -> List[Dict]:
-    """Load CSV file and return list of dictionaries."""
-    with open(filename, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+
+DATA_FILES = [
+    'use-case-summary.csv',
+    'use-case-metrics.csv',
+    'use-case-governance.csv',
+    'use-case-risks.csv',
+    'use-case-success-metrics.csv',
+    'use-case-costing.csv',
+    'use-case-resources.csv',
+    'use-case-systems-volume.csv',
+    'use-case-phases.csv',
+    'solution-abb-catalog.csv',
+    'solution-interfaces-catalog.csv',
+    'ai-architecture-building-blocks.csv',
+]
+
+# get_use_case_data key -> data_cache key, one row per use case
+SINGLE_ROW_TABLES = {
+    'summary': 'use_case_summary',
+    'metrics': 'use_case_metrics',
+    'governance': 'use_case_governance',
+    'risks': 'use_case_risks',
+    'success': 'use_case_success_metrics',
+    'costing': 'use_case_costing',
+    'resources': 'use_case_resources',
+    'systems': 'use_case_systems_volume',
+}
+
+# get_use_case_data key -> data_cache key, many rows per use case
+MULTI_ROW_TABLES = {
+    'phases': 'use_case_phases',
+    'abbs': 'solution_abb_catalog',
+    'interfaces': 'solution_interfaces_catalog',
+}
 
 
 class BlueprintAssembler:
     """Assembles panels into complete blueprints."""
     
-    def __init__(self):
+    def __init__(self, data_cache: Dict = None):
+        """
+        Args:
+            data_cache: Optional pre-loaded catalog Tables (as built by
+                load_all_data) to share instead of reading the files again
+        """
         self.builder = XMLCellBuilder()
         self.all_cells = []
-        self.data_cache = {}
+        self.data_cache = data_cache or {}
+        self.index = {}
+        if self.data_cache:
+            self.build_index()
     
     def load_all_data(self):
-        """Load all data files once."""
+        """Load all data files once and index them by use case ID."""
         if self.data_cache:
             return  # Already loaded
         
-        files = [
-            'use-case-summary.csv',
-            'use-case-metrics.csv',
-            'use-case-governance.csv',
-            'use-case-risks.csv',
-            'use-case-success-metrics.csv',
-            'use-case-costing.csv',
-            'use-case-resources.csv',
-            'use-case-systems-volume.csv',
-            'use-case-phases.csv',
-            'solution-abb-catalog.csv',
-            'solution-interfaces-catalog.csv',
-            'ai-architecture-building-blocks.csv',
-        ]
-        
-        for filename in files:
+        for filename in DATA_FILES:
             key = filename.replace('.csv', '').replace('-', '_')
-            self.data_cache[key] = load_csv_file(filename)
+            self.data_cache[key] = load_table(filename)
+        
+        self.build_index()
+    
+    def build_index(self):
+        """
+        Build use_case_id lookup tables over the cached CSV data.
+        
+        Uses each Table's use_case_id index, so per-use-case lookups are
+        dictionary hits rather than scans over every table.
+        """
+        self.index = {}
+        for key in SINGLE_ROW_TABLES.values():
+            table = {}
+            for use_case_id, rows in self.data_cache[key].group_by('use_case_id').items():
+                table.setdefault(int(use_case_id), rows[0])
+            self.index[key] = table
+        for key in MULTI_ROW_TABLES.values():
+            table = {}
+            for use_case_id, rows in self.data_cache[key].group_by('use_case_id').items():
+                table.setdefault(int(use_case_id), []).extend(rows)
+            self.index[key] = table
     
     def get_use_case_data(self, use_case_id: int) -> Dict:
         """
@@ -55,37 +104,24 @@ class BlueprintAssembler:
             
         Returns:
             Dictionary with all use case data
+            
+        Raises:
+            KeyError: If the use case has no row in a single-row table
         """
         self.load_all_data()
         
-        # Filter data for this use case
         data = {}
         
         # Single-row data
-        data['summary'] = next(r for r in self.data_cache['use_case_summary']
-                              if int(r['use_case_id']) == use_case_id)
-        data['metrics'] = next(r for r in self.data_cache['use_case_metrics']
-                              if int(r['use_case_id']) == use_case_id)
-        data['governance'] = next(r for r in self.data_cache['use_case_governance']
-                                 if int(r['use_case_id']) == use_case_id)
-        data['risks'] = next(r for r in self.data_cache['use_case_risks']
-                            if int(r['use_case_id']) == use_case_id)
-        data['success'] = next(r for r in self.data_cache['use_case_success_metrics']
-                              if int(r['use_case_id']) == use_case_id)
-        data['costing'] = next(r for r in self.data_cache['use_case_costing']
-                              if int(r['use_case_id']) == use_case_id)
-        data['resources'] = next(r for r in self.data_cache['use_case_resources']
-                                if int(r['use_case_id']) == use_case_id)
-        data['systems'] = next(r for r in self.data_cache['use_case_systems_volume']
-                              if int(r['use_case_id']) == use_case_id)
+        for name, key in SINGLE_ROW_TABLES.items():
+            try:
+                data[name] = self.index[key][use_case_id]
+            except KeyError:
+                raise KeyError(f"UC-{use_case_id:03d} not found in {key}") from None
         
         # Multi-row data
-        data['phases'] = [r for r in self.data_cache['use_case_phases']
-                         if int(r['use_case_id']) == use_case_id]
-        data['abbs'] = [r for r in self.data_cache['solution_abb_catalog']
-                       if int(r['use_case_id']) == use_case_id]
-        data['interfaces'] = [r for r in self.data_cache['solution_interfaces_catalog']
-                             if int(r['use_case_id']) == use_case_id]
+        for name, key in MULTI_ROW_TABLES.items():
+            data[name] = self.index[key].get(use_case_id, [])
         
         # Reference data
         data['all_abbs'] = self.data_cache['ai_architecture_building_blocks']
@@ -103,9 +139,26 @@ class BlueprintAssembler:
         Returns:
             Complete draw.io XML string
         """
+        cells = []
+        self.assemble_cells(use_case_id, layout, cells)
+        uc_name = self.get_use_case_data(use_case_id)['summary']['use_case_name']
+        return build_diagram(cells, use_case_id, uc_name)
+    
+    def assemble_cells(self, use_case_id: int, layout: str, cells):
+        """
+        Create the panels for a layout, adding their cells to `cells`.
+        
+        Args:
+            use_case_id: Use case ID
+            layout: Layout template name
+            cells: List or DiagramWriter (anything with append/extend)
+        """
         # Get data
         uc_data = self.get_use_case_data(use_case_id)
         
+        # Fresh builder so cell IDs do not depend on earlier blueprints
+        self.builder = XMLCellBuilder()
+        
         # Import panel modules
         from . import (header_panel, summary_panel, metrics_panel, governance_panel,
                       change_impact_panel, decision_panel, components_panel,
@@ -114,8 +167,6 @@ class BlueprintAssembler:
                       costing_panel, info_boxes_panel, connections_panel,
                       footer_panel)
         
-        cells = []
-        
         # Apply layout template
         if layout == "standard":
             # Full blueprint with all panels
@@ -332,25 +383,22 @@ class BlueprintAssembler:
             ))
             
             cells.append(footer_panel.create(self.builder, uc_data['summary']))
-        
-        # Build complete XML
-        uc_name = uc_data['summary']['use_case_name']
-        return build_diagram(cells, use_case_id, uc_name)
     
-    def save_blueprint(self, use_case_id: int, layout: str = "standard", output_dir: str = ".."):
+    def save_blueprint(self, use_case_id: int, layout: str = "standard", output_dir: str = "..",
+                       compressed: bool = False):
         """
-        Generate and save a blueprint.
+        Generate and save a blueprint, streaming cells to the file as each
+        panel is created.
         
         Args:
             use_case_id: Use case ID
             layout: Layout template name
             output_dir: Output directory
+            compressed: Write the diagram in draw.io's compressed format
             
         Returns:
             Filename of saved blueprint
         """
-        xml = self.assemble_full_blueprint(use_case_id, layout)
-        
         # Get use case name for filename
         uc_data = self.get_use_case_data(use_case_id)
         uc_name = uc_data['summary']['use_case_name']
@@ -358,8 +406,20 @@ class BlueprintAssembler:
         
         filename = f"{output_dir}/UC-{use_case_id:03d}-{uc_name_clean}-Blueprint-{layout.title()}-v1.0.0.drawio"
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(xml)
+        # Stream into a temporary file alongside the target, so a panel that
+        # fails leaves the previous blueprint in place
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=output_dir,
+                                         suffix='.tmp', delete=False) as f:
+            temp_path = f.name
+            try:
+                with DiagramWriter(f, use_case_id, uc_name, compressed) as writer:
+                    self.assemble_cells(use_case_id, layout, writer)
+            except BaseException:
+                f.close()
+                os.unlink(temp_path)
+                raise
+        os.chmod(temp_path, 0o666 & ~_UMASK)
+        os.replace(temp_path, filename)
         
         return filename
 
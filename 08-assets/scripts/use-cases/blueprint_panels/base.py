@@ -3,7 +3,13 @@ Base module for blueprint panel system.
 Provides shared utilities, colors, and XML building functions.
 """
 
-from typing import Dict, List, Tuple
+import base64
+import re
+import urllib.parse
+import zlib
+from functools import lru_cache
+from itertools import count
+from typing import Callable, Dict, Iterable, List, TextIO, Tuple
 
 
 # BNZ Visual Design Standards v2.0
@@ -40,37 +46,228 @@ class Position:
         return f"Position({self.x}, {self.y}, {self.width}x{self.height})"
 
 
-def escape_xml(text: str) -> str:
+# XML escaping
+#
+# The same ABB names, layer names and technology strings are escaped in
+# every panel of every use case, so short labels are memoised. Replacements
+# are applied in order, '&' first, so entities they insert are not escaped
+# again.
+
+XML_ESCAPES = (
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&quot;"),
+    ("'", "&apos;"),
+    ("\n", "&#xa;"),
+)
+
+# Labels up to this length go through the memo; longer text (descriptions,
+# benefits) is rarely repeated and is escaped directly
+MEMO_MAX_LENGTH = 200
+MEMO_SIZE = 4096
+
+
+def xml_escaper(replacements: Tuple[Tuple[str, str], ...] = XML_ESCAPES) -> Callable[[str], str]:
     """
-    Escape special characters for XML.
+    Make an escape function for a table of replacements.
+    
+    Text without any character to replace is found in one scan and returned
+    as is; other text has the replacements applied in order.
     
     Args:
-        text: Text to escape
+        replacements: (character, entity) pairs, applied in order
         
     Returns:
-        XML-safe string
+        Escape function returning "" for empty input (its memo statistics
+        are available as .cache_info())
     """
-    if not text:
-        return ""
-    return (str(text)
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&apos;")
-            .replace("\n", "&#xa;"))
+    specials = re.compile("[" + re.escape("".join(char for char, _ in replacements)) + "]")
+    search = specials.search
+    
+    def replace(text: str) -> str:
+        if search(text) is None:
+            return text
+        for char, entity in replacements:
+            text = text.replace(char, entity)
+        return text
+    
+    memo = lru_cache(maxsize=MEMO_SIZE)(replace)
+    
+    def escape(text: str) -> str:
+        """Escape special characters for XML."""
+        if not text:
+            return ""
+        text = str(text)
+        return memo(text) if len(text) <= MEMO_MAX_LENGTH else replace(text)
+    
+    escape.cache_info = memo.cache_info
+    return escape
+
+
+escape_xml = xml_escaper()
+
+
+# Style strings
+#
+# Panels draw thousands of cells with a handful of colour/font combinations,
+# so each distinct parameter tuple is serialised once and then reused.
+
+@lru_cache(maxsize=None)
+def rectangle_style(fill_color: str, stroke_color: str, stroke_width: int = 1,
+                    rounded: bool = True, dashed: bool = False, arc_size: int = 10) -> str:
+    """Style string for XMLCellBuilder.rectangle."""
+    style_parts = [
+        "rounded=1" if rounded else "rounded=0",
+        "whiteSpace=wrap",
+        "html=1",
+        f"fillColor={fill_color}",
+        f"strokeColor={stroke_color}",
+        f"strokeWidth={stroke_width}",
+    ]
+    
+    if rounded:
+        style_parts.append(f"arcSize={arc_size}")
+    if dashed:
+        style_parts.append("dashed=1")
+    
+    return ";".join(style_parts) + ";"
+
+
+@lru_cache(maxsize=None)
+def text_style(font_size: int = 10, font_style: int = 0, font_color: str = "#000000",
+               align: str = "left", v_align: str = "middle",
+               bg_color: str = "none", border_color: str = "none",
+               font_family: str = "Helvetica") -> str:
+    """Style string for XMLCellBuilder.text."""
+    return (f"text;html=1;strokeColor={border_color};fillColor={bg_color};"
+            f"align={align};verticalAlign={v_align};whiteSpace=wrap;rounded=0;"
+            f"fontSize={font_size};fontStyle={font_style};fontColor={font_color};"
+            f"fontFamily={font_family};")
+
+
+@lru_cache(maxsize=None)
+def arrow_style(stroke_color: str, stroke_width: int = 2, dashed: bool = False) -> str:
+    """Style string for XMLCellBuilder.arrow."""
+    style_parts = [
+        "endArrow=classic",
+        "html=1",
+        f"strokeColor={stroke_color}",
+        f"strokeWidth={stroke_width}",
+        "fontFamily=Helvetica",
+    ]
+    
+    if dashed:
+        style_parts.extend(["dashed=1", "dashPattern=3 3"])
+    
+    return ";".join(style_parts) + ";"
 
 
 class XMLCellBuilder:
-    """Builder for creating draw.io XML cells."""
+    """
+    Builder for creating draw.io XML cells.
+    
+    The one cell emitter behind every generator: the blueprint panels,
+    generate_complete_blueprint and generate_uc_diagram. Generators differ
+    only in how deep their cells are indented, how labels are escaped and
+    which styles they use, so those are parameters; the cell templates,
+    the ID allocator and the cell buffer are shared.
+    """
     
-    def __init__(self):
-        self.cell_id_counter = 1000
+    def __init__(self, indent: int = 4, escape: Callable[[str], str] = None,
+                 first_id: int = 1000):
+        """
+        Args:
+            indent: Indentation of a cell's closing tag (its children are
+                indented two spaces more per level)
+            escape: Label escaper (default: escape_xml)
+            first_id: Generated IDs continue from "cell-<first_id>"
+        """
+        self.escape = escape or escape_xml
+        self.cells = []
+        self._ids = count(first_id + 1)
+        level1 = "\n" + " " * (indent + 2)
+        level2 = "\n" + " " * (indent + 4)
+        level3 = "\n" + " " * (indent + 6)
+        close = "\n" + " " * indent + "</mxCell>"
+        # Fixed runs between a cell's fields, with this builder's indentation
+        # baked in, so emitting a cell is a single f-string
+        self._vertex_geometry = f">{level1}<mxGeometry "
+        self._vertex_end = f' as="geometry" />{close}'
+        self._edge_source = f'>{level1}<mxGeometry relative="1" as="geometry">{level2}<mxPoint '
+        self._edge_target = f' as="sourcePoint" />{level2}<mxPoint '
+        self._edge_end = f' as="targetPoint" />{level1}</mxGeometry>{close}'
+        self._label_geometry = f'>{level2}<mxGeometry '
+        self._label_end = (f' y="1" relative="1" as="geometry">{level3}<mxPoint as="offset" />'
+                           f'{level2}</mxGeometry>{level1}</mxCell>')
     
     def next_id(self) -> str:
         """Generate next unique cell ID."""
-        self.cell_id_counter += 1
-        return f"cell-{self.cell_id_counter}"
+        return f"cell-{next(self._ids)}"
+    
+    def add_cell(self, cell_xml: str):
+        """Append a cell to this builder's cell buffer."""
+        self.cells.append(cell_xml)
+    
+    def vertex(self, x: int, y: int, width: int, height: int, label: str, style: str,
+               cell_id: str = None) -> str:
+        """
+        Create a vertex cell with any style.
+        
+        Args:
+            x, y: Position
+            width, height: Dimensions
+            label: Label text (escaped here)
+            style: draw.io style string
+            cell_id: Optional custom cell ID
+            
+        Returns:
+            XML string for the cell
+        """
+        return (f'<mxCell id="{cell_id or f"cell-{next(self._ids)}"}" value="{self.escape(label) if label else ""}" '
+                f'style="{style}" parent="1" vertex="1"{self._vertex_geometry}'
+                f'x="{x}" y="{y}" width="{width}" height="{height}"{self._vertex_end}')
+    
+    def edge(self, source_x: int, source_y: int, target_x: int, target_y: int, style: str,
+             label: str = "", cell_id: str = None, source: str = None, target: str = None) -> str:
+        """
+        Create an edge between two points.
+        
+        Args:
+            source_x, source_y: Start point
+            target_x, target_y: End point
+            style: draw.io style string
+            label: Optional label text (escaped here)
+            cell_id: Optional custom cell ID
+            source, target: Optional IDs of the cells the edge connects
+            
+        Returns:
+            XML string for the edge cell
+        """
+        ends = f' source="{source}" target="{target}"' if source or target else ""
+        return (f'<mxCell id="{cell_id or f"cell-{next(self._ids)}"}" value="{self.escape(label) if label else ""}" '
+                f'style="{style}" parent="1"{ends} edge="1"{self._edge_source}'
+                f'x="{source_x}" y="{source_y}"{self._edge_target}'
+                f'x="{target_x}" y="{target_y}"{self._edge_end}')
+    
+    def edge_label(self, edge_id: str, label: str, style: str, x: str,
+                   cell_id: str = None) -> str:
+        """
+        Create a label cell attached to an edge, indented as the edge's child.
+        
+        Args:
+            edge_id: ID of the edge carrying the label
+            label: Label text (escaped here)
+            style: draw.io style string
+            x: Relative position along the edge, "-1" to "1" (written as given)
+            cell_id: Optional custom cell ID
+            
+        Returns:
+            XML string for the label cell
+        """
+        return (f'<mxCell id="{cell_id or f"cell-{next(self._ids)}"}" value="{self.escape(label) if label else ""}" '
+                f'style="{style}" parent="{edge_id}" vertex="1" connectable="0"'
+                f'{self._label_geometry}x="{x}"{self._label_end}')
     
     def rectangle(self, x: int, y: int, width: int, height: int,
                  fill_color: str, stroke_color: str, stroke_width: int = 1,
@@ -93,27 +290,8 @@ class XMLCellBuilder:
         Returns:
             XML string for the cell
         """
-        cell_id = cell_id or self.next_id()
-        
-        style_parts = [
-            "rounded=1" if rounded else "rounded=0",
-            "whiteSpace=wrap",
-            "html=1",
-            f"fillColor={fill_color}",
-            f"strokeColor={stroke_color}",
-            f"strokeWidth={stroke_width}",
-        ]
-        
-        if rounded:
-            style_parts.append(f"arcSize={arc_size}")
-        if dashed:
-            style_parts.append("dashed=1")
-        
-        style = ";".join(style_parts) + ";"
-        
-        return f'''<mxCell id="{cell_id}" value="" style="{style}" parent="1" vertex="1">
-      <mxGeometry x="{x}" y="{y}" width="{width}" height="{height}" as="geometry" />
-    </mxCell>'''
+        style = rectangle_style(fill_color, stroke_color, stroke_width, rounded, dashed, arc_size)
+        return self.vertex(x, y, width, height, "", style, cell_id)
     
     def text(self, x: int, y: int, width: int, height: int, text: str,
             font_size: int = 10, font_style: int = 0, font_color: str = "#000000",
@@ -140,17 +318,9 @@ class XMLCellBuilder:
         Returns:
             XML string for the cell
         """
-        cell_id = cell_id or self.next_id()
-        text_escaped = escape_xml(text)
-        
-        style = (f"text;html=1;strokeColor={border_color};fillColor={bg_color};"
-                f"align={align};verticalAlign={v_align};whiteSpace=wrap;rounded=0;"
-                f"fontSize={font_size};fontStyle={font_style};fontColor={font_color};"
-                f"fontFamily={font_family};")
-        
-        return f'''<mxCell id="{cell_id}" value="{text_escaped}" style="{style}" parent="1" vertex="1">
-      <mxGeometry x="{x}" y="{y}" width="{width}" height="{height}" as="geometry" />
-    </mxCell>'''
+        style = text_style(font_size, font_style, font_color, align, v_align,
+                           bg_color, border_color, font_family)
+        return self.vertex(x, y, width, height, text, style, cell_id)
     
     def arrow(self, source_x: int, source_y: int, target_x: int, target_y: int,
              stroke_color: str, stroke_width: int = 2, label: str = "",
@@ -170,28 +340,8 @@ class XMLCellBuilder:
         Returns:
             XML string for the arrow cell
         """
-        cell_id = cell_id or self.next_id()
-        label_escaped = escape_xml(label)
-        
-        style_parts = [
-            "endArrow=classic",
-            "html=1",
-            f"strokeColor={stroke_color}",
-            f"strokeWidth={stroke_width}",
-            "fontFamily=Helvetica",
-        ]
-        
-        if dashed:
-            style_parts.extend(["dashed=1", "dashPattern=3 3"])
-        
-        style = ";".join(style_parts) + ";"
-        
-        return f'''<mxCell id="{cell_id}" value="{label_escaped}" style="{style}" parent="1" edge="1">
-      <mxGeometry relative="1" as="geometry">
-        <mxPoint x="{source_x}" y="{source_y}" as="sourcePoint" />
-        <mxPoint x="{target_x}" y="{target_y}" as="targetPoint" />
-      </mxGeometry>
-    </mxCell>'''
+        style = arrow_style(stroke_color, stroke_width, dashed)
+        return self.edge(source_x, source_y, target_x, target_y, style, label, cell_id)
 
 
 class PanelBase:
@@ -232,6 +382,24 @@ class PanelBase:
         raise NotImplementedError("Subclasses must implement create()")
 
 
+DIAGRAM_HEADER = '''<mxfile host="AI Blueprint Generator" agent="Python Script" version="24.0.0">
+  <diagram name="UC-{use_case_id:03d} {use_case_name} Blueprint" id="uc{use_case_id:03d}-blueprint">'''
+
+MODEL_HEADER = '''<mxGraphModel dx="1765" dy="1034" grid="1" gridSize="10" guides="1" tooltips="1" connect="1" arrows="1" fold="1" page="1" pageScale="1" pageWidth="1920" pageHeight="1080" math="0" shadow="0">
+      <root>
+        <mxCell id="0" />
+        <mxCell id="1" parent="0" />
+        '''
+
+MODEL_FOOTER = '''
+      </root>
+    </mxGraphModel>'''
+
+DIAGRAM_FOOTER = '''
+  </diagram>
+</mxfile>'''
+
+
 def build_diagram(cells: List[str], use_case_id: int, use_case_name: str) -> str:
     """
     Build complete draw.io XML from cells.
@@ -244,18 +412,89 @@ def build_diagram(cells: List[str], use_case_id: int, use_case_name: str) -> str
     Returns:
         Complete draw.io XML
     """
-    xml = f'''<mxfile host="AI Blueprint Generator" agent="Python Script" version="24.0.0">
-  <diagram name="UC-{use_case_id:03d} {use_case_name} Blueprint" id="uc{use_case_id:03d}-blueprint">
-    <mxGraphModel dx="1765" dy="1034" grid="1" gridSize="10" guides="1" tooltips="1" connect="1" arrows="1" fold="1" page="1" pageScale="1" pageWidth="1920" pageHeight="1080" math="0" shadow="0">
-      <root>
-        <mxCell id="0" />
-        <mxCell id="1" parent="0" />
-        {''.join(cells)}
-      </root>
-    </mxGraphModel>
-  </diagram>
-</mxfile>'''
-    return xml
+    header = DIAGRAM_HEADER.format(use_case_id=use_case_id, use_case_name=use_case_name)
+    return f"{header}\n    {MODEL_HEADER}{''.join(cells)}{MODEL_FOOTER}{DIAGRAM_FOOTER}"
+
+
+class DiagramWriter:
+    """
+    Streams a diagram to a file as cells are produced.
+    
+    Writes the same document as build_diagram without holding all cells in
+    memory. Has append/extend so it can stand in for the cell list panels
+    are collected into. With compressed=True the mxGraphModel is written in
+    draw.io's compressed form (URL-encoded, raw deflate, base64), encoded
+    incrementally. On an exception the footer is not written, so the file
+    is left incomplete: stream into a temporary file and move it into place
+    once the block succeeds (see BlueprintAssembler.save_blueprint).
+    
+    Usage:
+        with open(path, 'w', encoding='utf-8') as f:
+            with DiagramWriter(f, use_case_id, use_case_name) as cells:
+                cells.extend(panel_cells)
+    """
+    
+    # Characters encodeURIComponent leaves unescaped, besides alphanumerics and _.-~
+    URI_SAFE = "!*'()"
+    
+    def __init__(self, out: TextIO, use_case_id: int, use_case_name: str,
+                 compressed: bool = False):
+        self.out = out
+        self.use_case_id = use_case_id
+        self.use_case_name = use_case_name
+        self.compressed = compressed
+        self.cell_count = 0
+        self._deflate = None
+        self._pending = b""
+    
+    def __enter__(self) -> "DiagramWriter":
+        self.out.write(DIAGRAM_HEADER.format(use_case_id=self.use_case_id,
+                                             use_case_name=self.use_case_name))
+        if self.compressed:
+            self._deflate = zlib.compressobj(9, zlib.DEFLATED, -15)
+        else:
+            self.out.write("\n    ")
+        self._write_model(MODEL_HEADER)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            return False
+        self._write_model(MODEL_FOOTER)
+        if self.compressed:
+            self._write_encoded(self._deflate.flush(), final=True)
+            # Compressed payloads are the element's whole text: no whitespace
+            self.out.write(DIAGRAM_FOOTER.lstrip())
+        else:
+            self.out.write(DIAGRAM_FOOTER)
+        return False
+    
+    def append(self, cell_xml: str):
+        """Write one cell."""
+        self._write_model(cell_xml)
+        self.cell_count += 1
+    
+    def extend(self, cells: Iterable[str]):
+        """Write several cells."""
+        for cell_xml in cells:
+            self.append(cell_xml)
+    
+    def _write_model(self, text: str):
+        if not self.compressed:
+            self.out.write(text)
+            return
+        # URL-encoding is per character, so encoding chunk by chunk gives the
+        # same result as encoding the whole model at once
+        encoded = urllib.parse.quote(text, safe=self.URI_SAFE).encode("ascii")
+        self._write_encoded(self._deflate.compress(encoded))
+    
+    def _write_encoded(self, data: bytes, final: bool = False):
+        # base64 works in 3-byte groups; carry the remainder to the next call
+        data = self._pending + data
+        cut = len(data) if final else len(data) - len(data) % 3
+        self._pending = data[cut:]
+        if cut:
+            self.out.write(base64.b64encode(data[:cut]).decode("ascii"))
 
 
 # Standard blueprint dimensions
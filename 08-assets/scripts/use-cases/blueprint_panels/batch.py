@@ -0,0 +1,128 @@
+"""
+Batch Generation
+Command-line helpers for writing the diagrams of many use cases from one process.
+"""
+
+import contextlib
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+
+def parse_jobs(args: list) -> int:
+    """Remove '--jobs N' / '-j N' from args and return N (0 = one per CPU)."""
+    jobs = 1
+    for flag in ("--jobs", "-j"):
+        if flag in args:
+            idx = args.index(flag)
+            try:
+                jobs = int(args[idx + 1])
+            except (IndexError, ValueError):
+                print(f"ERROR: {flag} requires an integer")
+                sys.exit(1)
+            del args[idx:idx + 2]
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+
+def numeric_ids(keys: Iterable) -> List[int]:
+    """
+    Use case IDs from the keys of a catalog column index, sorted.
+
+    Keys are ints for a numeric column, but strings if any value in the
+    column is blank or non-numeric; those values are skipped.
+    """
+    ids = set()
+    for key in keys:
+        try:
+            ids.add(int(key))
+        except (TypeError, ValueError):
+            continue
+    return sorted(ids)
+
+
+def parse_ids(spec: Optional[str], available: Iterable[int]) -> List[int]:
+    """
+    Expand a use case selection.
+
+    Args:
+        spec: None, 'all' or '--all' for every available ID; otherwise
+            IDs and inclusive ranges separated by commas ('7', '1-5,9')
+        available: Use case IDs present in the catalog
+
+    Returns:
+        Selected IDs, sorted
+
+    Raises:
+        ValueError: If the selection is malformed or names an unknown ID
+    """
+    available = sorted(set(available))
+    if spec is None or spec.lower() in ("all", "--all"):
+        return available
+
+    selected = set()
+    for part in spec.split(","):
+        first, sep, last = part.strip().partition("-")
+        try:
+            start = int(first)
+            end = int(last) if sep else start
+        except ValueError:
+            raise ValueError(f"Invalid use case selection: {part.strip()!r}") from None
+        if start > end:
+            raise ValueError(f"Invalid use case range: {part.strip()!r}")
+        selected.update(range(start, end + 1))
+
+    unknown = sorted(selected - set(available))
+    if unknown:
+        raise ValueError(f"Unknown use case ID(s): {', '.join(map(str, unknown))}")
+    return sorted(selected)
+
+
+def _generate(func: Callable, use_case_id: int) -> Optional[str]:
+    """Run one generator call, reporting (not raising) its errors."""
+    try:
+        return func(use_case_id)
+    except Exception as e:
+        print(f"  ✗ UC-{use_case_id:03d} failed: {e}")
+        return None
+
+
+def _capture(func: Callable, use_case_id: int):
+    """Run one generator call in a worker, returning its result and printed output."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = _generate(func, use_case_id)
+    return result, output.getvalue()
+
+
+def run_batch(func: Callable[[int], Optional[str]], use_case_ids: List[int], jobs: int = 1) -> int:
+    """
+    Call func for each use case ID, in worker processes when jobs > 1.
+
+    Output of each call is printed in ID order, so a parallel run reads
+    the same as a serial one.
+
+    Args:
+        func: Module-level generator taking a use case ID and returning the
+            written filename, or None if nothing was written
+        use_case_ids: IDs to generate
+        jobs: Number of worker processes (1 = run in this process)
+
+    Returns:
+        Number of diagrams written
+    """
+    written = 0
+    if jobs > 1 and len(use_case_ids) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_capture, func, uc_id) for uc_id in use_case_ids]
+            for future in futures:
+                result, output = future.result()
+                print(output, end="")
+                if result:
+                    written += 1
+    else:
+        for uc_id in use_case_ids:
+            if _generate(func, uc_id):
+                written += 1
+    return written
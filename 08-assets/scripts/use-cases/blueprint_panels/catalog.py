@@ -0,0 +1,520 @@
+"""
+Catalog Store
+Load the operational CSVs once per process into compact columnar tables.
+
+Each generator used to parse the same CSVs into lists of per-row dicts on
+every call: one dict per row, with the same use case names, layers and
+pattern names repeated hundreds of times. A Table keeps one array per
+column instead. Columns whose values are all integers are stored as
+array('q'); the rest are interned strings, dictionary-encoded into an
+array of small codes. Rows are handed out as Row views that read like the
+csv.DictReader dicts the panels expect, and lookups by any column go
+through an index built on first use.
+
+Parsed tables are also kept in a per-folder Snapshot file, so a new
+process (one generator run per diagram) maps the snapshot instead of
+parsing the CSVs again.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from itertools import accumulate, chain
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Column names tried, in order, by the indexed accessors
+USE_CASE_COLUMNS = ('use_case_id', 'use case id')
+ABB_COLUMNS = ('abb_id',)
+LAYER_COLUMNS = ('architecture_layer',)
+
+# Range of IntColumn values (stored as signed 64-bit, array typecode 'q')
+INT_MIN = -2 ** 63
+INT_MAX = 2 ** 63 - 1
+
+
+class IntColumn(Sequence):
+    """Column of integers (every value round-trips through int())."""
+    __slots__ = ('data',)
+
+    def __init__(self, values: Iterable[int]):
+        self.data = array('q', values)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: int) -> int:
+        return self.data[index]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.data)
+
+    def text(self, index: int) -> str:
+        return str(self.data[index])
+
+    def key(self, value) -> Optional[int]:
+        """Normalise a lookup value to this column's type (None if it cannot match)."""
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+
+class TextColumn(Sequence):
+    """Column of strings, stored once each and referenced by code."""
+    __slots__ = ('values', 'codes')
+
+    def __init__(self, values: List[Optional[str]], codes: List[int]):
+        """
+        Args:
+            values: Distinct values, in order of first appearance
+            codes: Position in values of each row's value
+        """
+        self.values = [value if value is None else sys.intern(value) for value in values]
+        if len(self.values) <= 0xFF:
+            typecode = 'B'
+        elif len(self.values) <= 0xFFFF:
+            typecode = 'H'
+        else:
+            typecode = 'I'
+        self.codes = array(typecode, codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        return self.values[self.codes[index]]
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return map(self.values.__getitem__, self.codes)
+
+    def text(self, index: int) -> Optional[str]:
+        return self.values[self.codes[index]]
+
+    def key(self, value) -> Optional[str]:
+        return value if value is None else str(value)
+
+
+def make_column(values: List[Optional[str]], codes: List[int]):
+    """
+    Build an IntColumn if every distinct value is a canonical integer that
+    fits in 64 bits, else a TextColumn.
+    """
+    try:
+        numbers = [int(value) for value in values]
+    except (TypeError, ValueError):
+        return TextColumn(values, codes)
+    # '01', ' 1' and '1_000' parse but would not read back unchanged
+    if all(str(number) == value and INT_MIN <= number <= INT_MAX
+           for number, value in zip(numbers, values)):
+        return IntColumn(numbers[code] for code in codes)
+    return TextColumn(values, codes)
+
+
+class Row(Mapping):
+    """Read-only view of one table row, used like a csv.DictReader dict."""
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: 'Table', index: int):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key: str) -> Optional[str]:
+        return self._table.columns[key].text(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.fieldnames)
+
+    def __len__(self) -> int:
+        return len(self._table.fieldnames)
+
+    def __repr__(self) -> str:
+        return f"Row({dict(self)!r})"
+
+
+class Table:
+    """
+    Columnar table loaded from one CSV file.
+
+    Iterating yields Rows in file order. where()/first() and the by_*
+    accessors use a per-column index (value -> row numbers) built on
+    first use.
+    """
+
+    def __init__(self, fieldnames: List[str], columns: Dict[str, object], length: int):
+        self.fieldnames = fieldnames
+        self.columns = columns
+        self.length = length
+        self._indexes: Dict[str, Dict] = {}
+
+    @classmethod
+    def from_rows(cls, header: List[str], rows: Iterable[List[str]]) -> 'Table':
+        """
+        Build a table from csv.reader output, one row at a time, matching
+        csv.DictReader: blank lines are skipped, short rows read as None,
+        extra fields are dropped, and a repeated header name takes the last
+        of its columns.
+        """
+        width = len(header)
+        lookups = [{} for _ in header]
+        codes = [[] for _ in header]
+        padding = [None] * width
+        length = 0
+        for row in rows:
+            if not row:
+                continue
+            if len(row) < width:
+                row = row + padding[len(row):]
+            for value, lookup, column in zip(row, lookups, codes):
+                column.append(lookup.setdefault(value, len(lookup)))
+            length += 1
+
+        positions = {name: i for i, name in enumerate(header)}
+        columns = {name: make_column(list(lookups[i]), codes[i]) for name, i in positions.items()}
+        return cls(list(positions), columns, length)
+
+    @classmethod
+    def from_csv(cls, f: IO[str]) -> 'Table':
+        """Read a table from an open CSV text file."""
+        reader = csv.reader(f)
+        return cls.from_rows(next(reader, []), reader)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[Row]:
+        return (Row(self, i) for i in range(self.length))
+
+    def __getitem__(self, index: int) -> Row:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("row index out of range")
+        return Row(self, index)
+
+    def column(self, name: str):
+        """Typed values of one column (int for IntColumn, str for TextColumn)."""
+        return self.columns[name]
+
+    def index(self, name: str) -> Dict:
+        """Map each value of a column to the row numbers holding it, in file order."""
+        index = self._indexes.get(name)
+        if index is None:
+            index = {}
+            for i, value in enumerate(self.columns[name]):
+                index.setdefault(value, []).append(i)
+            self._indexes[name] = index
+        return index
+
+    def positions(self, name: str, value) -> List[int]:
+        return self.index(name).get(self.columns[name].key(value), [])
+
+    def where(self, name: str, value) -> List[Row]:
+        """Rows whose column equals value (compared as the column's type)."""
+        return [Row(self, i) for i in self.positions(name, value)]
+
+    def first(self, name: str, value) -> Optional[Row]:
+        positions = self.positions(name, value)
+        return Row(self, positions[0]) if positions else None
+
+    def first_any(self, criteria: Dict[str, object]) -> Optional[Row]:
+        """First row, in file order, matching any one of the column/value pairs."""
+        matches = [positions[0] for positions in
+                   (self.positions(name, value) for name, value in criteria.items())
+                   if positions]
+        return Row(self, min(matches)) if matches else None
+
+    def group_by(self, name: str) -> Dict[object, List[Row]]:
+        """Rows grouped by a column's typed value, groups in order of first appearance."""
+        return {value: [Row(self, i) for i in positions]
+                for value, positions in self.index(name).items()}
+
+    def _find_column(self, names: Tuple[str, ...]) -> str:
+        for name in names:
+            if name in self.columns:
+                return name
+        raise KeyError(f"None of {', '.join(names)} in table")
+
+    def by_use_case(self, use_case_id) -> List[Row]:
+        return self.where(self._find_column(USE_CASE_COLUMNS), use_case_id)
+
+    def by_abb(self, abb_id: str) -> List[Row]:
+        return self.where(self._find_column(ABB_COLUMNS), abb_id)
+
+    def by_layer(self, layer: str) -> List[Row]:
+        return self.where(self._find_column(LAYER_COLUMNS), layer)
+
+
+# =============================================================================
+# Snapshot file
+# =============================================================================
+
+SNAPSHOT_MAGIC = b'BNZCATS\x00'
+# Bump when the snapshot layout or Table encoding changes
+SNAPSHOT_VERSION = 1
+HEADER = struct.Struct('<8sQ')  # magic, header JSON length
+
+# Columns whose indexes are stored in the snapshot
+INDEXED_COLUMNS = USE_CASE_COLUMNS + ABB_COLUMNS + LAYER_COLUMNS
+
+
+def _align(offset: int) -> int:
+    return offset + (-offset % 8)
+
+
+class _Blob:
+    """Byte buffer of 8-byte aligned arrays; add() returns [offset, length]."""
+
+    def __init__(self):
+        self.parts = []
+        self.size = 0
+
+    def add(self, data: bytes) -> List[int]:
+        padding = _align(self.size) - self.size
+        if padding:
+            self.parts.append(b'\x00' * padding)
+            self.size += padding
+        self.parts.append(data)
+        self.size += len(data)
+        return [self.size - len(data), len(data)]
+
+    def getvalue(self) -> bytes:
+        return b''.join(self.parts)
+
+
+def _encode_table(table: Table) -> Tuple[dict, bytes]:
+    """Serialise a Table (columns and key-column indexes) to a descriptor and a blob."""
+    blob = _Blob()
+    columns = {}
+    for name in table.fieldnames:
+        column = table.columns[name]
+        if isinstance(column, IntColumn):
+            columns[name] = {'kind': 'int', 'data': blob.add(column.data.tobytes())}
+            continue
+        encoded = [(value or '').encode('utf-8') for value in column.values]
+        ends = array('I', accumulate(len(value) for value in encoded))
+        columns[name] = {
+            'kind': 'text',
+            'typecode': column.codes.typecode,
+            'codes': blob.add(column.codes.tobytes()),
+            'ends': blob.add(ends.tobytes()),
+            'values': blob.add(b''.join(encoded)),
+            'nulls': [i for i, value in enumerate(column.values) if value is None],
+        }
+
+    indexes = {}
+    for name in INDEXED_COLUMNS:
+        if name not in table.columns:
+            continue
+        column = table.columns[name]
+        index = table.index(name)
+        if isinstance(column, IntColumn):
+            keys = array('q', index)
+        else:
+            codes = {value: code for code, value in enumerate(column.values)}
+            keys = array('I', (codes[value] for value in index))
+        starts = array('I', [0])
+        starts.extend(accumulate(len(positions) for positions in index.values()))
+        indexes[name] = {
+            'keys': blob.add(keys.tobytes()),
+            'starts': blob.add(starts.tobytes()),
+            'rows': blob.add(array('I', chain.from_iterable(index.values())).tobytes()),
+        }
+
+    entry = {'fieldnames': table.fieldnames, 'length': table.length,
+             'columns': columns, 'indexes': indexes}
+    return entry, blob.getvalue()
+
+
+def _decode_table(buffer, base: int, entry: dict) -> Table:
+    """Rebuild a Table from its blob at `base` in a mapped snapshot."""
+    def read(typecode: str, span: List[int]) -> array:
+        result = array(typecode)
+        result.frombytes(buffer[base + span[0]:base + span[0] + span[1]])
+        return result
+
+    columns = {}
+    for name, column in entry['columns'].items():
+        if column['kind'] == 'int':
+            columns[name] = IntColumn(read('q', column['data']))
+            continue
+        data = buffer[base + column['values'][0]:base + sum(column['values'])]
+        ends = read('I', column['ends'])
+        values = [data[start:end].decode('utf-8') for start, end in zip(chain([0], ends), ends)]
+        for i in column['nulls']:
+            values[i] = None
+        columns[name] = TextColumn(values, read(column['typecode'], column['codes']))
+
+    table = Table(entry['fieldnames'], columns, entry['length'])
+    for name, index in entry['indexes'].items():
+        column = columns[name]
+        keys = read('q' if isinstance(column, IntColumn) else 'I', index['keys'])
+        if isinstance(column, TextColumn):
+            keys = [column.values[code] for code in keys]
+        starts = read('I', index['starts'])
+        rows = read('I', index['rows'])
+        table._indexes[name] = {key: rows[starts[i]:starts[i + 1]].tolist()
+                                for i, key in enumerate(keys)}
+    return table
+
+
+def _sha256(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class Snapshot:
+    """
+    On-disk snapshot of the Tables parsed from one folder's CSV files.
+
+    One file per folder holds every table loaded from it: a JSON header
+    (per table: source stamp, source sha256 and the layout of its arrays)
+    followed by 8-byte aligned array data, read back through mmap with no
+    CSV parsing. A table is reused while its source's (mtime, size) stamp
+    is unchanged, or its sha256 still matches; otherwise it is re-parsed
+    and the snapshot rewritten. The file is mapped only while a table is
+    copied out, so it can be replaced at any time.
+    """
+
+    def __init__(self, folder: str, path: Optional[Path] = None):
+        self.folder = folder
+        if path is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+            folder_key = hashlib.sha256(folder.encode('utf-8')).hexdigest()[:16]
+            path = Path(cache_home) / "bnz-blueprint-catalog" / f"catalog-{folder_key}.snapshot"
+        self.path = path
+
+    @staticmethod
+    def _read_header(buffer) -> Tuple[dict, int]:
+        """Return (header, offset of the table data) of a mapped snapshot."""
+        magic, length = HEADER.unpack_from(buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("not a catalog snapshot")
+        header = json.loads(buffer[HEADER.size:HEADER.size + length])
+        if header.get('version') != SNAPSHOT_VERSION or header.get('byteorder') != sys.byteorder:
+            raise ValueError("incompatible catalog snapshot")
+        return header, _align(HEADER.size + length)
+
+    def _entries(self, buffer) -> Dict[str, Tuple[dict, bytes]]:
+        """Tables of a mapped snapshot whose source still exists, with their blobs."""
+        header, base = self._read_header(buffer)
+        return {name: (entry, buffer[base + entry['offset']:base + entry['offset'] + entry['size']])
+                for name, entry in header['tables'].items()
+                if os.path.exists(os.path.join(self.folder, name))}
+
+    def _map(self):
+        """Open the snapshot file mapped read-only."""
+        with open(self.path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def load(self, name: str, stamp: Tuple[int, int]) -> Optional[Table]:
+        """
+        Args:
+            name: CSV file name within the folder
+            stamp: Current (mtime_ns, size) of the CSV file
+
+        Returns:
+            The snapshot's Table, or None if it has none for the file's
+            current contents
+        """
+        refreshed = None
+        try:
+            with self._map() as buffer:
+                header, base = self._read_header(buffer)
+                entry = header['tables'].get(name)
+                if entry is None:
+                    return None
+                start = base + entry['offset']
+                if entry['stamp'] != list(stamp):
+                    # Touched but maybe not changed (checkout, copy): compare contents
+                    if _sha256(os.path.join(self.folder, name)) != entry['sha256']:
+                        return None
+                    refreshed = dict(entry, stamp=list(stamp)), buffer[start:start + entry['size']]
+                table = _decode_table(buffer, start, entry)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+        if refreshed is not None:
+            self._write(name, *refreshed)
+        return table
+
+    def save(self, name: str, stamp: Tuple[int, int], sha256: str, table: Table):
+        """Add or replace one table; failures to write the snapshot are ignored."""
+        entry, blob = _encode_table(table)
+        entry.update(stamp=list(stamp), sha256=sha256)
+        self._write(name, entry, blob)
+
+    def _write(self, name: str, entry: dict, blob: bytes):
+        """Rewrite the snapshot with one table added or replaced."""
+        try:
+            with self._map() as buffer:
+                tables = self._entries(buffer)
+        except (OSError, ValueError, KeyError, struct.error):
+            tables = {}
+        tables[name] = (entry, blob)
+
+        data = _Blob()
+        header = {'version': SNAPSHOT_VERSION, 'byteorder': sys.byteorder, 'tables': {}}
+        for table_name, (table_entry, table_blob) in sorted(tables.items()):
+            offset, size = data.add(table_blob)
+            header['tables'][table_name] = dict(table_entry, offset=offset, size=size)
+        encoded = json.dumps(header).encode('utf-8')
+        start = HEADER.pack(SNAPSHOT_MAGIC, len(encoded)) + encoded
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp, 'wb') as f:
+                f.write(start)
+                f.write(b'\x00' * (_align(len(start)) - len(start)))
+                f.write(data.getvalue())
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+# =============================================================================
+# Loading
+# =============================================================================
+
+# Absolute path -> ((mtime_ns, size), Table)
+_tables: Dict[str, Tuple[Tuple[int, int], Table]] = {}
+
+
+def load_table(path, snapshot: bool = True) -> Table:
+    """
+    Load a CSV file as a Table, once per process.
+
+    Args:
+        path: CSV path (relative paths resolve against the current directory)
+        snapshot: Read and update the folder's snapshot file, so later
+            processes skip parsing the CSV
+
+    Returns:
+        The cached Table, re-read if the file changed since it was loaded
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _tables.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    folder, name = os.path.split(key)
+    store = Snapshot(folder) if snapshot else None
+    table = store.load(name, stamp) if store else None
+    if table is None:
+        with open(key, 'rb') as f:
+            data = f.read()
+        # Decoded as open(path, 'r', encoding='utf-8') would, newlines included
+        table = Table.from_csv(io.TextIOWrapper(io.BytesIO(data), encoding='utf-8'))
+        if store:
+            store.save(name, stamp, hashlib.sha256(data).hexdigest(), table)
+    _tables[key] = (stamp, table)
+    return table
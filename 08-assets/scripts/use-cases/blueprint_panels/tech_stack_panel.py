@@ -39,16 +39,15 @@ class TechStackPanel(PanelBase):
             
             # Find technologies
             technologies = []
-            for full_abb in all_abbs:
-                if (full_abb['name'] == abb['abb_name'] or 
-                    full_abb['component name'] == comp_name):
-                    sbbs = full_abb.get('candidate SBBs', '')
-                    if sbbs:
-                        for sbb in sbbs.split(',')[:3]:
-                            sbb = sbb.strip()
-                            if sbb and len(sbb) > 2 and sbb not in technologies:
-                                technologies.append(sbb)
-                    break
+            full_abb = all_abbs.first_any({'name': abb['abb_name'],
+                                           'component name': comp_name})
+            if full_abb:
+                sbbs = full_abb.get('candidate SBBs', '')
+                if sbbs:
+                    for sbb in sbbs.split(',')[:3]:
+                        sbb = sbb.strip()
+                        if sbb and len(sbb) > 2 and sbb not in technologies:
+                            technologies.append(sbb)
             
             tech_str = ', '.join(technologies[:4]) if technologies else 'Various technologies'
             
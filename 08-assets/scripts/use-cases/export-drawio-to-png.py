@@ -5,7 +5,7 @@ BNZ Draw.io to PNG Export Script (Python Version)
 This script exports draw.io diagrams to PNG images using multiple methods:
 1. draw.io Desktop CLI (preferred, best quality)
 2. drawio-export npm package
-3. Puppeteer-based export (fallback)
+3. Native in-process renderer (fallback, common shapes only; PNG needs cairosvg)
 
 Author: BNZ AI Platform Architecture Team
 Version: 1.0.0
@@ -21,7 +21,13 @@ Options:
     --quality PERCENT   PNG quality 1-100 (default: 100)
     --force             Re-export all files even if up to date
     --dry-run           Preview without exporting
-    --method METHOD     Export method: auto, drawio, npm, puppeteer
+    --method METHOD     Export method: auto, drawio, npm, native
+    --format FORMAT     Output format: png, svg (default: png)
+    --jobs N            Number of concurrent exports (default: 1)
+    --batch-size N      Diagrams per draw.io CLI process (default: 1 = no batching)
+    --refresh-capabilities  Ignore cached exporter probe results
+    --manifest PATH     Export manifest file (default: SOURCE/.drawio-export-manifest.json)
+    --adopt-existing    Record existing images newer than their diagram as current
     --verbose           Show detailed output
     --help              Show this help message
 
@@ -35,21 +41,29 @@ Installation of dependencies:
 """
 
 import os
+import re
 import sys
+import html
 import glob
 import json
 import shutil
+import hashlib
+import tempfile
 import argparse
 import subprocess
 import platform
 import base64
 import zlib
+import threading
+import time
 import urllib.parse
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Tuple
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from xml.etree import ElementTree as ET
 
 # Optional imports for fallback methods
 try:
@@ -61,7 +75,7 @@ except ImportError:
 try:
     import cairosvg
     HAS_CAIRO = True
-except ImportError:
+except (ImportError, OSError):  # OSError: cairosvg installed but libcairo missing
     HAS_CAIRO = False
 
 try:
@@ -81,7 +95,13 @@ class ExportConfig:
     force: bool = False
     dry_run: bool = False
     method: str = "auto"
+    output_format: str = "png"
     verbose: bool = False
+    jobs: int = 1
+    batch_size: int = 1
+    manifest_path: Optional[Path] = None
+    adopt_existing: bool = False
+    refresh_capabilities: bool = False
     include_folders: List[str] = field(default_factory=lambda: ["use-cases", "patterns", "data"])
 
 
@@ -93,6 +113,12 @@ class ExportStats:
     skipped: int = 0
     failed: int = 0
     start_time: datetime = field(default_factory=datetime.now)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def increment(self, counter: str):
+        """Thread-safe increment of one of the counters."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
 
     @property
     def duration(self) -> str:
@@ -100,6 +126,169 @@ class ExportStats:
         return str(elapsed).split('.')[0]
 
 
+class ExportManifest:
+    """
+    Persistent record of what each PNG was exported from.
+
+    Maps each .drawio file (relative to the source path) to the SHA-256 of
+    its contents, the export settings used and the method that produced the
+    image. Unlike file mtimes, this survives git checkouts and fresh clones,
+    so a file is only re-exported when its diagram or the settings actually
+    change. Commit the manifest alongside the exported images so clones and
+    CI runs start from it.
+    """
+
+    VERSION = 2
+
+    # Method recorded for images taken over with --adopt-existing
+    ADOPTED = "adopted"
+
+    def __init__(self, path: Path, root: Path):
+        self.path = path
+        self.root = root
+        self.entries = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load the manifest, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == self.VERSION:
+            self.entries = data.get("files", {})
+
+    def save(self):
+        """Write the manifest if anything changed."""
+        with self._lock:
+            if not self.dirty:
+                return
+            data = {"version": self.VERSION,
+                    "files": dict(sorted(self.entries.items()))}
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+                f.write("\n")
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+
+    def key(self, input_file: Path) -> str:
+        """Manifest key for a diagram: POSIX path relative to the source root."""
+        try:
+            return input_file.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return input_file.resolve().as_posix()
+
+    @staticmethod
+    def fingerprint(input_file: Path, config: ExportConfig) -> dict:
+        """Content hash of the diagram plus the settings that affect the PNG."""
+        digest = hashlib.sha256(input_file.read_bytes()).hexdigest()
+        return {
+            "sha256": digest,
+            "scale": config.scale,
+            "quality": config.quality,
+            "format": config.output_format,
+        }
+
+    def is_current(self, input_file: Path, fingerprint: dict, method: str = "auto") -> bool:
+        """
+        True if the recorded export matches this fingerprint.
+
+        With a specific method (not 'auto') the image must also have been
+        produced by that method.
+        """
+        with self._lock:
+            entry = self.entries.get(self.key(input_file))
+        if entry is None:
+            return False
+        entry = dict(entry)
+        recorded_method = entry.pop("method", None)
+        return entry == fingerprint and method in ("auto", recorded_method)
+
+    def record(self, input_file: Path, fingerprint: dict, method: str):
+        """Remember the fingerprint of a successful export and the method used."""
+        entry = dict(fingerprint, method=method)
+        with self._lock:
+            key = self.key(input_file)
+            if self.entries.get(key) != entry:
+                self.entries[key] = entry
+                self.dirty = True
+
+
+class CapabilityCache:
+    """
+    On-disk cache of exporter probe results.
+
+    Probing `npx @jgraph/draw-export` can take many seconds and touch the
+    network, so the result is stored per machine. Entries are keyed by
+    PATH, the identity (resolved path, size, mtime) of the tool being
+    probed and the installed version of the package it runs, so installing,
+    upgrading or removing either invalidates them. Negative results expire
+    after NEGATIVE_TTL seconds, so a transient failure is retried.
+    """
+
+    NEGATIVE_TTL = 3600
+
+    def __init__(self, path: Optional[Path] = None):
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        self.path = path or Path(cache_home) / "bnz-drawio-export" / "capabilities.json"
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def tool_key(name: str, tool: str, version: str = "") -> Optional[str]:
+        """
+        Cache key for a probe of `tool`, or None if it is not on PATH.
+
+        Args:
+            name: Name of the probe
+            tool: Executable the probe runs
+            version: Version of what the tool runs (e.g. an npm package)
+        """
+        resolved = shutil.which(tool)
+        if not resolved:
+            return None
+        resolved = os.path.realpath(resolved)
+        stat = os.stat(resolved)
+        identity = "|".join([name, os.environ.get("PATH", ""), resolved,
+                             str(stat.st_size), str(stat.st_mtime_ns), version])
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Optional[bool]:
+        """Cached probe result, or None if unknown or expired."""
+        with self._lock:
+            entry = self._read().get(key)
+        if not isinstance(entry, dict):
+            return None
+        available = entry.get("available")
+        if available is False and time.time() - entry.get("checked", 0) > self.NEGATIVE_TTL:
+            return None
+        return available
+
+    def set(self, key: str, value: bool):
+        """Store a probe result; failures to write the cache are ignored."""
+        with self._lock:
+            data = self._read()
+            data[key] = {"available": value, "checked": time.time()}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass
+
+
 class Logger:
     """Simple colored logger for console output."""
 
@@ -111,12 +300,38 @@ class Logger:
         'RESET': '\033[0m'
     }
 
+    _lock = threading.RLock()
+    _local = threading.local()
+
     @staticmethod
     def log(message: str, level: str = "INFO"):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         color = Logger.COLORS.get(level, Logger.COLORS['INFO'])
         reset = Logger.COLORS['RESET']
-        print(f"[{timestamp}] [{level}] {color}{message}{reset}")
+        line = f"[{timestamp}] [{level}] {color}{message}{reset}"
+        buffer = getattr(Logger._local, "buffer", None)
+        if buffer is not None:
+            buffer.append(line)
+        else:
+            Logger.write(line)
+
+    @staticmethod
+    def write(text: str, end: str = "\n"):
+        """Print text atomically with respect to other threads."""
+        with Logger._lock:
+            print(text, end=end, flush=True)
+
+    @staticmethod
+    @contextmanager
+    def grouped():
+        """Buffer this thread's log lines and print them as one block on exit."""
+        Logger._local.buffer = []
+        try:
+            yield
+        finally:
+            lines, Logger._local.buffer = Logger._local.buffer, None
+            if lines:
+                Logger.write("\n".join(lines))
 
     @staticmethod
     def info(message: str):
@@ -135,14 +350,426 @@ class Logger:
         Logger.log(message, "ERROR")
 
 
+# ---------------------------------------------------------------------------
+# Native renderer
+#
+# Renders the subset of mxGraphModel used by our diagrams (rectangles,
+# ellipses, text, straight/waypoint edges) to SVG in-process, and to PNG via
+# cairosvg when it is installed. Module-level so it can run in worker
+# processes.
+# ---------------------------------------------------------------------------
+
+NATIVE_BORDER = 10  # Padding around the content bounds, as draw.io exports
+NATIVE_CHAR_WIDTH = 0.55  # Average glyph width as a fraction of font size
+NATIVE_LINE_HEIGHT = 1.2
+
+_HTML_BREAK = re.compile(r"<br\s*/?>|</div>|</p>|</li>", re.IGNORECASE)
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+
+def decode_diagram(diagram: ET.Element) -> Optional[ET.Element]:
+    """
+    Return the mxGraphModel of a <diagram>, inflating compressed payloads.
+
+    Compressed diagrams store base64(raw deflate(urlencoded XML)) as text.
+    """
+    model = diagram.find("mxGraphModel")
+    if model is not None:
+        return model
+    payload = (diagram.text or "").strip()
+    if not payload:
+        return None
+    xml_text = urllib.parse.unquote(zlib.decompress(base64.b64decode(payload), -15).decode("utf-8"))
+    return ET.fromstring(xml_text)
+
+
+def parse_style(style: str) -> dict:
+    """Parse a draw.io style string; bare tokens such as 'text' map to ''."""
+    result = {}
+    for part in (style or "").split(";"):
+        if not part:
+            continue
+        key, sep, value = part.partition("=")
+        result[key] = value if sep else ""
+    return result
+
+
+def _html_to_lines(value: str, is_html: bool) -> List[str]:
+    """Convert a cell label to plain text lines."""
+    if is_html:
+        value = _HTML_BREAK.sub("\n", value)
+        value = html.unescape(_HTML_TAG.sub("", value))
+    return value.split("\n")
+
+
+def _wrap_line(line: str, width: float, font_size: float) -> List[str]:
+    """Greedy word wrap using an average glyph width."""
+    max_chars = max(1, int(width / (font_size * NATIVE_CHAR_WIDTH)))
+    if len(line) <= max_chars:
+        return [line]
+    wrapped, current = [], ""
+    for word in line.split(" "):
+        candidate = f"{current} {word}" if current else word
+        if len(candidate) <= max_chars or not current:
+            current = candidate
+        else:
+            wrapped.append(current)
+            current = word
+    wrapped.append(current)
+    return wrapped
+
+
+def _attr(value) -> str:
+    return html.escape(str(value), quote=True)
+
+
+def _colour(value: Optional[str], default: str) -> str:
+    if value is None or value == "":
+        return default
+    return "none" if value == "none" else value
+
+
+class NativeRenderer:
+    """Renders one mxGraphModel to an SVG document."""
+
+    def __init__(self, model: ET.Element):
+        self.cells = {}
+        self.order = []
+        for cell in model.iter("mxCell"):
+            cell_id = cell.get("id")
+            self.cells[cell_id] = cell
+            self.order.append(cell_id)
+        self._bounds = {}
+
+    def bounds(self, cell_id: str) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Absolute (x, y, width, height) of a vertex, including parent offsets.
+
+        Returns None for cells that cannot be placed, such as a label on an
+        edge without endpoints.
+        """
+        if cell_id in self._bounds:
+            return self._bounds[cell_id]
+        self._bounds[cell_id] = None  # Guards against parent cycles
+        cell = self.cells.get(cell_id)
+        result = None
+        if cell is not None and cell.get("vertex") == "1":
+            geo = cell.find("mxGeometry")
+            if geo is not None:
+                if geo.get("relative") == "1":
+                    result = self.relative_bounds(cell, geo)
+                else:
+                    x = float(geo.get("x", 0))
+                    y = float(geo.get("y", 0))
+                    parent = self.bounds(cell.get("parent"))
+                    if parent:
+                        x += parent[0]
+                        y += parent[1]
+                    result = (x, y, float(geo.get("width", 0)), float(geo.get("height", 0)))
+        self._bounds[cell_id] = result
+        return result
+
+    def relative_bounds(self, cell: ET.Element, geo: ET.Element) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Bounds of a vertex with relative geometry.
+
+        On an edge (edge labels), x runs from -1 at the source to 1 at the
+        target along the edge's path, y is a distance perpendicular to it,
+        and the cell is centred on that point. On a vertex, x and y are
+        fractions of the parent's size. The offset mxPoint is added in both
+        cases.
+        """
+        rel_x = float(geo.get("x", 0))
+        rel_y = float(geo.get("y", 0))
+        offset = geo.find("mxPoint[@as='offset']")
+        dx = float(offset.get("x", 0)) if offset is not None else 0.0
+        dy = float(offset.get("y", 0)) if offset is not None else 0.0
+        width = float(geo.get("width", 0))
+        height = float(geo.get("height", 0))
+
+        parent = self.cells.get(cell.get("parent"))
+        if parent is not None and parent.get("edge") == "1":
+            anchor = self.point_on_path(self.edge_points(parent), (rel_x + 1) / 2, rel_y)
+            if anchor is None:
+                return None
+            if width <= 0 or height <= 0:
+                width, height = self.label_size(cell)
+            return (anchor[0] + dx - width / 2, anchor[1] + dy - height / 2, width, height)
+
+        box = self.bounds(cell.get("parent"))
+        if box is None:
+            return None
+        return (box[0] + box[2] * rel_x + dx, box[1] + box[3] * rel_y + dy, width, height)
+
+    @staticmethod
+    def point_on_path(points: List[Tuple[float, float]], fraction: float,
+                      distance: float = 0.0) -> Optional[Tuple[float, float]]:
+        """
+        Point a fraction (0 to 1) of the way along a polyline, moved
+        `distance` along the normal of the segment it falls on.
+        """
+        if len(points) < 2:
+            return None
+        segments = [(a, b, ((b[0] - a[0]) ** 2 + (b[1] - a[1]) ** 2) ** 0.5)
+                    for a, b in zip(points, points[1:])]
+        remaining = sum(length for _, _, length in segments) * min(max(fraction, 0.0), 1.0)
+        for (ax, ay), (bx, by), length in segments:
+            if remaining <= length:
+                break
+            remaining -= length
+        t = min(remaining / length, 1.0) if length else 0.0
+        x, y = ax + (bx - ax) * t, ay + (by - ay) * t
+        if length and distance:
+            x -= (by - ay) / length * distance
+            y += (bx - ax) / length * distance
+        return x, y
+
+    @staticmethod
+    def label_size(cell: ET.Element) -> Tuple[float, float]:
+        """Estimated size of a cell's label, for cells sized by their text."""
+        style = parse_style(cell.get("style", ""))
+        font_size = float(style.get("fontSize", 11))
+        lines = _html_to_lines(cell.get("value", ""), style.get("html") == "1")
+        longest = max((len(line) for line in lines), default=0)
+        return (longest * font_size * NATIVE_CHAR_WIDTH + 4,
+                len(lines) * font_size * NATIVE_LINE_HEIGHT + 2)
+
+    def edge_points(self, cell: ET.Element) -> List[Tuple[float, float]]:
+        """Points of an edge: source, waypoints, target."""
+        geo = cell.find("mxGeometry")
+        named = {}
+        waypoints = []
+        if geo is not None:
+            for point in geo.iter("mxPoint"):
+                xy = (float(point.get("x", 0)), float(point.get("y", 0)))
+                role = point.get("as")
+                if role in ("sourcePoint", "targetPoint"):
+                    named[role] = xy
+                else:
+                    waypoints.append(xy)
+
+        def terminal(attr, role, toward):
+            box = self.bounds(cell.get(attr))
+            if box is None:
+                return named.get(role)
+            cx, cy = box[0] + box[2] / 2, box[1] + box[3] / 2
+            if toward is None:
+                return cx, cy
+            return self.clip_to_box(box, (cx, cy), toward)
+
+        source = terminal("source", "sourcePoint", None)
+        target = terminal("target", "targetPoint", None)
+        if source is None or target is None:
+            return []
+        first_hop = waypoints[0] if waypoints else target
+        last_hop = waypoints[-1] if waypoints else source
+        source = terminal("source", "sourcePoint", first_hop)
+        target = terminal("target", "targetPoint", last_hop)
+        return [source] + waypoints + [target]
+
+    @staticmethod
+    def clip_to_box(box, centre, toward) -> Tuple[float, float]:
+        """Point where the line from the box centre toward a point leaves the box."""
+        dx, dy = toward[0] - centre[0], toward[1] - centre[1]
+        if dx == 0 and dy == 0:
+            return centre
+        half_w, half_h = box[2] / 2, box[3] / 2
+        scale = min(half_w / abs(dx) if dx else float("inf"),
+                    half_h / abs(dy) if dy else float("inf"))
+        return centre[0] + dx * scale, centre[1] + dy * scale
+
+    def render_vertex(self, cell: ET.Element, style: dict, out: List[str]):
+        box = self.bounds(cell.get("id"))
+        if box is None:
+            return
+        x, y, w, h = box
+        is_text = "text" in style or "edgeLabel" in style
+        fill = _colour(style.get("fillColor", style.get("backgroundColor")),
+                       "none" if is_text else "#FFFFFF")
+        stroke = _colour(style.get("strokeColor", style.get("borderColor")),
+                         "none" if is_text else "#000000")
+        stroke_width = style.get("strokeWidth", "1")
+        dash = ""
+        if style.get("dashed") == "1":
+            pattern = style.get("dashPattern", "3 3").replace(" ", ",")
+            dash = f' stroke-dasharray="{_attr(pattern)}"'
+
+        if fill != "none" or stroke != "none":
+            paint = (f'fill="{_attr(fill)}" stroke="{_attr(stroke)}" '
+                     f'stroke-width="{_attr(stroke_width)}"{dash}')
+            if "ellipse" in style or style.get("shape") == "ellipse":
+                out.append(f'<ellipse cx="{x + w / 2:g}" cy="{y + h / 2:g}" '
+                           f'rx="{w / 2:g}" ry="{h / 2:g}" {paint}/>')
+            else:
+                radius = 0.0
+                if style.get("rounded") == "1":
+                    radius = min(w, h) * float(style.get("arcSize", 15)) / 100
+                out.append(f'<rect x="{x:g}" y="{y:g}" width="{w:g}" height="{h:g}" '
+                           f'rx="{radius:g}" {paint}/>')
+
+        self.render_label(cell.get("value", ""), style, box, out)
+
+    def render_label(self, value: str, style: dict, box, out: List[str]):
+        if not value:
+            return
+        x, y, w, h = box
+        font_size = float(style.get("fontSize", 11))
+        font_style = int(style.get("fontStyle", 0) or 0)
+        lines = _html_to_lines(value, style.get("html") == "1")
+        if style.get("whiteSpace") == "wrap" and w > 0:
+            lines = [wrapped for line in lines for wrapped in _wrap_line(line, w - 4, font_size)]
+
+        align = style.get("align", "center")
+        v_align = style.get("verticalAlign", "middle")
+        anchor = {"left": "start", "right": "end"}.get(align, "middle")
+        text_x = {"left": x + 2, "right": x + w - 2}.get(align, x + w / 2)
+        line_height = font_size * NATIVE_LINE_HEIGHT
+        block = line_height * len(lines)
+        if v_align == "top":
+            top = y + 2
+        elif v_align == "bottom":
+            top = y + h - block - 2
+        else:
+            top = y + (h - block) / 2
+
+        attrs = [f'font-family="{_attr(style.get("fontFamily", "Helvetica"))}"',
+                 f'font-size="{font_size:g}"',
+                 f'fill="{_attr(_colour(style.get("fontColor"), "#000000"))}"',
+                 f'text-anchor="{anchor}"']
+        if font_style & 1:
+            attrs.append('font-weight="bold"')
+        if font_style & 2:
+            attrs.append('font-style="italic"')
+        if font_style & 4:
+            attrs.append('text-decoration="underline"')
+
+        out.append(f'<text {" ".join(attrs)}>')
+        for i, line in enumerate(lines):
+            baseline = top + line_height * i + font_size
+            out.append(f'<tspan x="{text_x:g}" y="{baseline:g}">{_attr(line)}</tspan>')
+        out.append('</text>')
+
+    def render_edge(self, cell: ET.Element, style: dict, out: List[str]):
+        points = self.edge_points(cell)
+        if len(points) < 2:
+            return
+        stroke = _colour(style.get("strokeColor"), "#000000")
+        dash = ""
+        if style.get("dashed") == "1":
+            pattern = style.get("dashPattern", "3 3").replace(" ", ",")
+            dash = f' stroke-dasharray="{_attr(pattern)}"'
+        marker = "" if style.get("endArrow") == "none" else ' marker-end="url(#arrow)"'
+        path = " ".join(f"{px:g},{py:g}" for px, py in points)
+        out.append(f'<polyline points="{path}" fill="none" stroke="{_attr(stroke)}" '
+                   f'stroke-width="{_attr(style.get("strokeWidth", "1"))}"{dash}{marker} '
+                   f'style="color:{_attr(stroke)}"/>')
+
+        label = cell.get("value", "")
+        if label:
+            mid = len(points) // 2
+            (ax, ay), (bx, by) = points[mid - 1], points[mid]
+            cx, cy = (ax + bx) / 2, (ay + by) / 2
+            label_style = dict(style, verticalAlign="middle", align="center")
+            self.render_label(label, label_style, (cx - 60, cy - 10, 120, 20), out)
+
+    def content_bounds(self) -> Tuple[float, float, float, float]:
+        xs, ys = [], []
+        for cell_id in self.order:
+            cell = self.cells[cell_id]
+            if cell.get("vertex") == "1":
+                box = self.bounds(cell_id)
+                if box:
+                    xs += [box[0], box[0] + box[2]]
+                    ys += [box[1], box[1] + box[3]]
+            elif cell.get("edge") == "1":
+                for px, py in self.edge_points(cell):
+                    xs.append(px)
+                    ys.append(py)
+        if not xs:
+            return 0.0, 0.0, 1.0, 1.0
+        return min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)
+
+    def to_svg(self, scale: float = 1.0, background: str = "#FFFFFF") -> str:
+        body = []
+        for cell_id in self.order:
+            cell = self.cells[cell_id]
+            style = parse_style(cell.get("style", ""))
+            if cell.get("vertex") == "1":
+                self.render_vertex(cell, style, body)
+            elif cell.get("edge") == "1":
+                self.render_edge(cell, style, body)
+
+        x, y, w, h = self.content_bounds()
+        x, y = x - NATIVE_BORDER, y - NATIVE_BORDER
+        w, h = w + 2 * NATIVE_BORDER, h + 2 * NATIVE_BORDER
+        header = (f'<svg xmlns="http://www.w3.org/2000/svg" version="1.1" '
+                  f'width="{w * scale:g}" height="{h * scale:g}" viewBox="{x:g} {y:g} {w:g} {h:g}">'
+                  '<defs><marker id="arrow" viewBox="0 0 10 10" refX="9" refY="5" '
+                  'markerWidth="6" markerHeight="6" orient="auto-start-reverse">'
+                  '<path d="M0,0 L10,5 L0,10 z" fill="context-stroke"/></marker></defs>'
+                  f'<rect x="{x:g}" y="{y:g}" width="{w:g}" height="{h:g}" fill="{background}"/>')
+        return "\n".join([header] + body + ["</svg>"])
+
+
+def render_drawio_file(input_file: str, output_file: str, scale: float, fmt: str) -> bool:
+    """
+    Render the first page of a .drawio file to SVG or PNG in this process.
+
+    Returns:
+        True if the output file was written
+    """
+    root = ET.parse(input_file).getroot()
+    diagram = root if root.tag == "diagram" else root.find("diagram")
+    model = decode_diagram(diagram) if diagram is not None else None
+    if model is None and root.tag == "mxGraphModel":
+        model = root
+    if model is None:
+        return False
+
+    svg = NativeRenderer(model).to_svg(scale)
+    if fmt == "svg":
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(svg)
+    else:
+        if not HAS_CAIRO:
+            return False
+        cairosvg.svg2png(bytestring=svg.encode("utf-8"), write_to=output_file)
+    return True
+
+
 class DrawioExporter:
     """Exports draw.io files to PNG using various methods."""
 
     def __init__(self, config: ExportConfig):
         self.config = config
         self.stats = ExportStats()
-        self.drawio_exe = self._find_drawio_executable()
-        self.npm_exporter = self._check_npm_exporter()
+        manifest_path = config.manifest_path or config.source_path / ".drawio-export-manifest.json"
+        self.manifest = ExportManifest(manifest_path, config.source_path)
+        self.capabilities = CapabilityCache()
+        # Exporters are detected lazily, on first use (see properties below)
+        self._probe_lock = threading.Lock()
+        self._drawio_exe = None
+        self._drawio_checked = False
+        self._npm_exporter = None
+        # Worker processes for the CPU-bound native renderer (run() with --jobs)
+        self.native_pool = None
+
+    @property
+    def drawio_exe(self) -> Optional[str]:
+        """Path to the draw.io desktop executable, located on first access."""
+        with self._probe_lock:
+            if not self._drawio_checked:
+                self._drawio_exe = self._find_drawio_executable()
+                self._drawio_checked = True
+        return self._drawio_exe
+
+    @property
+    def npm_exporter(self) -> bool:
+        """Whether @jgraph/draw-export works, probed on first access."""
+        with self._probe_lock:
+            if self._npm_exporter is None:
+                self._npm_exporter = self._check_npm_exporter()
+        return self._npm_exporter
 
     def _find_drawio_executable(self) -> Optional[str]:
         """Find the draw.io desktop executable."""
@@ -179,18 +806,58 @@ class DrawioExporter:
 
         return None
 
+    @staticmethod
+    def _npm_package_version(package: str) -> str:
+        """
+        Installed version of an npm package, local or global.
+
+        Returns:
+            The version, or "" if the package is not installed (npx then
+            downloads the latest release)
+        """
+        roots = [Path.cwd() / "node_modules"]
+        try:
+            result = subprocess.run(["npm", "root", "-g"], capture_output=True,
+                                    text=True, timeout=30)
+            if result.returncode == 0 and result.stdout.strip():
+                roots.append(Path(result.stdout.strip()))
+        except (subprocess.SubprocessError, OSError):
+            pass
+
+        for root in roots:
+            try:
+                with open(root / package / "package.json", 'r', encoding='utf-8') as f:
+                    return str(json.load(f).get("version", ""))
+            except (OSError, ValueError):
+                continue
+        return ""
+
     def _check_npm_exporter(self) -> bool:
-        """Check if npm drawio-export is available."""
+        """Check if npm drawio-export is available, using the probe cache."""
+        key = CapabilityCache.tool_key("npm-draw-export", "npx",
+                                       self._npm_package_version("@jgraph/draw-export"))
+        if key is None:
+            return False
+
+        if not self.config.refresh_capabilities:
+            cached = self.capabilities.get(key)
+            if cached is not None:
+                return cached
+
         try:
             result = subprocess.run(
                 ["npx", "--yes", "@jgraph/draw-export", "--help"],
                 capture_output=True,
                 timeout=30
             )
-            return result.returncode == 0
+            available = result.returncode == 0
         except (subprocess.SubprocessError, FileNotFoundError):
+            # Timed out or could not start: likely transient, so not cached
             return False
 
+        self.capabilities.set(key, available)
+        return available
+
     def find_drawio_files(self) -> List[Path]:
         """Find all .drawio files in the configured folders."""
         files = []
@@ -212,7 +879,7 @@ class DrawioExporter:
         args = [
             self.drawio_exe,
             "--export",
-            "--format", "png",
+            "--format", self.config.output_format,
             "--output", str(output_file),
             "--quality", str(self.config.quality),
             "--scale", str(self.config.scale),
@@ -231,6 +898,85 @@ class DrawioExporter:
             Logger.error(f"CLI export failed: {e}")
             return False
 
+    def export_batch_with_drawio_cli(self, input_files: List[Path]) -> List[Path]:
+        """
+        Export several files with a single draw.io CLI process.
+
+        The files are copied into a staging folder under unique names and the
+        folder is exported in one call, so Electron starts once per batch
+        rather than once per diagram. Each PNG is then moved next to its
+        source.
+
+        Returns:
+            The input files whose PNG was produced
+        """
+        if not self.drawio_exe or not input_files:
+            return []
+
+        exported = []
+        with tempfile.TemporaryDirectory(prefix="drawio-batch-") as tmp:
+            stage_dir = Path(tmp) / "in"
+            out_dir = Path(tmp) / "out"
+            stage_dir.mkdir()
+            out_dir.mkdir()
+
+            # Prefix with the index so equal stems from different folders
+            # cannot collide in the staging folder
+            staged = {}
+            for i, input_file in enumerate(input_files):
+                staged_name = f"{i:04d}-{input_file.stem}"
+                shutil.copyfile(input_file, stage_dir / f"{staged_name}.drawio")
+                staged[staged_name] = input_file
+
+            args = [
+                self.drawio_exe,
+                "--export",
+                "--format", self.config.output_format,
+                "--output", str(out_dir),
+                "--quality", str(self.config.quality),
+                "--scale", str(self.config.scale),
+                "--all-pages",
+                str(stage_dir)
+            ]
+
+            try:
+                subprocess.run(
+                    args,
+                    capture_output=True,
+                    timeout=120 + 30 * len(input_files)
+                )
+            except subprocess.SubprocessError as e:
+                Logger.error(f"CLI batch export failed: {e}")
+
+            # Collect whatever was produced, even if the process failed part way
+            for staged_name, input_file in staged.items():
+                staged_output = out_dir / f"{staged_name}.{self.config.output_format}"
+                if staged_output.exists():
+                    shutil.move(str(staged_output), str(self.output_path(input_file)))
+                    exported.append(input_file)
+
+        return exported
+
+    @property
+    def native_available(self) -> bool:
+        """The native renderer writes SVG itself; PNG needs cairosvg."""
+        return self.config.output_format == "svg" or HAS_CAIRO
+
+    def export_with_native(self, input_file: Path, output_file: Path) -> bool:
+        """Export using the in-process renderer (in a worker process with --jobs)."""
+        args = (str(input_file), str(output_file), self.config.scale, self.config.output_format)
+        try:
+            if self.native_pool is not None:
+                return self.native_pool.submit(render_drawio_file, *args).result()
+            return render_drawio_file(*args)
+        except (ET.ParseError, ValueError, zlib.error, OSError) as e:
+            Logger.error(f"Native export failed: {e}")
+            return False
+
+    def output_path(self, input_file: Path) -> Path:
+        """Output image path - saved in the same folder as the source."""
+        return input_file.parent / f"{input_file.stem}.{self.config.output_format}"
+
     def export_with_npm(self, input_file: Path, output_file: Path) -> bool:
         """Export using npm @jgraph/draw-export package."""
         if not self.npm_exporter:
@@ -238,7 +984,7 @@ class DrawioExporter:
 
         args = [
             "npx", "--yes", "@jgraph/draw-export",
-            "-f", "png",
+            "-f", self.config.output_format,
             "-o", str(output_file),
             "-s", str(self.config.scale),
             str(input_file)
@@ -255,53 +1001,172 @@ class DrawioExporter:
             Logger.error(f"NPM export failed: {e}")
             return False
 
-    def export_file(self, input_file: Path) -> bool:
-        """Export a single draw.io file to PNG."""
-        # Determine output path - save in same folder as source
-        output_dir = input_file.parent
-        output_file = output_dir / f"{input_file.stem}.png"
+    def skip_if_current(self, input_file: Path) -> bool:
+        """
+        Check whether a file needs exporting, counting and logging skips.
+
+        The manifest decides by content hash and settings. With
+        --adopt-existing, an image with no manifest entry yet is taken as
+        current if it is newer than the diagram, so existing exports can
+        seed the manifest once. Dry runs count as handled.
+
+        Returns:
+            True if the file should not be exported in this run
+        """
+        output_file = self.output_path(input_file)
 
-        # Check if export is needed
         if not self.config.force and output_file.exists():
-            if output_file.stat().st_mtime >= input_file.stat().st_mtime:
+            fingerprint = self.manifest.fingerprint(input_file, self.config)
+            up_to_date = self.manifest.is_current(input_file, fingerprint, self.config.method)
+            if (not up_to_date and self.config.adopt_existing
+                    and self.manifest.key(input_file) not in self.manifest.entries):
+                up_to_date = output_file.stat().st_mtime >= input_file.stat().st_mtime
+                if up_to_date and not self.config.dry_run:
+                    self.manifest.record(input_file, fingerprint, ExportManifest.ADOPTED)
+            if up_to_date:
                 Logger.warning(f"Skipping (up to date): {input_file.name}")
-                self.stats.skipped += 1
+                self.stats.increment("skipped")
                 return True
 
         if self.config.dry_run:
             Logger.info(f"[DRY RUN] Would export: {input_file.name}")
             return True
 
+        return False
+
+    def export_file(self, input_file: Path, check: bool = True) -> bool:
+        """
+        Export a single draw.io file to PNG (or SVG with --format svg).
+
+        Args:
+            input_file: Diagram to export
+            check: Skip the file if it is already up to date
+        """
+        # Determine output path - save in same folder as source
+        output_dir = input_file.parent
+        output_file = self.output_path(input_file)
+
+        if check and self.skip_if_current(input_file):
+            return True
+
+        fingerprint = self.manifest.fingerprint(input_file, self.config)
+
         # Create output directory
         output_dir.mkdir(parents=True, exist_ok=True)
 
         Logger.info(f"Exporting: {input_file.name}")
 
         # Try export methods in order of preference
-        success = False
+        method = None
 
         if self.config.method in ("auto", "drawio") and self.drawio_exe:
-            success = self.export_with_drawio_cli(input_file, output_file)
-            if success:
-                Logger.success(f"Exported (drawio CLI): {input_file.stem}.png")
+            if self.export_with_drawio_cli(input_file, output_file):
+                method = "drawio"
+                Logger.success(f"Exported (drawio CLI): {output_file.name}")
 
-        if not success and self.config.method in ("auto", "npm") and self.npm_exporter:
-            success = self.export_with_npm(input_file, output_file)
-            if success:
-                Logger.success(f"Exported (npm): {input_file.stem}.png")
+        if not method and self.config.method in ("auto", "npm") and self.npm_exporter:
+            if self.export_with_npm(input_file, output_file):
+                method = "npm"
+                Logger.success(f"Exported (npm): {output_file.name}")
 
+        if not method and self.config.method in ("auto", "native") and self.native_available:
+            if self.export_with_native(input_file, output_file):
+                method = "native"
+                Logger.success(f"Exported (native): {output_file.name}")
+
+        success = method is not None
         if success:
-            self.stats.exported += 1
+            self.stats.increment("exported")
+            self.manifest.record(input_file, fingerprint, method)
             # Log file size
             if output_file.exists():
                 size_kb = output_file.stat().st_size / 1024
                 Logger.info(f"  Output size: {size_kb:.1f} KB")
         else:
             Logger.error(f"Failed to export: {input_file.name}")
-            self.stats.failed += 1
+            self.stats.increment("failed")
 
         return success
 
+    def export_batch(self, input_files: List[Path]):
+        """
+        Export already-checked files in one draw.io CLI call.
+
+        Files the batch did not produce are retried one at a time with the
+        normal method fallback chain.
+        """
+        Logger.info(f"Exporting batch of {len(input_files)}: "
+                    f"{', '.join(f.name for f in input_files)}")
+
+        exported = set(self.export_batch_with_drawio_cli(input_files))
+
+        for input_file in input_files:
+            if input_file in exported:
+                self.stats.increment("exported")
+                self.manifest.record(input_file, self.manifest.fingerprint(input_file, self.config),
+                                     "drawio")
+                Logger.success(f"Exported (drawio CLI batch): {self.output_path(input_file).name}")
+            else:
+                Logger.warning(f"Batch did not export {input_file.name}, retrying individually")
+                self.export_file(input_file, check=False)
+
+    def _export_grouped(self, input_file: Path) -> bool:
+        """Export one file, emitting its log lines as a single block."""
+        with Logger.grouped():
+            return self.export_file(input_file)
+
+    def _export_batch_grouped(self, input_files: List[Path]):
+        """Export one batch, emitting its log lines as a single block."""
+        with Logger.grouped():
+            self.export_batch(input_files)
+
+    def use_batches(self) -> bool:
+        """Whether exports go through the batched draw.io CLI path."""
+        return (self.config.batch_size > 1 and self.drawio_exe is not None
+                and self.config.method in ("auto", "drawio"))
+
+    def _report_task_failure(self, task, error: Exception):
+        """Log and count an export task (a file or a batch) that raised."""
+        names = ", ".join(f.name for f in task) if isinstance(task, list) else task.name
+        Logger.error(f"Failed to export: {names} ({error})")
+        self.stats.increment("failed")
+
+    def export_files(self, files: List[Path]):
+        """Export files serially or with a bounded thread pool (--jobs)."""
+        if self.use_batches():
+            # Decide what is stale up front so only those files are batched
+            pending = [f for f in files if not self.skip_if_current(f)]
+            size = self.config.batch_size
+            tasks = [pending[i:i + size] for i in range(0, len(pending), size)]
+            export_task, export_task_grouped = self.export_batch, self._export_batch_grouped
+        else:
+            tasks = files
+            export_task, export_task_grouped = self.export_file, self._export_grouped
+
+        total = len(tasks)
+
+        if self.config.jobs <= 1:
+            for i, task in enumerate(tasks, 1):
+                progress = (i / total) * 100
+                print(f"\r[{progress:5.1f}%] Processing {i}/{total}...", end="", flush=True)
+                try:
+                    export_task(task)
+                except Exception as e:
+                    self._report_task_failure(task, e)
+            return
+
+        # Exports are dominated by waiting on draw.io/npx subprocesses, so
+        # threads are enough to keep several of them running at once
+        with ThreadPoolExecutor(max_workers=self.config.jobs) as pool:
+            futures = {pool.submit(export_task_grouped, task): task for task in tasks}
+            for i, future in enumerate(as_completed(futures), 1):
+                try:
+                    future.result()
+                except Exception as e:
+                    self._report_task_failure(futures[future], e)
+                progress = (i / total) * 100
+                Logger.write(f"\r[{progress:5.1f}%] Processing {i}/{total}...", end="")
+
     def run(self):
         """Run the export process."""
         print()
@@ -310,24 +1175,32 @@ class DrawioExporter:
         print("=" * 50)
         print()
 
-        # Check export capabilities
-        if not self.drawio_exe and not self.npm_exporter:
+        # Check export capabilities; npm is only probed when the draw.io
+        # CLI cannot be used, since probing it is slow
+        if self.config.method in ("auto", "drawio") and self.drawio_exe:
+            Logger.info(f"Using draw.io CLI: {self.drawio_exe}")
+        elif self.config.method in ("auto", "npm") and self.npm_exporter:
+            Logger.info("NPM @jgraph/draw-export is available")
+        elif self.config.method in ("auto", "native") and self.native_available:
+            Logger.info("Using native renderer")
+        else:
             Logger.error("No export method available!")
             print()
             print("Please install one of the following:")
             print("  - draw.io Desktop: https://www.drawio.com/")
             print("  - NPM exporter: npm install -g @jgraph/draw-export")
+            print("  - Native renderer PNG support: pip install cairosvg")
             print()
             return 1
 
-        if self.drawio_exe:
-            Logger.info(f"Using draw.io CLI: {self.drawio_exe}")
-        if self.npm_exporter:
-            Logger.info("NPM @jgraph/draw-export is available")
-
         Logger.info(f"Source path: {self.config.source_path}")
         Logger.info(f"Output subfolder: {self.config.output_subfolder}")
         Logger.info(f"Scale: {self.config.scale}x, Quality: {self.config.quality}%")
+        Logger.info(f"Manifest: {self.manifest.path} ({len(self.manifest.entries)} entries)")
+        if self.config.jobs > 1:
+            Logger.info(f"Parallel jobs: {self.config.jobs}")
+        if self.use_batches():
+            Logger.info(f"Batch size: {self.config.batch_size} diagrams per draw.io CLI call")
 
         if self.config.dry_run:
             Logger.warning("DRY RUN MODE - No files will be modified")
@@ -345,11 +1218,20 @@ class DrawioExporter:
         Logger.info(f"Processing {len(files)} files...")
         print()
 
+        # The native renderer is CPU-bound, so with --jobs it renders in
+        # worker processes while the export threads wait on their results
+        if self.config.method == "native" and self.config.jobs > 1 and not self.config.dry_run:
+            self.native_pool = ProcessPoolExecutor(max_workers=self.config.jobs)
+
         # Export each file
-        for i, file in enumerate(files, 1):
-            progress = (i / len(files)) * 100
-            print(f"\r[{progress:5.1f}%] Processing {i}/{len(files)}...", end="", flush=True)
-            self.export_file(file)
+        try:
+            self.export_files(files)
+        finally:
+            if self.native_pool is not None:
+                self.native_pool.shutdown()
+                self.native_pool = None
+            if not self.config.dry_run:
+                self.manifest.save()
 
         print("\r" + " " * 60 + "\r", end="")  # Clear progress line
 
@@ -417,9 +1299,43 @@ def main():
     )
     parser.add_argument(
         "--method", "-m",
-        choices=["auto", "drawio", "npm"],
+        choices=["auto", "drawio", "npm", "native"],
         default="auto",
-        help="Export method: auto, drawio, npm (default: auto)"
+        help="Export method: auto, drawio, npm, native (default: auto)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["png", "svg"],
+        default="png",
+        help="Output format: png, svg (default: png)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of concurrent exports, 0 = one per CPU (default: 1)"
+    )
+    parser.add_argument(
+        "--batch-size", "-b",
+        type=int,
+        default=1,
+        help="Diagrams per draw.io CLI process (default: 1 = no batching)"
+    )
+    parser.add_argument(
+        "--refresh-capabilities",
+        action="store_true",
+        help="Ignore cached exporter probe results"
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=None,
+        help="Export manifest file (default: SOURCE/.drawio-export-manifest.json)"
+    )
+    parser.add_argument(
+        "--adopt-existing",
+        action="store_true",
+        help="Record existing images newer than their diagram as current (seeds a new manifest)"
     )
     parser.add_argument(
         "--verbose", "-v",
@@ -437,7 +1353,13 @@ def main():
         force=args.force,
         dry_run=args.dry_run,
         method=args.method,
-        verbose=args.verbose
+        output_format=args.format,
+        verbose=args.verbose,
+        jobs=args.jobs if args.jobs > 0 else (os.cpu_count() or 1),
+        batch_size=args.batch_size,
+        refresh_capabilities=args.refresh_capabilities,
+        manifest_path=args.manifest.resolve() if args.manifest else None,
+        adopt_existing=args.adopt_existing
     )
 
     exporter = DrawioExporter(config)
@@ -3,10 +3,12 @@ Generate Draw.io blueprint files for use cases UC-014 through UC-018.
 Based on the UC-001 template structure.
 """
 
-import csv
 import os
 from pathlib import Path
 
+from blueprint_panels.base import escape_xml
+from blueprint_panels.catalog import load_table
+
 # BNZ Colors
 NAVY = "#003087"
 ORANGE = "#FF6B35"
@@ -89,15 +91,10 @@ use_cases = {
 
 
 def load_abb_data(csv_path):
-    """Load ABB data from CSV"""
+    """Load ABB data from CSV, grouped by use case ID"""
     abbs = {}
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            use_case_id = int(row['use case id'])
-            if use_case_id not in abbs:
-                abbs[use_case_id] = []
-            abbs[use_case_id].append(row)
+    for use_case_id, rows in load_table(csv_path).group_by('use case id').items():
+        abbs.setdefault(int(use_case_id), []).extend(rows)
     return abbs
 
 
@@ -119,16 +116,6 @@ def get_template_footer():
 </mxfile>'''
 
 
-def escape_xml(text):
-    """Escape special XML characters"""
-    return (text.replace('&', '&amp;')
-            .replace('<', '&lt;')
-            .replace('>', '&gt;')
-            .replace('"', '&quot;')
-            .replace("'", '&apos;')
-            .replace('\n', '&#xa;'))
-
-
 def generate_blueprint(uc_num, abb_data):
     """Generate complete blueprint XML for a use case"""
     uc = use_cases[uc_num]
@@ -4,11 +4,13 @@ Complete Blueprint Generator for BNZ AI Use Cases
 Generates comprehensive solution blueprints with all panels matching reference format.
 """
 
-import csv
 import sys
 from collections import defaultdict
 from typing import List, Dict
 
+from blueprint_panels.base import XMLCellBuilder, build_diagram, escape_xml
+from blueprint_panels.catalog import load_table
+
 # BNZ Visual Design Standards v2.0
 class BNZColors:
     NAVY = "#003087"
@@ -27,90 +29,24 @@ class BNZColors:
     YELLOW = "#FFFDE7"
     RED = "#CC0000"
 
-def escape_xml(text):
-    """Escape special characters for XML."""
-    if not text:
-        return ""
-    return (str(text)
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&apos;")
-            .replace("\n", "&#xa;"))
-
 def load_csv(filename):
-    """Load CSV file and return list of dicts."""
-    with open(filename, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+    """Load CSV file as a shared catalog Table (rows read like dicts)."""
+    return load_table(filename)
 
-class BlueprintBuilder:
+class BlueprintBuilder(XMLCellBuilder):
     """Builder class for creating draw.io blueprint XML."""
     
     def __init__(self):
-        self.cells = []
-        self.cell_id = 1000
+        super().__init__()
         self.abb_positions = {}
     
-    def next_id(self):
-        """Generate next cell ID."""
-        self.cell_id += 1
-        return f"cell-{self.cell_id}"
-    
-    def add_cell(self, cell_xml):
-        """Add a cell to the blueprint."""
-        self.cells.append(cell_xml)
-    
-    def create_rectangle(self, x, y, width, height, fill_color, stroke_color,
-                        stroke_width=1, rounded=True, dashed=False, arc_size=10):
-        """Create a rectangle cell."""
-        cell_id = self.next_id()
-        style_parts = [
-            "rounded=1" if rounded else "rounded=0",
-            "whiteSpace=wrap",
-            "html=1",
-            f"fillColor={fill_color}",
-            f"strokeColor={stroke_color}",
-            f"strokeWidth={stroke_width}",
-        ]
-        if rounded:
-            style_parts.append(f"arcSize={arc_size}")
-        if dashed:
-            style_parts.append("dashed=1")
-        
-        style = ";".join(style_parts) + ";"
-        
-        return f'''<mxCell id="{cell_id}" value="" style="{style}" parent="1" vertex="1">
-      <mxGeometry x="{x}" y="{y}" width="{width}" height="{height}" as="geometry" />
-    </mxCell>'''
-    
-    def create_text(self, x, y, width, height, text, font_size=10, font_style=0,
-                   font_color="#000000", align="left", v_align="middle",
-                   bg_color="none", border_color="none", font_family="Helvetica"):
-        """Create a text cell."""
-        cell_id = self.next_id()
-        text_escaped = escape_xml(text)
-        
-        style = f"text;html=1;strokeColor={border_color};fillColor={bg_color};align={align};verticalAlign={v_align};whiteSpace=wrap;rounded=0;fontSize={font_size};fontStyle={font_style};fontColor={font_color};fontFamily={font_family};"
-        
-        return f'''<mxCell id="{cell_id}" value="{text_escaped}" style="{style}" parent="1" vertex="1">
-      <mxGeometry x="{x}" y="{y}" width="{width}" height="{height}" as="geometry" />
-    </mxCell>'''
+    # The shared emitter's methods under this builder's historical names
+    create_rectangle = XMLCellBuilder.rectangle
+    create_text = XMLCellBuilder.text
     
     def build_diagram(self, use_case_id, use_case_name):
         """Build complete draw.io XML."""
-        xml = f'''<mxfile host="AI Blueprint Generator" agent="Python Script" version="24.0.0">
-  <diagram name="UC-{use_case_id:03d} {use_case_name} Blueprint" id="uc{use_case_id:03d}-blueprint">
-    <mxGraphModel dx="1765" dy="1034" grid="1" gridSize="10" guides="1" tooltips="1" connect="1" arrows="1" fold="1" page="1" pageScale="1" pageWidth="1920" pageHeight="1080" math="0" shadow="0">
-      <root>
-        <mxCell id="0" />
-        <mxCell id="1" parent="0" />
-        {''.join(self.cells)}
-      </root>
-    </mxGraphModel>
-  </diagram>
-</mxfile>'''
-        return xml
+        return build_diagram(self.cells, use_case_id, use_case_name)
 
 def create_header(builder: BlueprintBuilder, summary: Dict):
     """Create header section."""
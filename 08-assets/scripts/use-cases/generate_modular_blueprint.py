@@ -9,19 +9,42 @@ Usage:
     python generate_modular_blueprint.py 1 business         # Generate UC-001 business layout
     python generate_modular_blueprint.py                    # Generate all use cases, all layouts
     python generate_modular_blueprint.py all standard       # Generate all use cases, standard layout
+    python generate_modular_blueprint.py all --jobs 8       # Generate all use cases with 8 worker processes
+    python generate_modular_blueprint.py all --compress     # Write draw.io compressed diagrams
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from blueprint_panels.assembler import BlueprintAssembler
+from blueprint_panels.batch import parse_jobs
 
 
-def generate_single(use_case_id: int, layout: str = "standard"):
-    """Generate single blueprint."""
+# Per-process assembler used by pool workers (set by _init_worker)
+_worker_assembler = None
+
+
+def _init_worker(data_cache):
+    """Pool initializer: build one assembler per worker from the shared CSV data."""
+    global _worker_assembler
+    _worker_assembler = BlueprintAssembler(data_cache)
+
+
+def _build_in_worker(use_case_id: int, layout: str, compressed: bool):
+    """Assemble and write one blueprint in a worker process."""
+    try:
+        return True, _worker_assembler.save_blueprint(use_case_id, layout, compressed=compressed)
+    except Exception as e:
+        return False, str(e)
+
+
+def generate_single(use_case_id: int, layout: str = "standard", assembler: BlueprintAssembler = None,
+                    compressed: bool = False):
+    """Generate single blueprint, optionally reusing an assembler's loaded data."""
     print(f"Generating UC-{use_case_id:03d} [{layout} layout]...", end=" ")
     
     try:
-        assembler = BlueprintAssembler()
-        filename = assembler.save_blueprint(use_case_id, layout)
+        assembler = assembler or BlueprintAssembler()
+        filename = assembler.save_blueprint(use_case_id, layout, compressed=compressed)
         print(f"OK: {filename}")
         return True
     except Exception as e:
@@ -29,22 +52,51 @@ def generate_single(use_case_id: int, layout: str = "standard"):
         return False
 
 
-def generate_all(layout: str = None):
-    """Generate all use cases."""
+def generate_all(layout: str = None, jobs: int = 1, compressed: bool = False):
+    """
+    Generate all use cases.
+    
+    Args:
+        layout: Single layout to generate (default: all layouts)
+        jobs: Number of worker processes (1 = run in this process)
+        compressed: Write diagrams in draw.io's compressed format
+    """
     layouts = [layout] if layout else ["standard", "technical", "business"]
     
     print("=" * 60)
     print(f"Modular Blueprint Generator")
     print(f"Generating {len(layouts)} layout(s) for 24 use cases")
+    if jobs > 1:
+        print(f"Parallel jobs: {jobs}")
     print("=" * 60)
     
-    total = 0
+    tasks = [(uc_id, layout_name) for uc_id in range(1, 25) for layout_name in layouts]
+    total = len(tasks)
     success = 0
     
-    for uc_id in range(1, 25):
-        for layout_name in layouts:
-            total += 1
-            if generate_single(uc_id, layout_name):
+    # One assembler for the whole run: CSVs are loaded and indexed once
+    assembler = BlueprintAssembler()
+    
+    if jobs > 1:
+        try:
+            assembler.load_all_data()
+        except OSError as e:
+            print(f"ERROR: {e}")
+            return
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(assembler.data_cache,)) as pool:
+            futures = [pool.submit(_build_in_worker, uc_id, layout_name, compressed)
+                       for uc_id, layout_name in tasks]
+            # Report in submission order so output matches a serial run
+            for (uc_id, layout_name), future in zip(tasks, futures):
+                ok, detail = future.result()
+                status = f"OK: {detail}" if ok else f"ERROR: {detail}"
+                print(f"Generating UC-{uc_id:03d} [{layout_name} layout]... {status}")
+                if ok:
+                    success += 1
+    else:
+        for uc_id, layout_name in tasks:
+            if generate_single(uc_id, layout_name, assembler, compressed):
                 success += 1
     
     print("=" * 60)
@@ -54,25 +106,31 @@ def generate_all(layout: str = None):
 
 def main():
     """Main entry point."""
-    if len(sys.argv) == 1:
+    args = sys.argv[1:]
+    jobs = parse_jobs(args)
+    compressed = "--compress" in args
+    if compressed:
+        args.remove("--compress")
+    
+    if not args:
         # No arguments: generate all
-        generate_all()
+        generate_all(jobs=jobs, compressed=compressed)
     
-    elif sys.argv[1].lower() == "all":
+    elif args[0].lower() == "all":
         # "all [layout]": generate all use cases
-        layout = sys.argv[2] if len(sys.argv) > 2 else None
-        generate_all(layout)
+        layout = args[1] if len(args) > 1 else None
+        generate_all(layout, jobs, compressed)
     
-    elif sys.argv[1].isdigit():
+    elif args[0].isdigit():
         # "<id> [layout]": generate single use case
-        uc_id = int(sys.argv[1])
-        layout = sys.argv[2] if len(sys.argv) > 2 else "standard"
+        uc_id = int(args[0])
+        layout = args[1] if len(args) > 1 else "standard"
         
         if uc_id < 1 or uc_id > 24:
             print("ERROR: Use case ID must be between 1 and 24")
             sys.exit(1)
         
-        generate_single(uc_id, layout)
+        generate_single(uc_id, layout, compressed=compressed)
     
     else:
         print(__doc__)
@@ -81,4 +139,3 @@ def main():
 
 if __name__ == '__main__':
     main()
-
@@ -1,9 +1,21 @@
 #!/usr/bin/env python3
-"""Generate a draw.io sequence diagram for a scenario."""
+"""
+Generate a draw.io sequence diagram for a scenario.
+
+Usage:
+    python generate_sequence_diagram.py                 # Generate all use cases
+    python generate_sequence_diagram.py 1               # Generate UC-001
+    python generate_sequence_diagram.py 1-5,9           # Generate a selection of use cases
+    python generate_sequence_diagram.py all --jobs 4    # Generate all use cases with 4 worker processes
+"""
 
-import csv
 import sys
 from collections import OrderedDict
+from typing import List
+
+from blueprint_panels.base import XML_ESCAPES, xml_escaper
+from blueprint_panels.batch import numeric_ids, parse_ids, parse_jobs, run_batch
+from blueprint_panels.catalog import load_table
 
 # BNZ Colors
 class BNZColors:
@@ -15,34 +27,30 @@ class BNZColors:
     DARK_GRAY = "#333333"
     LIGHT_GRAY = "#F5F5F5"
 
-def escape_xml(text):
-    """Escape special characters for XML."""
-    if not text:
-        return ""
-    return (str(text)
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&apos;"))
+# Escape special characters for XML (newlines are kept as they are)
+escape_xml = xml_escaper(tuple(pair for pair in XML_ESCAPES if pair[0] != "\n"))
+
+def use_case_ids() -> List[int]:
+    """IDs of the use cases with a scenario."""
+    return numeric_ids(load_table('use-case-scenarios.csv').index('use_case_id'))
 
 def generate_sequence_diagram(uc_id):
-    """Generate a draw.io sequence diagram for the specified use case."""
+    """
+    Generate a draw.io sequence diagram for the specified use case.
     
-    # Read scenario
-    with open('use-case-scenarios.csv', 'r', encoding='utf-8') as f:
-        scenarios = {r['use_case_id']: r for r in csv.DictReader(f)}
+    Returns:
+        The saved filename, or None if the use case has no scenario or steps
+    """
     
-    scenario = scenarios.get(str(uc_id))
+    # Read scenario (the last row wins if a use case has several)
+    scenarios = load_table('use-case-scenarios.csv').by_use_case(uc_id)
+    scenario = scenarios[-1] if scenarios else None
     if not scenario:
         print(f"Scenario not found for UC-{uc_id}")
         return
     
     # Read sequence steps
-    with open('scenario-sequence-steps.csv', 'r', encoding='utf-8') as f:
-        all_steps = list(csv.DictReader(f))
-    
-    steps = [s for s in all_steps if s['use_case_id'] == str(uc_id)]
+    steps = load_table('scenario-sequence-steps.csv').by_use_case(uc_id)
     
     if not steps:
         print(f"No steps found for UC-{uc_id}")
@@ -225,30 +233,35 @@ def generate_sequence_diagram(uc_id):
         f.write(xml)
     
     print(f"  ✓ Saved: {filename}")
+    return filename
 
 
-if __name__ == '__main__':
+def main():
+    args = sys.argv[1:]
+    jobs = parse_jobs(args)
+    
     print("="*60)
     print("BNZ Sequence Diagram Generator")
     print("="*60)
     print()
     
-    if len(sys.argv) > 1:
-        # Generate for specific use case
-        uc_id = int(sys.argv[1])
-        if uc_id < 1 or uc_id > 24:
-            print("Error: Use case ID must be between 1 and 24")
-            sys.exit(1)
-        generate_sequence_diagram(uc_id)
-    else:
-        # Generate for all use cases
-        print("No use case ID specified - generating ALL sequence diagrams (1-24)")
+    try:
+        selected = parse_ids(args[0] if args else None, use_case_ids())
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    if len(selected) > 1:
+        print(f"Generating {len(selected)} sequence diagrams" + (f" ({jobs} parallel jobs)" if jobs > 1 else ""))
         print()
-        for uc_id in range(1, 25):
-            generate_sequence_diagram(uc_id)
+    
+    written = run_batch(generate_sequence_diagram, selected, jobs)
     
     print()
     print("="*60)
-    print("✅ Sequence diagram generation complete!")
+    print(f"✅ Sequence diagram generation complete! ({written}/{len(selected)} written)")
     print("="*60)
 
+
+if __name__ == '__main__':
+    main()
@@ -5,16 +5,22 @@ Generate draw.io diagram for a use case with three panels:
 2. Tech Stack Panel (Technologies)
 3. Interfaces Catalog Panel (Interface table)
 
-Usage: python generate_uc_diagram.py <use_case_id>
-Example: python generate_uc_diagram.py 1
+Usage:
+    python generate_uc_diagram.py                 # Generate all use cases
+    python generate_uc_diagram.py 1               # Generate UC-001
+    python generate_uc_diagram.py 1-5,9           # Generate a selection of use cases
+    python generate_uc_diagram.py all --jobs 4    # Generate all use cases with 4 worker processes
 """
 
-import csv
-import html
 import sys
 from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+from blueprint_panels.base import XMLCellBuilder, arrow_style, xml_escaper
+from blueprint_panels.batch import numeric_ids, parse_ids, parse_jobs, run_batch
+from blueprint_panels.catalog import Table, load_table
+
 
 class BNZColors:
     """BNZ Visual Design Standards v2.0"""
@@ -35,19 +41,17 @@ class BNZColors:
     APPLICATION = "#F3E5F5"
 
 
-def load_csv(filepath: str) -> List[Dict]:
-    """Load CSV file"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
-
-
-def escape_xml(text: str) -> str:
-    """Escape text for XML"""
-    if not text:
-        return ""
-    text = str(text).replace('\n', '&#xa;')
-    text = html.escape(text, quote=True)
-    return text
+# Escape text for XML. Same output as html.escape(text.replace('\n', '&#xa;')),
+# which these diagrams have always used: "'" becomes &#x27; and the
+# inserted newline entity is itself escaped
+escape_xml = xml_escaper((
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&quot;"),
+    ("'", "&#x27;"),
+    ("\n", "&amp;#xa;"),
+))
 
 
 def get_layer_color(layer: str) -> Tuple[str, str]:
@@ -67,54 +71,44 @@ def get_layer_color(layer: str) -> Tuple[str, str]:
         return BNZColors.GRAY, BNZColors.DARK_GRAY
 
 
-class DrawIOBuilder:
+@lru_cache(maxsize=None)
+def rectangle_style(fill_color: str, stroke_color: str, stroke_width: int = 2,
+                    rounded: bool = True, dashed: bool = False) -> str:
+    """Style string for DrawIOBuilder.create_rectangle"""
+    arc_size = "10" if rounded else "0"
+    dash_pattern = ";dashed=1" if dashed else ""
+    return f"rounded={1 if rounded else 0};whiteSpace=wrap;html=1;fillColor={fill_color};strokeColor={stroke_color};strokeWidth={stroke_width};arcSize={arc_size}{dash_pattern};"
+
+
+@lru_cache(maxsize=None)
+def arrow_label_style(stroke_color: str) -> str:
+    """Style string for the label cell of DrawIOBuilder.create_arrow"""
+    return f"edgeLabel;html=1;align=center;verticalAlign=middle;resizable=0;points=[];fontSize=8;fontStyle=1;backgroundColor=#FFFFFF;borderColor={stroke_color};"
+
+
+class DrawIOBuilder(XMLCellBuilder):
     """Build draw.io XML structure"""
     
     def __init__(self, use_case_name: str):
+        super().__init__(indent=8, escape=escape_xml)
         self.use_case_name = use_case_name
-        self.cell_id = 1000
-        self.cells = []
         self.abb_positions = {}  # Track ABB box positions for connections
-        
-    def next_id(self) -> str:
-        """Generate next cell ID"""
-        self.cell_id += 1
-        return f"cell-{self.cell_id}"
-    
-    def add_cell(self, cell_xml: str):
-        """Add a cell to the diagram"""
-        self.cells.append(cell_xml)
     
     def create_rectangle(self, x: int, y: int, width: int, height: int,
                         fill_color: str, stroke_color: str, stroke_width: int = 2,
                         rounded: bool = True, dashed: bool = False) -> str:
         """Create a rectangle cell"""
-        cell_id = self.next_id()
-        arc_size = "10" if rounded else "0"
-        dash_pattern = ";dashed=1" if dashed else ""
-        
-        return f'''<mxCell id="{cell_id}" value="" style="rounded={1 if rounded else 0};whiteSpace=wrap;html=1;fillColor={fill_color};strokeColor={stroke_color};strokeWidth={stroke_width};arcSize={arc_size}{dash_pattern};" parent="1" vertex="1">
-          <mxGeometry x="{x}" y="{y}" width="{width}" height="{height}" as="geometry" />
-        </mxCell>'''
-    
-    def create_text(self, x: int, y: int, width: int, height: int, text: str,
-                   font_size: int = 10, font_style: int = 0, font_color: str = "#000000",
-                   align: str = "left", v_align: str = "middle",
-                   bg_color: str = "none", border_color: str = "none") -> str:
-        """Create a text cell"""
-        cell_id = self.next_id()
-        text_escaped = escape_xml(text)
-        
-        return f'''<mxCell id="{cell_id}" value="{text_escaped}" style="text;html=1;strokeColor={border_color};fillColor={bg_color};align={align};verticalAlign={v_align};whiteSpace=wrap;rounded=0;fontSize={font_size};fontStyle={font_style};fontColor={font_color};fontFamily=Helvetica;" parent="1" vertex="1">
-          <mxGeometry x="{x}" y="{y}" width="{width}" height="{height}" as="geometry" />
-        </mxCell>'''
+        return self.vertex(x, y, width, height, "",
+                           rectangle_style(fill_color, stroke_color, stroke_width, rounded, dashed))
+    
+    # Same cell as XMLCellBuilder.text (whose font_family defaults to Helvetica)
+    create_text = XMLCellBuilder.text
     
     def create_abb_box(self, x: int, y: int, width: int, height: int,
                        abb_name: str, abb_id: str, fill_color: str, stroke_color: str) -> str:
         """Create an ABB component box"""
         # Use predictable cell ID based on ABB ID for connection referencing
         cell_id = f"abb-{abb_id}"
-        text_escaped = escape_xml(abb_name)
         
         # Store position for connection drawing
         self.abb_positions[abb_id] = {
@@ -128,27 +122,18 @@ class DrawIOBuilder:
             'cell_id': cell_id
         }
         
-        return f'''<mxCell id="{cell_id}" value="{text_escaped}" style="rounded=1;whiteSpace=wrap;html=1;fillColor={fill_color};strokeColor={stroke_color};strokeWidth=2;fontSize=10;fontStyle=1;fontColor={BNZColors.DARK_GRAY};fontFamily=Helvetica;align=center;verticalAlign=middle;" parent="1" vertex="1">
-          <mxGeometry x="{x}" y="{y}" width="{width}" height="{height}" as="geometry" />
-        </mxCell>'''
+        style = f"rounded=1;whiteSpace=wrap;html=1;fillColor={fill_color};strokeColor={stroke_color};strokeWidth=2;fontSize=10;fontStyle=1;fontColor={BNZColors.DARK_GRAY};fontFamily=Helvetica;align=center;verticalAlign=middle;"
+        return self.vertex(x, y, width, height, abb_name, style, cell_id)
     
     def create_arrow(self, source_x: int, source_y: int, target_x: int, target_y: int,
                     stroke_color: str, label: str = "") -> str:
         """Create an arrow connection"""
         cell_id = self.next_id()
-        label_escaped = escape_xml(label)
-        label_cell = f'''<mxCell id="{self.next_id()}" value="{label_escaped}" style="edgeLabel;html=1;align=center;verticalAlign=middle;resizable=0;points=[];fontSize=8;fontStyle=1;backgroundColor=#FFFFFF;borderColor={stroke_color};" parent="{cell_id}" vertex="1" connectable="0">
-            <mxGeometry x="-0.2" y="1" relative="1" as="geometry">
-              <mxPoint as="offset" />
-            </mxGeometry>
-          </mxCell>''' if label else ""
+        label_cell = self.edge_label(cell_id, label, arrow_label_style(stroke_color),
+                                     "-0.2") if label else ""
         
-        return f'''<mxCell id="{cell_id}" value="" style="endArrow=classic;html=1;strokeColor={stroke_color};strokeWidth=2;fontFamily=Helvetica;" parent="1" edge="1">
-          <mxGeometry relative="1" as="geometry">
-            <mxPoint x="{source_x}" y="{source_y}" as="sourcePoint" />
-            <mxPoint x="{target_x}" y="{target_y}" as="targetPoint" />
-          </mxGeometry>
-        </mxCell>{label_cell}'''
+        return self.edge(source_x, source_y, target_x, target_y,
+                         arrow_style(stroke_color), "", cell_id) + label_cell
     
     def build_diagram(self, uc_id: int, uc_name: str) -> str:
         """Build complete diagram XML"""
@@ -235,7 +220,7 @@ def create_components_panel(builder: DrawIOBuilder, abbs: List[Dict], x: int, y:
 
 
 def create_tech_stack_panel(builder: DrawIOBuilder, components: List[Dict],
-                            all_abbs: List[Dict], x: int, y: int, 
+                            all_abbs: Table, x: int, y: int, 
                             width: int, height: int):
     """Create the components panel with name, description, and technologies"""
     # Panel background
@@ -263,16 +248,15 @@ def create_tech_stack_panel(builder: DrawIOBuilder, components: List[Dict],
         
         # Find matching technologies (SBBs)
         technologies = []
-        for full_abb in all_abbs:
-            if (full_abb['name'] == abb['abb_name'] or 
-                full_abb['component name'] == comp_name):
-                sbbs = full_abb.get('candidate SBBs', '')
-                if sbbs:
-                    for sbb in sbbs.split(',')[:3]:  # Limit to 3 SBBs per ABB
-                        sbb = sbb.strip()
-                        if sbb and len(sbb) > 2 and sbb not in technologies:
-                            technologies.append(sbb)
-                break
+        full_abb = all_abbs.first_any({'name': abb['abb_name'],
+                                       'component name': comp_name})
+        if full_abb:
+            sbbs = full_abb.get('candidate SBBs', '')
+            if sbbs:
+                for sbb in sbbs.split(',')[:3]:  # Limit to 3 SBBs per ABB
+                    sbb = sbb.strip()
+                    if sbb and len(sbb) > 2 and sbb not in technologies:
+                        technologies.append(sbb)
         
         tech_str = ', '.join(technologies[:4]) if technologies else 'Various technologies'
         
@@ -377,19 +361,16 @@ def create_abb_connections(builder: DrawIOBuilder, interfaces: List[Dict]):
         cell_id = builder.next_id()
         label_id = builder.next_id()
         
-        arrow_xml = f'''<mxCell id="{cell_id}" value="" style="endArrow=classic;html=1;strokeColor={arrow_color};strokeWidth=1.5;fontFamily=Helvetica;curved=1;exitX={exit_x};exitY={exit_y};exitDx=0;exitDy=0;entryX={entry_x};entryY={entry_y};entryDx=0;entryDy=0;exitPerimeter=0;entryPerimeter=0;" parent="1" source="abb-{source_id}" target="abb-{target_id}" edge="1">
-          <mxGeometry relative="1" as="geometry">
-            <mxPoint x="{source_pos['x']}" y="{source_pos['y']}" as="sourcePoint" />
-            <mxPoint x="{target_pos['x']}" y="{target_pos['y']}" as="targetPoint" />
-          </mxGeometry>
-        </mxCell>'''
+        arrow_xml = builder.edge(
+            source_pos['x'], source_pos['y'], target_pos['x'], target_pos['y'],
+            f"endArrow=classic;html=1;strokeColor={arrow_color};strokeWidth=1.5;fontFamily=Helvetica;curved=1;exitX={exit_x};exitY={exit_y};exitDx=0;exitDy=0;entryX={entry_x};entryY={entry_y};entryDx=0;entryDy=0;exitPerimeter=0;entryPerimeter=0;",
+            cell_id=cell_id, source=f"abb-{source_id}", target=f"abb-{target_id}")
         
         if label:
-            label_xml = f'''<mxCell id="{label_id}" value="{label}" style="edgeLabel;html=1;align=center;verticalAlign=middle;resizable=0;points=[];fontSize=7;fontStyle=1;backgroundColor=#FFFFFF;borderColor={arrow_color};fontFamily=Helvetica;" parent="{cell_id}" vertex="1" connectable="0">
-            <mxGeometry x="-0.1" y="1" relative="1" as="geometry">
-              <mxPoint as="offset" />
-            </mxGeometry>
-          </mxCell>'''
+            label_xml = builder.edge_label(
+                cell_id, label,
+                f"edgeLabel;html=1;align=center;verticalAlign=middle;resizable=0;points=[];fontSize=7;fontStyle=1;backgroundColor=#FFFFFF;borderColor={arrow_color};fontFamily=Helvetica;",
+                "-0.1", cell_id=label_id)
             builder.add_cell(arrow_xml + label_xml)
         else:
             builder.add_cell(arrow_xml)
@@ -474,23 +455,29 @@ def create_interfaces_panel(builder: DrawIOBuilder, interfaces: List[Dict],
         row_y += row_height
 
 
-def generate_use_case_diagram(use_case_id: int):
-    """Generate diagram for a use case"""
+def use_case_ids() -> List[int]:
+    """IDs of the use cases with ABBs in the solution catalog."""
+    return numeric_ids(load_table("solution-abb-catalog.csv").index('use_case_id'))
+
+
+def generate_use_case_diagram(use_case_id: int) -> str:
+    """
+    Generate diagram for a use case
+    
+    Returns:
+        The saved filename, or None if the use case has nothing to draw
+    """
     print(f"Generating diagram for UC-{use_case_id:03d}...")
     
     # Load data
     print("  Loading data files...")
-    use_cases = load_csv("BNZ List of AI use cases Dec 25.csv")
-    abbs_catalog = load_csv("solution-abb-catalog.csv")
-    interfaces_catalog = load_csv("solution-interfaces-catalog.csv")
-    all_abbs = load_csv("ai-architecture-building-blocks.csv")
+    use_cases = load_table("BNZ List of AI use cases Dec 25.csv")
+    abbs_catalog = load_table("solution-abb-catalog.csv")
+    interfaces_catalog = load_table("solution-interfaces-catalog.csv")
+    all_abbs = load_table("ai-architecture-building-blocks.csv")
     
     # Find use case
-    use_case = None
-    for uc in use_cases:
-        if uc['ID'] and int(uc['ID']) == use_case_id:
-            use_case = uc
-            break
+    use_case = use_cases.first('ID', use_case_id)
     
     if not use_case:
         print(f"  ✗ Use case UC-{use_case_id:03d} not found!")
@@ -500,12 +487,11 @@ def generate_use_case_diagram(use_case_id: int):
     print(f"  Use Case: {uc_name}")
     
     # Filter ABBs for this use case
-    uc_abbs = [abb for abb in abbs_catalog if abb['use_case_id'] == str(use_case_id)]
+    uc_abbs = abbs_catalog.by_use_case(use_case_id)
     print(f"  ABBs: {len(uc_abbs)}")
     
     # Filter interfaces for this use case
-    uc_interfaces = [iface for iface in interfaces_catalog 
-                     if iface['use_case_id'] == str(use_case_id)]
+    uc_interfaces = interfaces_catalog.by_use_case(use_case_id)
     print(f"  Interfaces: {len(uc_interfaces)}")
     
     if not uc_abbs:
@@ -561,39 +547,35 @@ def generate_use_case_diagram(use_case_id: int):
     
     print(f"  ✓ Saved: {filename}")
     print()
+    return filename
 
 
 def main():
     """Main function"""
+    args = sys.argv[1:]
+    jobs = parse_jobs(args)
+    
     print("="*60)
     print("BNZ Use Case Diagram Generator")
     print("="*60)
     print()
     
-    if len(sys.argv) < 2:
-        # Generate for all use cases
-        print("No use case ID specified - generating ALL diagrams (1-24)")
+    try:
+        selected = parse_ids(args[0] if args else None, use_case_ids())
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    if len(selected) > 1:
+        print(f"Generating {len(selected)} diagrams" + (f" ({jobs} parallel jobs)" if jobs > 1 else ""))
         print()
-        for use_case_id in range(1, 25):
-            generate_use_case_diagram(use_case_id)
-    else:
-        # Generate for specific use case
-        try:
-            use_case_id = int(sys.argv[1])
-            if use_case_id < 1 or use_case_id > 24:
-                print("Error: Use case ID must be between 1 and 24")
-                sys.exit(1)
-        except ValueError:
-            print("Error: Use case ID must be a number")
-            sys.exit(1)
-        
-        generate_use_case_diagram(use_case_id)
+    
+    written = run_batch(generate_use_case_diagram, selected, jobs)
     
     print("="*60)
-    print("✅ Diagram generation complete!")
+    print(f"✅ Diagram generation complete! ({written}/{len(selected)} written)")
     print("="*60)
 
 
 if __name__ == "__main__":
     main()
-
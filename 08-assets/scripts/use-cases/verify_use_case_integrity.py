@@ -11,22 +11,44 @@ This script verifies the integrity and completeness of all use case information:
 - Optionally fixes common issues
 
 Usage:
-    python verify_use_case_integrity.py [--fix] [--verbose]
+    python verify_use_case_integrity.py [--fix] [--verbose] [--jobs N] [--since REF]
     
 Options:
     --fix       Automatically fix common issues (create missing READMEs, etc.)
     --verbose   Show detailed progress information
+    --jobs N    Check N use cases in parallel (0 = one per CPU)
+    --since REF Always re-verify use cases with files changed since a git ref;
+                the others are reported from the result cache when their
+                fingerprint still matches
+    --no-cache  Re-verify every use case, ignoring cached results
+
+Results are cached per use case directory, keyed by a fingerprint of its
+files (content hashes of documents and diagrams, mtime/size of the rest),
+so an unchanged directory is not re-checked.
 """
 
+import json
 import os
 import re
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 import argparse
 from datetime import datetime
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[2]
+
+sys.path.insert(0, str(SCRIPT_DIR.parent / "adhoc"))
+
+from doc_tools.consistency import ConsistencyEngine
+from doc_tools.link_index import ID_FOLDERS
+
 # Define the base directory
-BASE_DIR = Path(__file__).parent
+BASE_DIR = REPO_ROOT / ID_FOLDERS["UC"]
 
 # Expected use case IDs
 EXPECTED_USE_CASES = [f"UC-{i:03d}" for i in range(1, 25)]  # UC-001 through UC-024
@@ -72,12 +94,44 @@ OPTIONAL_FILES = {
     "generated": "*Generated*.drawio",  # Generated diagrams
 }
 
+# Bump when a check changes so cached results are discarded
+RESULT_CACHE_VERSION = 1
+
+def changed_use_cases(since: str) -> Set[str]:
+    """
+    Use case IDs with files changed since a git ref (committed, staged,
+    unstaged or untracked).
+    """
+    commands = [
+        ["git", "-C", str(REPO_ROOT), "diff", "--name-only", "--no-renames", since, "--"],
+        ["git", "-C", str(REPO_ROOT), "ls-files", "--others", "--exclude-standard"],
+    ]
+    paths = set()
+    for command in commands:
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        paths.update(output.splitlines())
+    prefix = ID_FOLDERS["UC"] + "/"
+    return {path[len(prefix):].split("/", 1)[0] for path in paths if path.startswith(prefix)}
+
 class UseCaseIntegrityChecker:
     """Main integrity checker class."""
     
-    def __init__(self, verbose: bool = False, fix: bool = False):
+    def __init__(self, verbose: bool = False, fix: bool = False, engine: ConsistencyEngine = None,
+                 jobs: int = 1, use_cache: bool = True, changed: Optional[Set[str]] = None):
         self.verbose = verbose
         self.fix = fix
+        self.jobs = jobs
+        self.use_cache = use_cache
+        # Use cases changed since a git ref (--since); these are always
+        # re-checked. None means decide by fingerprint alone
+        self.changed = changed
+        # Folder listings and document facts come from the shared reference graph,
+        # so each use case directory is listed once per run
+        self.engine = engine or ConsistencyEngine(REPO_ROOT).refresh()
+        self.cache_path = self.engine.cache_path.with_name(
+            self.engine.cache_path.name.replace("consistency-", "uc-integrity-"))
+        # Per-thread buffer of log entries while a use case is being checked
+        self._local = threading.local()
         self.issues = []
         self.warnings = []
         self.fixed = []
@@ -91,6 +145,10 @@ class UseCaseIntegrityChecker:
     
     def log(self, message: str, level: str = "info"):
         """Log message with level."""
+        entries = getattr(self._local, "entries", None)
+        if entries is not None:
+            entries.append(["log", message, level])
+            return
         if level == "error":
             self.issues.append(message)
             print(f"  ✗ ERROR: {message}")
@@ -105,18 +163,25 @@ class UseCaseIntegrityChecker:
         elif self.verbose:
             print(f"  ℹ {message}")
     
+    def count(self, stat: str):
+        """Increment a statistic (buffered like log() while checking a use case)."""
+        entries = getattr(self._local, "entries", None)
+        if entries is not None:
+            entries.append(["count", stat, 1])
+        else:
+            self.stats[stat] += 1
+    
     def check_directory_exists(self, uc_id: str) -> bool:
         """Check if use case directory exists."""
-        uc_dir = BASE_DIR / uc_id
-        if not uc_dir.exists():
+        if uc_id not in self.engine.folders:
             self.log(f"{uc_id}: Directory not found", "error")
-            self.stats["missing_directories"] += 1
+            self.count("missing_directories")
             return False
         return True
     
     def find_files_by_pattern(self, uc_dir: Path, pattern: str) -> List[Path]:
         """Find files matching pattern in directory."""
-        return list(uc_dir.glob(pattern))
+        return [uc_dir / name for name in self.engine.folder_files(uc_dir.name, pattern)]
     
     def check_required_files(self, uc_id: str, uc_dir: Path) -> Dict[str, bool]:
         """Check if all required files are present."""
@@ -129,21 +194,19 @@ class UseCaseIntegrityChecker:
         if not md_files:
             self.log(f"{uc_id}: Missing use case markdown document", "error")
             results["markdown"] = False
-            self.stats["missing_files"] += 1
+            self.count("missing_files")
         elif len(md_files) > 1:
             self.log(f"{uc_id}: Multiple markdown documents found: {[f.name for f in md_files]}", "warning")
             results["markdown"] = True
         else:
             results["markdown"] = True
-            if self.verbose:
-                self.log(f"{uc_id}: Found {md_files[0].name}", "info")
+            self.log(f"{uc_id}: Found {md_files[0].name}", "info")
         
         # Check README
-        readme = uc_dir / "README.md"
-        if not readme.exists():
+        if not self.find_files_by_pattern(uc_dir, "README.md"):
             self.log(f"{uc_id}: Missing README.md", "warning")
             results["readme"] = False
-            self.stats["missing_files"] += 1
+            self.count("missing_files")
         else:
             results["readme"] = True
         
@@ -154,8 +217,7 @@ class UseCaseIntegrityChecker:
             results["sequence"] = False
         else:
             results["sequence"] = True
-            if self.verbose:
-                self.log(f"{uc_id}: Found {len(seq_files)} sequence diagram(s)", "info")
+            self.log(f"{uc_id}: Found {len(seq_files)} sequence diagram(s)", "info")
         
         # Check blueprint diagrams (optional but expected)
         blueprint_files = self.find_files_by_pattern(uc_dir, "*Blueprint*.drawio")
@@ -164,58 +226,51 @@ class UseCaseIntegrityChecker:
             results["blueprint"] = False
         else:
             results["blueprint"] = True
-            if self.verbose:
-                self.log(f"{uc_id}: Found {len(blueprint_files)} blueprint diagram(s)", "info")
+            self.log(f"{uc_id}: Found {len(blueprint_files)} blueprint diagram(s)", "info")
         
         return results
     
     def validate_markdown_document(self, uc_id: str, uc_dir: Path) -> bool:
         """Validate the structure of the markdown document."""
-        md_files = [f for f in uc_dir.glob("*.md") if f.name != "README.md"]
+        md_files = [f for f in self.find_files_by_pattern(uc_dir, "*.md") if f.name != "README.md"]
         
         if not md_files:
             return False
         
-        md_file = md_files[0]
+        md_file = md_files[0].relative_to(REPO_ROOT).as_posix()
+        facts = self.engine.facts(md_file)
         
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for required sections
-            required_sections = [
-                "# " + uc_id,  # Title
-                "## Document Control",
-                "## 1. Executive Summary",
-                "## 2. Business Case",
-                "## 6. Prioritization Scoring",
-            ]
-            
-            missing_sections = []
-            for section in required_sections:
-                if section not in content:
-                    missing_sections.append(section)
-            
-            if missing_sections:
-                self.log(f"{uc_id}: Markdown document missing sections: {missing_sections}", "warning")
-                return False
-            
-            # Check if it's just a stub (very short)
-            if len(content) < 1000:
-                self.log(f"{uc_id}: Markdown document appears to be a stub (< 1000 chars)", "warning")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            self.log(f"{uc_id}: Error reading markdown document: {e}", "error")
+        if "error" in facts:
+            self.log(f"{uc_id}: Error reading markdown document: {facts['error']}", "error")
+            return False
+        
+        # Check for required sections
+        required_sections = [
+            "# " + uc_id,  # Title
+            "## Document Control",
+            "## 1. Executive Summary",
+            "## 2. Business Case",
+            "## 6. Prioritization Scoring",
+        ]
+        
+        missing_sections = self.engine.missing_sections(md_file, required_sections)
+        
+        if missing_sections:
+            self.log(f"{uc_id}: Markdown document missing sections: {missing_sections}", "warning")
             return False
+        
+        # Check if it's just a stub (very short)
+        if facts.get("length", 0) < 1000:
+            self.log(f"{uc_id}: Markdown document appears to be a stub (< 1000 chars)", "warning")
+            return False
+        
+        return True
     
     def create_readme_if_missing(self, uc_id: str, uc_dir: Path) -> bool:
         """Create README.md if missing (fix mode)."""
         readme_path = uc_dir / "README.md"
         
-        if readme_path.exists():
+        if self.find_files_by_pattern(uc_dir, "README.md"):
             return False
         
         if not self.fix:
@@ -226,7 +281,7 @@ class UseCaseIntegrityChecker:
         uc_name = metadata["name"]
         
         # Get files in directory
-        all_files = list(uc_dir.glob("*"))
+        all_files = self.find_files_by_pattern(uc_dir, "*")
         md_files = [f for f in all_files if f.suffix == ".md" and f.name != "README.md"]
         drawio_files = [f for f in all_files if f.suffix == ".drawio"]
         blueprint_files = [f for f in drawio_files if "Blueprint" in f.name]
@@ -341,12 +396,52 @@ This directory contains all files related to **{uc_id}: {uc_name}**.
         required_complete = file_results.get("markdown", False) and file_results.get("readme", False)
         if required_complete:
             result["complete"] = True
-            self.stats["complete"] += 1
+            self.count("complete")
         else:
-            self.stats["invalid_structure"] += 1
+            self.count("invalid_structure")
         
         return result
     
+    def load_result_cache(self) -> Dict[str, Dict]:
+        """Cached results per use case: {uc_id: {fingerprint, result, entries}}."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != RESULT_CACHE_VERSION or data.get("root") != str(REPO_ROOT):
+            return {}
+        return data.get("results", {})
+    
+    def save_result_cache(self, cache: Dict[str, Dict]):
+        """Write the result cache; failures to write it are ignored."""
+        data = {"version": RESULT_CACHE_VERSION, "root": str(REPO_ROOT), "results": cache}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix(".tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+    
+    def run_check(self, uc_id: str) -> Tuple[Dict, List]:
+        """Check one use case, buffering its log entries and statistics (thread-safe)."""
+        self._local.entries = []
+        try:
+            result = self.check_use_case(uc_id)
+            return result, self._local.entries
+        finally:
+            self._local.entries = None
+    
+    def replay(self, entries: List):
+        """Print buffered log entries and apply buffered statistics, in order."""
+        for kind, name, value in entries:
+            if kind == "log":
+                self.log(name, value)
+            else:
+                self.stats[name] += value
+    
     def check_all_use_cases(self) -> List[Dict]:
         """Check all use cases."""
         results = []
@@ -355,8 +450,35 @@ This directory contains all files related to **{uc_id}: {uc_name}**.
         print("BNZ AI Use Case Integrity Check")
         print("="*80)
         print(f"Checking {len(EXPECTED_USE_CASES)} use cases...")
+        
+        # Reuse cached results for directories whose fingerprint is unchanged
+        # and, with --since, that have no changes since the ref. A cached
+        # result may come from another tree, so --since only narrows the
+        # reuse. --fix always re-checks, since it acts on what it finds.
+        cache = self.load_result_cache() if self.use_cache else {}
+        fingerprints = {uc_id: self.engine.folder_fingerprint(uc_id) for uc_id in EXPECTED_USE_CASES}
+        outcomes = {}
+        for uc_id in EXPECTED_USE_CASES:
+            cached = cache.get(uc_id)
+            if self.fix or not cached or fingerprints[uc_id] is None:
+                continue
+            if self.changed is not None and uc_id in self.changed:
+                continue
+            if cached["fingerprint"] == fingerprints[uc_id]:
+                outcomes[uc_id] = (cached["result"], cached["entries"])
+        
+        pending = [uc_id for uc_id in EXPECTED_USE_CASES if uc_id not in outcomes]
+        if outcomes:
+            print(f"Re-verifying {len(pending)} changed use cases ({len(outcomes)} unchanged, from cache)")
         print("="*80 + "\n")
         
+        if self.jobs > 1 and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                outcomes.update(zip(pending, pool.map(self.run_check, pending)))
+        else:
+            outcomes.update((uc_id, self.run_check(uc_id)) for uc_id in pending)
+        
+        # Report in use case order, whatever order the checks finished in
         for uc_id in EXPECTED_USE_CASES:
             self.stats["total_use_cases"] += 1
             
@@ -366,7 +488,8 @@ This directory contains all files related to **{uc_id}: {uc_name}**.
             print(f"\n{uc_id}: {uc_name}")
             print("-" * 80)
             
-            result = self.check_use_case(uc_id)
+            result, entries = outcomes[uc_id]
+            self.replay(entries)
             results.append(result)
             
             if result["complete"]:
@@ -376,6 +499,13 @@ This directory contains all files related to **{uc_id}: {uc_name}**.
             else:
                 self.log(f"Incomplete or has issues", "warning")
         
+        if self.use_cache:
+            for uc_id in pending:
+                if fingerprints[uc_id] is not None:
+                    result, entries = outcomes[uc_id]
+                    cache[uc_id] = {"fingerprint": fingerprints[uc_id], "result": result, "entries": entries}
+            self.save_result_cache(cache)
+        
         return results
     
     def generate_report(self, results: List[Dict]):
@@ -478,17 +608,34 @@ Examples:
   python verify_use_case_integrity.py --verbose    # Detailed output
   python verify_use_case_integrity.py --fix        # Fix common issues
   python verify_use_case_integrity.py --fix --verbose  # Fix with details
+  python verify_use_case_integrity.py --jobs 4     # Check use cases in parallel
+  python verify_use_case_integrity.py --since main # Re-verify only use cases changed since main
         """
     )
     parser.add_argument('--fix', action='store_true',
                        help='Automatically fix common issues (create missing READMEs)')
     parser.add_argument('--verbose', action='store_true',
                        help='Show detailed progress information')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Number of use cases to check in parallel (0 = one per CPU, default: 1)')
+    parser.add_argument('--since', metavar='REF',
+                       help='Only re-verify use cases with files changed since this git ref')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Re-verify every use case, ignoring cached results')
     
     args = parser.parse_args()
     
+    changed = None
+    if args.since:
+        try:
+            changed = changed_use_cases(args.since)
+        except (OSError, subprocess.CalledProcessError) as e:
+            parser.error(f"cannot list changes since {args.since!r}: {(getattr(e, 'stderr', None) or str(e)).strip()}")
+    
     # Create checker
-    checker = UseCaseIntegrityChecker(verbose=args.verbose, fix=args.fix)
+    checker = UseCaseIntegrityChecker(verbose=args.verbose, fix=args.fix,
+                                      jobs=args.jobs or os.cpu_count() or 1,
+                                      use_cache=not args.no_cache, changed=changed)
     
     # Run checks
     results = checker.check_all_use_cases()